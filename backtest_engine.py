@@ -0,0 +1,206 @@
+import numpy as np
+import pandas as pd
+from rules_engine import compile_rules, rule_matches
+
+# Columns of the historical base needed to settle every market
+GOAL_COLUMNS = ["HT_Goals_H", "HT_Goals_A", "FT_Goals_H", "FT_Goals_A"]
+RESULT_COLUMNS = ["Date", "League"] + GOAL_COLUMNS
+
+# Each market is the event being backed (or laid) and the column of the historical base that prices it.
+# Markets without a price in the base (odds None) need a fixed "odds" in the strategy.
+MARKETS = {
+    "Back Home": {"side": "back", "odds": "FT_Odd_H", "event": lambda g: g["FT_Goals_H"] > g["FT_Goals_A"]},
+    "Back Draw": {"side": "back", "odds": "FT_Odd_D", "event": lambda g: g["FT_Goals_H"] == g["FT_Goals_A"]},
+    "Back Away": {"side": "back", "odds": "FT_Odd_A", "event": lambda g: g["FT_Goals_H"] < g["FT_Goals_A"]},
+    "Lay Home": {"side": "lay", "odds": "FT_Odd_H", "event": lambda g: g["FT_Goals_H"] > g["FT_Goals_A"]},
+    "Lay Draw": {"side": "lay", "odds": "FT_Odd_D", "event": lambda g: g["FT_Goals_H"] == g["FT_Goals_A"]},
+    "Lay Away": {"side": "lay", "odds": "FT_Odd_A", "event": lambda g: g["FT_Goals_H"] < g["FT_Goals_A"]},
+    "Over 0.5 HT": {"side": "back", "odds": None, "event": lambda g: g["HT_Goals_H"] + g["HT_Goals_A"] > 0},
+    "Under 0.5 HT": {"side": "back", "odds": None, "event": lambda g: g["HT_Goals_H"] + g["HT_Goals_A"] == 0},
+    "Over 1.5 FT": {"side": "back", "odds": None, "event": lambda g: g["FT_Goals_H"] + g["FT_Goals_A"] > 1},
+    "Under 1.5 FT": {"side": "back", "odds": None, "event": lambda g: g["FT_Goals_H"] + g["FT_Goals_A"] <= 1},
+    "Over 2.5 FT": {"side": "back", "odds": "FT_Odd_Over25", "event": lambda g: g["FT_Goals_H"] + g["FT_Goals_A"] > 2},
+    "Under 2.5 FT": {"side": "back", "odds": None, "event": lambda g: g["FT_Goals_H"] + g["FT_Goals_A"] <= 2},
+    "BTTS Yes": {"side": "back", "odds": "Odd_BTTS_Yes", "event": lambda g: (g["FT_Goals_H"] > 0) & (g["FT_Goals_A"] > 0)},
+    "BTTS No": {"side": "back", "odds": None, "event": lambda g: (g["FT_Goals_H"] == 0) | (g["FT_Goals_A"] == 0)},
+    "Lay 0x1": {"side": "lay", "odds": None, "event": lambda g: (g["FT_Goals_H"] == 0) & (g["FT_Goals_A"] == 1)},
+    "Lay 1x1": {"side": "lay", "odds": None, "event": lambda g: (g["FT_Goals_H"] == 1) & (g["FT_Goals_A"] == 1)},
+    "Lay 1x3": {"side": "lay", "odds": None, "event": lambda g: (g["FT_Goals_H"] == 1) & (g["FT_Goals_A"] == 3)},
+    "Lay Any Other Home Win": {
+        "side": "lay", "odds": None, "event": lambda g: (g["FT_Goals_H"] >= 4) & (g["FT_Goals_H"] > g["FT_Goals_A"])
+    },
+    "Lay Any Other Away Win": {
+        "side": "lay", "odds": None, "event": lambda g: (g["FT_Goals_A"] >= 4) & (g["FT_Goals_A"] > g["FT_Goals_H"])
+    },
+}
+
+# "fixed": the stake is the backer's stake (lays risk stake * (odds - 1))
+# "liability": lays risk exactly the stake, whatever the odds (same as "fixed" for backs)
+STAKE_RULES = ("fixed", "liability")
+
+# Each strategy is a dict like:
+#     "Lay 0 x 1": {
+#         "market": "Lay 0x1",
+#         "rules": [{"ranges": [("FT_Odd_H", 1.30, 1.80, "both")]}],
+#         "odds": 12.0,            # optional, a column name or a fixed odd (required if the market has no price)
+#         "stake": "liability",    # optional, one of STAKE_RULES (default "fixed")
+#         "stake_size": 1.0,       # optional
+#         "commission": 0.0,       # optional, fraction charged on winning bets
+#     }
+# `rules` use the rules_engine format (the "league" key is optional) and a game is a bet when it matches any of them.
+# A strategy without rules bets on every game with a valid price.
+
+
+def compile_strategies(strategies):
+    """Validates the strategies and compiles all their filter rules into a single rule table."""
+    specs = []
+    rules = {}
+    for name, strategy in strategies.items():
+        if strategy["market"] not in MARKETS:
+            raise ValueError(f"Unknown market {strategy['market']} in strategy {name}")
+        market = MARKETS[strategy["market"]]
+        odds = strategy.get("odds", market["odds"])
+        if odds is None:
+            raise ValueError(f"Strategy {name} needs fixed odds, the base has no price for {strategy['market']}")
+        stake = strategy.get("stake", "fixed")
+        if stake not in STAKE_RULES:
+            raise ValueError(f"Unknown stake rule {stake} in strategy {name}")
+
+        rule_names = []
+        for i, rule in enumerate(strategy.get("rules") or []):
+            rule_name = f"{name}#{i}"
+            rules[rule_name] = rule
+            rule_names.append(rule_name)
+
+        specs.append({
+            "name": name,
+            "market": strategy["market"],
+            "odds": odds,
+            "lay": market["side"] == "lay",
+            "liability": stake == "liability",
+            "stake_size": float(strategy.get("stake_size", 1.0)),
+            "commission": float(strategy.get("commission", 0.0)),
+            "rules": rule_names,
+        })
+    return {"strategies": specs, "rules": compile_rules(rules)}
+
+
+def required_columns(compiled):
+    """Columns of the historical base read by the compiled strategies."""
+    columns = list(RESULT_COLUMNS)
+    for spec in compiled["strategies"]:
+        if isinstance(spec["odds"], str):
+            columns.append(spec["odds"])
+    for league in compiled["rules"].values():
+        columns.extend(league["columns"])
+        columns.extend(col for col, _ in league["equals"])
+    return list(dict.fromkeys(columns))
+
+
+def _bet_matrix(data, compiled):
+    """Boolean games x strategies matrix: a game is a bet when it matches any rule of the strategy."""
+    specs = compiled["strategies"]
+    bets = np.ones((len(data), len(specs)), dtype=bool, order="F")
+    with_rules = [s for s, spec in enumerate(specs) if spec["rules"]]
+    if not with_rules or data.empty:
+        return bets
+
+    matches = rule_matches(data, compiled["rules"])
+    # Rule columns come grouped by league, put them back grouped by strategy and OR each group
+    order = matches.columns.get_indexer([rule for s in with_rules for rule in specs[s]["rules"]])
+    starts = np.cumsum([0] + [len(specs[s]["rules"]) for s in with_rules[:-1]])
+    bets[:, with_rules] = np.logical_or.reduceat(matches.to_numpy()[:, order], starts, axis=1)
+    return bets
+
+
+def strategy_profits(data, compiled):
+    """
+    Settles every strategy over `data` (games in chronological order) at once.
+    Returns (bets, profits): games x strategies matrices, with profit 0 where there is no bet.
+    """
+    specs = compiled["strategies"]
+    goals = {col: data[col].to_numpy(dtype=float) for col in GOAL_COLUMNS}
+
+    # Event and odds of each strategy, side by side (each market's event is computed once)
+    events_by_market = {
+        market: MARKETS[market]["event"](goals) for market in dict.fromkeys(spec["market"] for spec in specs)
+    }
+    # Matrices are column-major (one contiguous column per strategy) so per-strategy reductions stay fast
+    events = np.stack([
+        events_by_market[spec["market"]] for spec in specs
+    ]).T if specs else np.zeros((len(data), 0), dtype=bool)
+    odds = np.stack([
+        data[spec["odds"]].to_numpy(dtype=float) if isinstance(spec["odds"], str)
+        else np.full(len(data), float(spec["odds"])) for spec in specs
+    ]).T if specs else np.zeros((len(data), 0))
+
+    lay = np.array([spec["lay"] for spec in specs], dtype=bool)
+    liability = np.array([spec["liability"] for spec in specs], dtype=bool)
+    stake = np.array([spec["stake_size"] for spec in specs])
+    commission = np.array([spec["commission"] for spec in specs])
+
+    # Games without a result or a valid price are never bets
+    settled = ~np.isnan(sum(goals.values()))[:, None]
+    valid_odds = np.isfinite(odds) & (odds > 1)
+    bets = _bet_matrix(data, compiled) & settled & valid_odds
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Backer's stake of each bet (lays at fixed liability lay stake / (odds - 1))
+        backer_stake = np.where(lay & liability, stake / (odds - 1), stake)
+        win_back = backer_stake * (odds - 1)
+        # A back wins when the event happens, a lay when it does not
+        won = events != lay
+        profits = np.where(
+            won,
+            np.where(lay, backer_stake, win_back) * (1 - commission),
+            -np.where(lay, win_back, backer_stake),
+        )
+    profits = np.where(bets, profits, 0.0)
+    return bets, profits
+
+
+def summarise(bets, profits, compiled):
+    """Profit, ROI, max drawdown, win rate and standard deviation of every strategy."""
+    specs = compiled["strategies"]
+    n_bets = bets.sum(axis=0)
+    profit = profits.sum(axis=0)
+
+    # Drawdown against the running peak of the profit curve, measured on bets only
+    cumulative = np.cumsum(profits, axis=0)
+    peak = np.maximum.accumulate(np.where(bets, cumulative, -np.inf), axis=0)
+    drawdown = np.where(bets, cumulative - peak, 0.0).min(axis=0, initial=0.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = profit / n_bets
+        std = np.sqrt((np.where(bets, profits - mean, 0.0) ** 2).sum(axis=0) / (n_bets - 1))
+        roi = profit / (n_bets * np.array([spec["stake_size"] for spec in specs])) * 100
+        winrate = (bets & (profits > 0)).sum(axis=0) / n_bets * 100
+
+    summary = pd.DataFrame({
+        "Strategy": [spec["name"] for spec in specs],
+        "Market": [spec["market"] for spec in specs],
+        "Bets": n_bets,
+        "Profit": profit,
+        "ROI (%)": roi,
+        "Max Drawdown": drawdown,
+        "Winrate (%)": winrate,
+        "Std": std,
+    })
+    return summary.round(2)
+
+
+def run_backtest(data, strategies):
+    """Evaluates all `strategies` over `data` and returns (summary, bets, profits)."""
+    compiled = compile_strategies(strategies)
+    bets, profits = strategy_profits(data, compiled)
+    return summarise(bets, profits, compiled), bets, profits
+
+
+def profit_curve(data, bets, profits, position):
+    """Bets of the strategy at `position` with their profit and accumulated profit."""
+    rows = np.flatnonzero(bets[:, position])
+    curve = data.iloc[rows].reset_index(drop=True)
+    curve["Profit"] = profits[rows, position]
+    curve["Profit_acu"] = curve["Profit"].cumsum()
+    curve.index += 1
+    return curve
@@ -0,0 +1,107 @@
+"""
+RSS of the process with 1 and with N simulated sessions reading the historical base through the
+dataset registry, the way load_historical_data does. Every session must get a view of the same
+frame, so the memory must stay flat as sessions are added.
+
+    python benchmarks/registry_rss.py [--rows 300000] [--columns 60] [--sessions 50]
+
+Needs psutil. Exits with status 1 if N sessions use more than --tolerance MB over 1 session.
+"""
+import argparse
+import ctypes
+import gc
+import os
+import sys
+import tempfile
+import threading
+
+import numpy as np
+import pandas as pd
+import psutil
+import pyarrow as pa
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ["FLUFFY_STORE_DIR"] = tempfile.mkdtemp(prefix="fluffy-bench-")
+
+import data_store  # noqa: E402
+from dataset_registry import get_shared_frame  # noqa: E402
+
+MB = 1024 * 1024
+
+
+def rss():
+    """RSS once freed memory is given back to the OS, so transient load buffers don't blur the numbers."""
+    gc.collect()
+    pa.default_memory_pool().release_unused()
+    try:
+        ctypes.CDLL("libc.so.6").malloc_trim(0)
+    except (OSError, AttributeError):
+        pass
+    return psutil.Process().memory_info().rss / MB
+
+
+def historical_base(rows, columns):
+    rng = np.random.default_rng(0)
+    df = pd.DataFrame({
+        "Date": pd.Timestamp("2015-01-01") + pd.to_timedelta(np.sort(rng.integers(0, 3650, rows)), unit="D"),
+        "League": rng.choice([f"League {i}" for i in range(40)], rows),
+        "Season": "2024",
+        "Home": rng.choice([f"Team {i}" for i in range(800)], rows),
+        "Away": rng.choice([f"Team {i}" for i in range(800)], rows),
+        "FT_Goals_H": rng.integers(0, 5, rows),
+        "FT_Goals_A": rng.integers(0, 5, rows),
+    })
+    odds = rng.uniform(1.01, 15.0, (rows, columns - len(df.columns)))
+    return pd.concat([df, pd.DataFrame(odds, columns=[f"Odd_{i}" for i in range(odds.shape[1])])], axis=1)
+
+
+def sessions(shared, n, columns):
+    """Views taken by `n` sessions, one thread each like Streamlit's script threads."""
+    views = [None] * n
+
+    def session(i):
+        views[i] = shared.view(columns)
+
+    threads = [threading.Thread(target=session, args=(i,)) for i in range(n)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return views
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=300_000)
+    parser.add_argument("--columns", type=int, default=60)
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--tolerance", type=float, default=16.0)
+    args = parser.parse_args()
+
+    version = data_store.sync_historical_store(source=historical_base(args.rows, args.columns))
+    before = rss()
+    shared = get_shared_frame(("historical", None, None), version, data_store.read_historical_store)
+    loaded = rss()
+    columns = shared.columns
+
+    one = sessions(shared, 1, columns)
+    after_one = rss()
+    many = sessions(shared, args.sessions, columns)
+    after_many = rss()
+
+    shared_buffers = all(
+        np.shares_memory(view["Odd_0"].to_numpy(), shared.arrays["Odd_0"]) for view in one + many
+    )
+    growth = after_many - after_one
+    print(f"rows x columns:          {args.rows} x {args.columns} ({shared.nbytes / MB:.0f} MB in the registry)")
+    print(f"load (once per version): {loaded - before:+.1f} MB")
+    print(f"1 session:               {after_one - loaded:+.1f} MB")
+    print(f"{args.sessions} sessions:             {after_many - loaded:+.1f} MB")
+    print(f"views share the buffers: {shared_buffers}")
+    if not shared_buffers or growth > args.tolerance:
+        print(f"FAIL: {args.sessions} sessions use {growth:.1f} MB more than 1 session")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
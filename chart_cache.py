@@ -0,0 +1,78 @@
+import io
+import os
+import threading
+from collections import OrderedDict
+
+import matplotlib.pyplot as plt
+import streamlit as st
+
+# Rendered charts kept by the process, least recently used ones are dropped first
+MAX_CHARTS = 512
+MAX_CHART_BYTES = int(os.getenv("FLUFFY_CHART_CACHE_MB", "256")) * 1024 * 1024
+
+# Same output as st.pyplot, so cached charts look exactly like the ones drawn on every rerun
+SAVEFIG_OPTIONS = {"bbox_inches": "tight", "dpi": 200}
+FORMATS = ("png", "svg")
+
+# One cache per server process, shared by every session
+_charts = OrderedDict()
+_charts_lock = threading.Lock()
+_stats = {"hits": 0, "misses": 0}
+
+
+def render_figure(fig, fmt="png"):
+    """Rendered bytes of a matplotlib figure, which is closed afterwards."""
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown chart format {fmt}, choose one of {FORMATS}")
+    buffer = io.BytesIO()
+    try:
+        fig.savefig(buffer, format=fmt, **SAVEFIG_OPTIONS)
+    finally:
+        plt.close(fig)
+    return buffer.getvalue()
+
+
+def get_chart(key, build, fmt="png"):
+    """
+    Rendered bytes of the chart identified by `key` (chart type, teams, league, date cutoff, data version...),
+    calling `build()` to draw the matplotlib figure only when it is not cached yet.
+    """
+    key = (fmt,) + tuple(key)
+    with _charts_lock:
+        image = _charts.get(key)
+        if image is not None:
+            _charts.move_to_end(key)
+            _stats["hits"] += 1
+            return image
+        _stats["misses"] += 1
+
+    # Two sessions drawing the same missing chart both render it, the result is identical
+    image = render_figure(build(), fmt)
+
+    with _charts_lock:
+        _charts[key] = image
+        _charts.move_to_end(key)
+        while len(_charts) > 1 and (
+            len(_charts) > MAX_CHARTS or sum(len(value) for value in _charts.values()) > MAX_CHART_BYTES
+        ):
+            _charts.popitem(last=False)
+    return image
+
+
+def show_chart(key, build, fmt="png"):
+    """Shows the chart of `key` (drawn by `build()` on a cache miss) like st.pyplot would."""
+    image = get_chart(key, build, fmt)
+    st.image(image.decode() if fmt == "svg" else image, width="stretch")
+
+
+def chart_cache_stats():
+    """Hits, misses, hit rate (%), number of charts and bytes held by the chart cache."""
+    with _charts_lock:
+        hits, misses = _stats["hits"], _stats["misses"]
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / (hits + misses) * 100 if hits + misses else 0.0,
+            "charts": len(_charts),
+            "bytes": sum(len(value) for value in _charts.values()),
+        }
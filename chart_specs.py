@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+
+# Vega-Lite versions of the matplotlib charts: the server only sends the aggregated numbers,
+# the browser draws them (st.vega_lite_chart)
+
+
+def _value(value):
+    """JSON-friendly version of a number / date / label."""
+    if isinstance(value, (pd.Timestamp, np.datetime64)):
+        return pd.Timestamp(value).strftime("%Y-%m-%d")
+    if isinstance(value, np.integer):
+        return int(value)
+    if isinstance(value, np.floating):
+        return None if np.isnan(value) else float(value)
+    return value
+
+
+def _color(names, colors):
+    return {"field": "Series", "type": "nominal", "sort": list(names),
+            "scale": {"domain": list(names), "range": list(colors)}, "legend": {"title": None}}
+
+
+def pie_chart(labels, values, colors, title):
+    """Pie with the share of each label written on its slice, like the matplotlib autopct pies."""
+    total = sum(values) or 1
+    data = [
+        {"Series": label, "Value": _value(value), "Share": f"{value / total * 100:.1f}%"}
+        for label, value in zip(labels, values)
+    ]
+    return {
+        "title": title,
+        "data": {"values": data},
+        "encoding": {
+            "theta": {"field": "Value", "type": "quantitative", "stack": True},
+            "color": _color(labels, colors),
+            "order": {"field": "Series", "sort": "ascending"},
+        },
+        "layer": [
+            {"mark": {"type": "arc", "outerRadius": 120}},
+            {
+                "mark": {"type": "text", "radius": 80, "fontSize": 16, "fontWeight": "bold", "color": "white"},
+                "encoding": {"text": {"field": "Share"}},
+                "transform": [{"filter": "datum.Value > 0"}],
+            },
+        ],
+        "view": {"stroke": None},
+    }
+
+
+def grouped_bar_chart(categories, series, colors, title, y_title="Goals"):
+    """One group of bars per category, one bar per entry of `series` ({name: values})."""
+    categories = [_value(category) for category in categories]
+    data = [
+        {"Category": category, "Series": name, "Value": _value(value)}
+        for name, values in series.items()
+        for category, value in zip(categories, values)
+    ]
+    return {
+        "title": title,
+        "data": {"values": data},
+        "mark": "bar",
+        "encoding": {
+            "x": {"field": "Category", "type": "nominal", "sort": categories, "title": None, "axis": {"labelAngle": -45}},
+            "xOffset": {"field": "Series", "sort": list(series)},
+            "y": {"field": "Value", "type": "quantitative", "title": y_title},
+            "color": _color(series, colors),
+            "tooltip": [{"field": "Category"}, {"field": "Series"}, {"field": "Value"}],
+        },
+    }
+
+
+def bar_chart(labels, values, colors, title, y_title):
+    """One coloured bar per label."""
+    data = [{"Series": label, "Value": _value(value)} for label, value in zip(labels, values)]
+    return {
+        "title": title,
+        "data": {"values": data},
+        "mark": "bar",
+        "encoding": {
+            "x": {"field": "Series", "type": "nominal", "sort": list(labels), "title": None, "axis": {"labelAngle": 0}},
+            "y": {"field": "Value", "type": "quantitative", "title": y_title},
+            "color": {**_color(labels, colors), "legend": None},
+            "tooltip": [{"field": "Series"}, {"field": "Value"}],
+        },
+    }
+
+
+def line_chart(x, series, colors, title, x_title, y_title):
+    """One line per entry of `series` ({name: values}) over the dates in `x`."""
+    x = [_value(value) for value in x]
+    data = [
+        {"X": date, "Series": name, "Value": _value(value)}
+        for name, values in series.items()
+        for date, value in zip(x, values)
+    ]
+    return {
+        "title": title,
+        "data": {"values": data},
+        "mark": {"type": "line", "point": True},
+        "encoding": {
+            "x": {"field": "X", "type": "temporal", "title": x_title},
+            "y": {"field": "Value", "type": "quantitative", "title": y_title},
+            "color": _color(series, colors),
+            "tooltip": [{"field": "X", "type": "temporal"}, {"field": "Series"}, {"field": "Value"}],
+        },
+    }
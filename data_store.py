@@ -0,0 +1,236 @@
+import json
+import os
+import shutil
+import threading
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import streamlit as st
+from fetch_cache import HISTORICAL_TTL, fetch
+from dataset_registry import get_shared_frame
+from schemas import SCHEMA_VERSION, SCHEMAS, apply_schema, as_category, read_csv
+
+# Source of the historical base and location of the local columnar mirror
+HISTORICAL_DATA_URL = "https://raw.githubusercontent.com/RedLegacy227/main_data_base/main/df_base_original.csv"
+STORE_DIR = os.getenv("FLUFFY_STORE_DIR", os.path.join(os.getcwd(), ".cache", "historical"))
+STATE_FILE = "_sync_state.json"
+
+# The store is split by League and Season so a page can read only what it needs
+PARTITION_COLUMNS = ["League", "Season"]
+
+# How often (in seconds) the store checks the remote CSV for new match dates
+SYNC_TTL = HISTORICAL_TTL
+
+# Sessions share the store on disk, so only one of them may write at a time
+_SYNC_LOCK = threading.Lock()
+
+
+def _state_path():
+    return os.path.join(STORE_DIR, STATE_FILE)
+
+
+def _read_state():
+    """Returns the last sync state (last stored date, columns) or None if the store is empty."""
+    try:
+        with open(_state_path(), "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _write_state(state):
+    tmp_path = _state_path() + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, _state_path())
+
+
+def _normalise(df):
+    """Gives the historical frame the dtypes of its schema before it is written to Parquet."""
+    return apply_schema(df, SCHEMAS["historical"])
+
+
+def _digest(df):
+    """Order-independent fingerprint of the rows of `df`: [row count, sum of the row hashes mod 2**64]."""
+    hashes = pd.util.hash_pandas_object(df, index=False).to_numpy()
+    return [len(hashes), int(hashes.sum(dtype=np.uint64))]
+
+
+def _add_digests(*digests):
+    return [sum(d[0] for d in digests), sum(d[1] for d in digests) % (1 << 64)]
+
+
+def _store_version(state):
+    """Version of the store: its last date plus the CSV version (or the content digest for a local source)."""
+    if state is None or state.get("last_date") is None:
+        return None
+    source = state.get("source_version")
+    if source is None:
+        source = format(_add_digests(state["prefix_digest"], state["day_digest"])[1], "x")
+    return f"{state['last_date']}@{source}"
+
+
+def _write_partitions(df, part_name):
+    """Appends rows to the store as new Parquet files, one per League/Season partition."""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    ds.write_dataset(
+        table,
+        STORE_DIR,
+        format="parquet",
+        partitioning=PARTITION_COLUMNS,
+        partitioning_flavor="hive",
+        basename_template=f"{part_name}-{{i}}.parquet",
+        existing_data_behavior="overwrite_or_ignore",
+    )
+
+
+def _remove_partitions(part_name):
+    """Deletes the Parquet files written with `part_name`, in every partition."""
+    for root, _, files in os.walk(STORE_DIR):
+        for file in files:
+            if file.startswith(f"{part_name}-") and file.endswith(".parquet"):
+                os.remove(os.path.join(root, file))
+
+
+def sync_historical_store(source=None):
+    """
+    Mirrors the historical CSV into the local store and returns the store version.
+    On the first run the whole base is written; afterwards only the last stored day is
+    re-written (late games, corrected scores) and the newer match dates are appended.
+    If games before the last stored day changed, the store is rebuilt.
+    """
+    source_version = None
+    if source is None:
+        entry = fetch(HISTORICAL_DATA_URL, ttl=HISTORICAL_TTL)
+        if entry is None:
+            raise FileNotFoundError(f"File not found: {HISTORICAL_DATA_URL}")
+
+        # The CSV didn't change since the last sync, so there is nothing to parse
+        state = _read_state()
+        if state is not None and state.get("source_version") == entry["version"]:
+            return _store_version(state)
+        source = read_csv(entry["path"], SCHEMAS["historical"])
+        source_version = entry["version"]
+
+    df = _normalise(source)
+    with _SYNC_LOCK:
+        return _store_version(_apply_changes(df, source_version))
+
+
+def _apply_changes(df, source_version=None):
+    """
+    Brings the store in line with `df` and returns the new state.
+    The rows of the last stored day are kept in their own files ("day-<date>"), so late rows for
+    that day only re-write them; the rows before it are checked against a digest of what is stored.
+    """
+    state = _read_state()
+    columns = list(df.columns)
+    rebuild = (state is None or state.get("last_date") is None or state["columns"] != columns
+               or state.get("schema_version") != SCHEMA_VERSION or "prefix_digest" not in state)
+    if not rebuild:
+        last_day = pd.Timestamp(state["last_date"])
+        # Games before the last stored day were edited or removed: only a rebuild can fix them
+        rebuild = _digest(df[df["Date"] < last_day]) != state["prefix_digest"]
+
+    if rebuild:
+        shutil.rmtree(STORE_DIR, ignore_errors=True)
+        os.makedirs(STORE_DIR, exist_ok=True)
+        state = {"last_date": None, "prefix_digest": _digest(df.iloc[:0]), "day_digest": _digest(df.iloc[:0])}
+        day, new_rows = df.iloc[:0], df
+    else:
+        day = df[df["Date"] == last_day]
+        new_rows = df[df["Date"] > last_day]
+        if _digest(day) != state["day_digest"]:
+            # Late games or corrections on the last stored day: its files are written again.
+            # The state is marked first, so a sync interrupted here re-writes the day next time.
+            _write_state({**state, "day_digest": None})
+            _remove_partitions(f"day-{state['last_date']}")
+            if not day.empty:
+                _write_partitions(day, f"day-{state['last_date']}")
+
+    if not new_rows.empty:
+        last_date = new_rows["Date"].max()
+        sealed = new_rows[new_rows["Date"] < last_date]
+        new_day = new_rows[new_rows["Date"] == last_date]
+        last_date = last_date.strftime("%Y-%m-%d")
+        if not sealed.empty:
+            _write_partitions(sealed, f"part-{last_date}")
+        _write_partitions(new_day, f"day-{last_date}")
+        state = {
+            "last_date": last_date,
+            "prefix_digest": _add_digests(state["prefix_digest"], _digest(day), _digest(sealed)),
+            "day_digest": _digest(new_day),
+        }
+    else:
+        # Nothing to append; an empty CSV on the first sync leaves an empty store without a last date
+        state = {**state, "day_digest": _digest(day)}
+
+    state = {**state, "columns": columns, "source_version": source_version, "schema_version": SCHEMA_VERSION}
+    _write_state(state)
+    return state
+
+
+@st.cache_data(ttl=SYNC_TTL, show_spinner=False)
+def historical_store_version():
+    """Syncs the store at most once per SYNC_TTL and returns its version."""
+    try:
+        return sync_historical_store()
+    except Exception as e:
+        # Keep serving the local copy if the remote CSV is unreachable
+        state = _read_state()
+        if state is None:
+            raise
+        st.warning(f"Using local Historical Data, sync failed: {e}")
+        return _store_version(state)
+
+
+def read_historical_store(columns=None, leagues=None):
+    """Reads the store with only the requested columns and leagues, sorted by date."""
+    dataset = ds.dataset(STORE_DIR, format="parquet", partitioning="hive", exclude_invalid_files=True)
+    # League is a partition key, so only the files of the requested leagues are opened
+    filter_expr = ds.field("League").isin(list(leagues)) if leagues is not None else None
+    read_columns = None if columns is None else list(dict.fromkeys(list(columns) + ["Date"]))
+    table = dataset.to_table(columns=read_columns, filter=filter_expr)
+    df = table.to_pandas()
+    # Hive partition values come back with inferred types at the end of the frame
+    for col in PARTITION_COLUMNS:
+        if col in df.columns:
+            df[col] = as_category(df[col].astype(str))
+    if "Date" in df.columns:
+        df = df.sort_values(by="Date", kind="stable").reset_index(drop=True)
+    order = columns if columns is not None else (_read_state() or {}).get("columns", list(df.columns))
+    return df[[col for col in order if col in df.columns]]
+
+
+def load_historical_data(columns=None, leagues=None, before=None):
+    """
+    Returns the historical base from the local store, syncing it first if needed.
+    The base is loaded once per process and data version; every session gets a read-only,
+    zero-copy view with only the `columns` it asks for.
+    Pass `leagues` to read only the files of those leagues (and only `columns` from them),
+    and `before` (a date) to get only the games played before it.
+    """
+    try:
+        version = historical_store_version()
+        leagues = tuple(sorted(leagues)) if leagues is not None else None
+        # League slices are small, so they are read with only the requested columns;
+        # the full base is read once and every column set is a view of it
+        read_columns = tuple(dict.fromkeys(list(columns) + ["Date"])) if leagues is not None and columns is not None else None
+        shared = get_shared_frame(
+            ("historical", leagues, read_columns),
+            version,
+            lambda: read_historical_store(
+                columns=list(read_columns) if read_columns is not None else None,
+                leagues=list(leagues) if leagues is not None else None,
+            ),
+        )
+        df = shared.view(columns)
+        if before is not None:
+            # Rows are sorted by date, so the games before a date are a prefix of the frame
+            cutoff = np.searchsorted(shared.arrays["Date"], np.datetime64(pd.Timestamp(before)), side="left")
+            df = df.iloc[:cutoff]
+        return df
+    except Exception as e:
+        st.error(f"Error loading Historical Data: {e}")
+        return None
@@ -1,5 +1,7 @@
 from pymongo import MongoClient
+import atexit
 import os
+import threading
 import streamlit as st  # Import Streamlit for Secrets
 
 # Get MongoDB URI from Streamlit Secrets or Environment Variables
@@ -9,10 +11,64 @@ MONGO_URI = st.secrets["connections"]["MONGO_URI"] if "connections" in st.secret
 if not MONGO_URI:
     raise ValueError("❌ MONGO_URI is not set in Streamlit secrets or environment variables.")
 
+DATABASE_NAME = "Fluffy_Chips_Web_Analyser"  # Replace with your actual database name
+
+# Connection pool settings, shared by every Streamlit session of this process
+MONGO_MAX_POOL_SIZE = int(os.getenv("MONGO_MAX_POOL_SIZE", "20"))
+MONGO_MIN_POOL_SIZE = int(os.getenv("MONGO_MIN_POOL_SIZE", "0"))
+MONGO_MAX_IDLE_TIME_MS = int(os.getenv("MONGO_MAX_IDLE_TIME_MS", "60000"))
+MONGO_CONNECT_TIMEOUT_MS = int(os.getenv("MONGO_CONNECT_TIMEOUT_MS", "5000"))
+MONGO_SOCKET_TIMEOUT_MS = int(os.getenv("MONGO_SOCKET_TIMEOUT_MS", "10000"))
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.getenv("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000"))
+MONGO_HEARTBEAT_FREQUENCY_MS = int(os.getenv("MONGO_HEARTBEAT_FREQUENCY_MS", "10000"))
+
+_client = None
+_client_lock = threading.Lock()
+
+
+# Get the process-wide MongoDB client, created on first use
+def get_client():
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = MongoClient(
+                    MONGO_URI,
+                    maxPoolSize=MONGO_MAX_POOL_SIZE,
+                    minPoolSize=MONGO_MIN_POOL_SIZE,
+                    maxIdleTimeMS=MONGO_MAX_IDLE_TIME_MS,
+                    connectTimeoutMS=MONGO_CONNECT_TIMEOUT_MS,
+                    socketTimeoutMS=MONGO_SOCKET_TIMEOUT_MS,
+                    serverSelectionTimeoutMS=MONGO_SERVER_SELECTION_TIMEOUT_MS,
+                    heartbeatFrequencyMS=MONGO_HEARTBEAT_FREQUENCY_MS,
+                )
+    return _client
+
+
+# Health check: True if the cluster answers a ping
+def ping():
+    try:
+        get_client().admin.command("ping")
+        return True
+    except Exception:
+        return False
+
+
+# Close the shared client (called automatically when the process exits)
+def close_client():
+    global _client
+    with _client_lock:
+        if _client is not None:
+            _client.close()
+            _client = None
+
+
+atexit.register(close_client)
+
+
 # Connect to MongoDB Atlas
 def get_database():
-    client = MongoClient(MONGO_URI)
-    return client["Fluffy_Chips_Web_Analyser"]  # Replace with your actual database name
+    return get_client()[DATABASE_NAME]
 
 # Get the users collection
 def get_users_collection():
@@ -22,4 +78,4 @@ def get_users_collection():
 # Get the users collection
 def get_variables_collection():
     db = get_database()
-    return db["variables_games"]
\ No newline at end of file
+    return db["variables_games"]
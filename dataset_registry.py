@@ -0,0 +1,97 @@
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+# Loaded datasets kept by the process, least recently used ones are dropped first
+MAX_DATASETS = 64
+MAX_REGISTRY_BYTES = int(os.getenv("FLUFFY_REGISTRY_MB", "2048")) * 1024 * 1024
+
+# One registry per server process, shared by every session
+_registry = OrderedDict()
+_registry_lock = threading.Lock()
+_load_locks = {}
+
+
+class SharedFrame:
+    """
+    One loaded version of a dataset, converted once and never modified afterwards.
+    Columns are read-only arrays: sessions get DataFrames that wrap them without copying,
+    so adding columns to a view is free and in-place writes fail instead of leaking into other sessions.
+    """
+
+    def __init__(self, data):
+        if isinstance(data, pa.Table):
+            # Arrow buffers are released column by column while they are converted
+            data = data.to_pandas(split_blocks=True, self_destruct=True)
+        self.columns = list(data.columns)
+        self.arrays = {}
+        for col in self.columns:
+            values = data[col].array
+            # Plain numeric / datetime columns are kept as their numpy buffer, so they can be frozen
+            if isinstance(values, pd.arrays.NumpyExtensionArray) or (
+                isinstance(values, pd.arrays.DatetimeArray) and values.tz is None
+            ):
+                values = values.to_numpy()
+            if isinstance(values, np.ndarray):
+                values.flags.writeable = False
+            self.arrays[col] = values
+        self.nbytes = int(data.memory_usage(index=False, deep=False).sum())
+
+    def view(self, columns=None):
+        """Read-only, zero-copy DataFrame with `columns` (all of them by default) in the requested order."""
+        columns = self.columns if columns is None else list(columns)
+        missing = [col for col in columns if col not in self.arrays]
+        if missing:
+            raise KeyError(f"Columns not found: {missing}")
+        return pd.DataFrame({col: self.arrays[col] for col in columns}, copy=False)
+
+
+def _load_lock(key):
+    with _registry_lock:
+        return _load_locks.setdefault(key, threading.Lock())
+
+
+def get_shared_frame(key, version, loader):
+    """
+    Returns the SharedFrame of `key` at `version`, calling `loader()` (a DataFrame or an Arrow table)
+    only the first time this version is requested in the process. Older versions of `key` are dropped.
+    """
+    with _registry_lock:
+        entry = _registry.get(key)
+        if entry is not None and entry[0] == version:
+            _registry.move_to_end(key)
+            return entry[1]
+
+    # Only one session loads a given dataset, the others wait for it
+    with _load_lock(key):
+        with _registry_lock:
+            entry = _registry.get(key)
+            if entry is not None and entry[0] == version:
+                return entry[1]
+
+        shared = SharedFrame(loader())
+
+        with _registry_lock:
+            _registry[key] = (version, shared)
+            _registry.move_to_end(key)
+            # The dataset just loaded is never dropped, even if it alone exceeds the limit
+            while len(_registry) > 1 and (
+                len(_registry) > MAX_DATASETS
+                or sum(entry[1].nbytes for entry in _registry.values()) > MAX_REGISTRY_BYTES
+            ):
+                old_key, _ = _registry.popitem(last=False)
+                _load_locks.pop(old_key, None)
+        return shared
+
+
+def registry_stats():
+    """Size of every dataset held by the process, for monitoring."""
+    with _registry_lock:
+        return pd.DataFrame(
+            [(str(key), version, len(shared.columns), shared.nbytes) for key, (version, shared) in _registry.items()],
+            columns=["Dataset", "Version", "Columns", "Bytes"],
+        )
@@ -0,0 +1,240 @@
+import json
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+from scipy.optimize import minimize
+
+# Fitted parameters of every league, written by refit_models() and only read by the pages
+MODEL_PATH = os.getenv("FLUFFY_DIXON_COLES_PATH", os.path.join(os.getcwd(), ".cache", "dixon_coles.json"))
+MODEL_VERSION = 1
+
+HISTORICAL_COLUMNS = ["Date", "League", "Home", "Away", "FT_Goals_H", "FT_Goals_A"]
+
+# Time decay of the likelihood: a game played d days before the fit weighs exp(-XI * d) (half-life ~1 year)
+XI = 0.0019
+# Games older than this are left out of the fit, their weight is negligible anyway
+MAX_AGE_DAYS = 3 * 365
+# Leagues with fewer games than this are not fitted
+MIN_GAMES = 60
+# Bounds of the low-score dependence parameter
+RHO_BOUNDS = (-0.3, 0.3)
+
+
+def _unpack(theta, n_teams):
+    return theta[:n_teams], theta[n_teams:2 * n_teams], theta[2 * n_teams], theta[2 * n_teams + 1]
+
+
+def negative_log_likelihood(theta, home, away, home_goals, away_goals, weights, n_teams):
+    """
+    Time-weighted Dixon-Coles negative log-likelihood (per unit of weight) and its gradient, vectorised over games.
+    log(home xG) = home advantage + attack[home] + defence[away], log(away xG) = attack[away] + defence[home];
+    rho corrects the probabilities of 0x0, 1x0, 0x1 and 1x1. The attacks are kept centred by a penalty.
+    """
+    attack, defence, home_adv, rho = _unpack(theta, n_teams)
+    lam = np.exp(home_adv + attack[home] + defence[away])
+    mu = np.exp(attack[away] + defence[home])
+
+    # Low-score correction tau and the derivatives of log(tau)
+    tau = np.ones_like(lam)
+    d_lam = np.zeros_like(lam)
+    d_mu = np.zeros_like(lam)
+    d_rho = np.zeros_like(lam)
+    s00 = (home_goals == 0) & (away_goals == 0)
+    s01 = (home_goals == 0) & (away_goals == 1)
+    s10 = (home_goals == 1) & (away_goals == 0)
+    s11 = (home_goals == 1) & (away_goals == 1)
+    tau[s00] = 1 - lam[s00] * mu[s00] * rho
+    tau[s01] = 1 + lam[s01] * rho
+    tau[s10] = 1 + mu[s10] * rho
+    tau[s11] = 1 - rho
+    tau = np.maximum(tau, 1e-10)
+    d_lam[s00] = d_mu[s00] = -lam[s00] * mu[s00] * rho / tau[s00]
+    d_rho[s00] = -lam[s00] * mu[s00] / tau[s00]
+    d_lam[s01] = lam[s01] * rho / tau[s01]
+    d_rho[s01] = lam[s01] / tau[s01]
+    d_mu[s10] = mu[s10] * rho / tau[s10]
+    d_rho[s10] = mu[s10] / tau[s10]
+    d_rho[s11] = -1 / tau[s11]
+
+    total = weights.sum()
+    log_lik = weights @ (np.log(tau) + home_goals * np.log(lam) - lam + away_goals * np.log(mu) - mu) / total
+    penalty = attack.sum() ** 2
+
+    # Derivatives with respect to log(lam) and log(mu), gathered per team
+    g_lam = weights * (home_goals - lam + d_lam) / total
+    g_mu = weights * (away_goals - mu + d_mu) / total
+    grad_attack = np.bincount(home, g_lam, n_teams) + np.bincount(away, g_mu, n_teams)
+    grad_defence = np.bincount(away, g_lam, n_teams) + np.bincount(home, g_mu, n_teams)
+    gradient = -np.concatenate([
+        grad_attack - 2 * attack.sum(), grad_defence, [g_lam.sum()], [weights @ d_rho / total]
+    ])
+    return -log_lik + penalty, gradient
+
+
+def fit_league(home, away, home_goals, away_goals, weights, n_teams, x0=None):
+    """Fits one league. Returns (theta, converged, iterations); `x0` warm-starts the optimiser."""
+    if x0 is None:
+        x0 = np.concatenate([np.zeros(2 * n_teams), [0.25, 0.0]])
+    bounds = [(None, None)] * (2 * n_teams + 1) + [RHO_BOUNDS]
+    result = minimize(
+        negative_log_likelihood, x0, jac=True, method="L-BFGS-B", bounds=bounds,
+        args=(home, away, home_goals, away_goals, weights, n_teams),
+    )
+    return result.x, bool(result.success), int(result.nit)
+
+
+def _league_inputs(games, as_of, xi):
+    """Integer-coded teams, goals and time weights of one league's settled games."""
+    teams, codes = np.unique(np.concatenate([games["Home"].to_numpy(dtype=str), games["Away"].to_numpy(dtype=str)]),
+                             return_inverse=True)
+    age = (as_of - games["Date"]).dt.days.to_numpy(dtype=float)
+    return {
+        "teams": teams,
+        "home": codes[:len(games)],
+        "away": codes[len(games):],
+        "home_goals": games["FT_Goals_H"].to_numpy(dtype=float),
+        "away_goals": games["FT_Goals_A"].to_numpy(dtype=float),
+        "weights": np.exp(-xi * age),
+    }
+
+
+def _warm_start(previous, teams):
+    """Previous parameters mapped onto the current teams (new teams start at 0), or None."""
+    if previous is None:
+        return None
+    index = {team: i for i, team in enumerate(previous["teams"])}
+    positions = np.array([index.get(team, -1) for team in teams])
+    known = positions >= 0
+    attack = np.where(known, np.asarray(previous["attack"])[np.maximum(positions, 0)], 0.0)
+    defence = np.where(known, np.asarray(previous["defence"])[np.maximum(positions, 0)], 0.0)
+    return np.concatenate([attack, defence, [previous["home"], previous["rho"]]])
+
+
+def _fit_task(league, inputs, previous):
+    theta, converged, iterations = fit_league(
+        inputs["home"], inputs["away"], inputs["home_goals"], inputs["away_goals"], inputs["weights"],
+        len(inputs["teams"]), x0=_warm_start(previous, inputs["teams"]),
+    )
+    attack, defence, home_adv, rho = _unpack(theta, len(inputs["teams"]))
+    return league, {
+        "teams": inputs["teams"].tolist(),
+        "attack": attack.round(6).tolist(),
+        "defence": defence.round(6).tolist(),
+        "home": round(float(home_adv), 6),
+        "rho": round(float(rho), 6),
+        "converged": converged,
+        "iterations": iterations,
+    }
+
+
+def fit_all(historical_data, previous=None, as_of=None, xi=XI, max_workers=None):
+    """
+    Fits every league of `historical_data` in a process pool, warm-starting from `previous` (the parameters
+    of the last fit). Leagues whose games did not change since `previous` keep their parameters without a refit.
+    Returns {league: parameters}.
+    """
+    previous = previous or {}
+    data = historical_data.dropna(subset=["FT_Goals_H", "FT_Goals_A"])
+    as_of = pd.Timestamp(as_of) if as_of is not None else data["Date"].max()
+    data = data[(data["Date"] <= as_of) & (data["Date"] > as_of - pd.Timedelta(days=MAX_AGE_DAYS))]
+
+    models = {}
+    tasks = []
+    for league, games in data.groupby(data["League"].astype(str), sort=True):
+        if len(games) < MIN_GAMES:
+            continue
+        last_game = games["Date"].max().strftime("%Y-%m-%d")
+        old = previous.get(league)
+        if old is not None and old["last_game"] == last_game and old["games"] == len(games) and old["xi"] == xi:
+            models[league] = old
+            continue
+        tasks.append((league, _league_inputs(games, as_of, xi), old, {"last_game": last_game, "games": len(games)}))
+
+    if tasks:
+        with ProcessPoolExecutor(
+            max_workers=max_workers or os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+        ) as pool:
+            futures = [(extra, pool.submit(_fit_task, league, inputs, old)) for league, inputs, old, extra in tasks]
+            for extra, future in futures:
+                league, params = future.result()
+                models[league] = {**params, **extra, "xi": xi, "fitted_on": as_of.strftime("%Y-%m-%d")}
+    return models
+
+
+def save_parameters(models, path=MODEL_PATH):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"version": MODEL_VERSION, "leagues": models}, f)
+    os.replace(tmp_path, path)
+
+
+def read_parameters(path=MODEL_PATH):
+    """Parameters of the last fit, or None if there is none (or it was written by another model version)."""
+    try:
+        with open(path, "r") as f:
+            stored = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    return stored["leagues"] if stored.get("version") == MODEL_VERSION else None
+
+
+def refit_models(historical_data=None, max_workers=None, path=MODEL_PATH):
+    """Daily refit: fits the leagues that changed since the stored parameters (warm-started) and saves them."""
+    if historical_data is None:
+        from data_store import load_historical_data
+        historical_data = load_historical_data(columns=HISTORICAL_COLUMNS)
+        if historical_data is None:
+            raise RuntimeError("Historical data is not available")
+    models = fit_all(historical_data, previous=read_parameters(path), max_workers=max_workers)
+    save_parameters(models, path)
+    return models
+
+
+@st.cache_data(show_spinner=False)
+def _cached_parameters(path, modified):
+    return read_parameters(path)
+
+
+def load_parameters(path=MODEL_PATH):
+    """Stored parameters, re-read only when the file changes. The pages never fit, they only load."""
+    try:
+        modified = os.path.getmtime(path)
+    except OSError:
+        return None
+    return _cached_parameters(path, modified)
+
+
+def expected_goals(models, leagues, homes, aways):
+    """
+    Dixon-Coles xG and rho of each (league, home, away) fixture.
+    Returns (xg_home, xg_away, rho), NaN where the league or one of the teams has no parameters.
+    """
+    n = len(leagues)
+    xg_home, xg_away, rho = np.full(n, np.nan), np.full(n, np.nan), np.full(n, np.nan)
+    frame = pd.DataFrame({"League": np.asarray(leagues, dtype=str), "Home": np.asarray(homes, dtype=str),
+                          "Away": np.asarray(aways, dtype=str)})
+    for league, rows in frame.groupby("League").indices.items():
+        model = (models or {}).get(league)
+        if model is None:
+            continue
+        teams = pd.Index(model["teams"])
+        attack, defence = np.asarray(model["attack"]), np.asarray(model["defence"])
+        home = teams.get_indexer(frame["Home"].to_numpy()[rows])
+        away = teams.get_indexer(frame["Away"].to_numpy()[rows])
+        known = (home >= 0) & (away >= 0)
+        home, away = np.maximum(home, 0), np.maximum(away, 0)
+        xg_home[rows] = np.where(known, np.exp(model["home"] + attack[home] + defence[away]), np.nan)
+        xg_away[rows] = np.where(known, np.exp(attack[away] + defence[home]), np.nan)
+        rho[rows] = model["rho"]
+    return xg_home, xg_away, rho
+
+
+if __name__ == "__main__":
+    # Run once a day (after the historical base is updated): python dixon_coles.py
+    fitted = refit_models()
+    print(f"{len(fitted)} leagues saved to {MODEL_PATH}")
@@ -0,0 +1,234 @@
+import threading
+
+import numpy as np
+import pandas as pd
+from data_store import historical_store_version, load_historical_data
+from enrichment import HFA
+
+# Elo and Tilt of every team rebuilt from the historical base, so ratings can be read as of any past date.
+# Elo: K * margin multiplier * (result - expected result), with the home advantage of the fair odds.
+# Tilt: how many goals a team's games have compared with the average game (1 = average); after each game
+# it moves TILT_RATE of the way towards total goals / (average goals * opponent's Tilt).
+INITIAL_ELO = 1500.0
+INITIAL_TILT = 1.0
+K = 20.0
+TILT_RATE = 0.05
+# Average goals per game used until the first results are processed
+PRIOR_GOALS = 2.6
+
+HISTORICAL_COLUMNS = ["Date", "Home", "Away", "FT_Goals_H", "FT_Goals_A"]
+RATING_COLUMNS = ["Elo_Home", "Tilt_Home", "Elo_Away", "Tilt_Away", "Elo_Difference"]
+
+_DAY_OFFSET = 1 << 31
+
+
+def _to_days(dates):
+    return pd.to_datetime(pd.Series(dates)).to_numpy().astype("datetime64[D]").astype(np.int64)
+
+
+def margin_multiplier(goal_difference):
+    """Weight of a result by its goal difference (1 for a draw or one goal, 1.5 for two, (11 + n) / 8 above)."""
+    gd = np.abs(goal_difference)
+    return np.where(gd <= 1, 1.0, np.where(gd == 2, 1.5, (11 + gd) / 8))
+
+
+class EloTilt:
+    """
+    Elo and Tilt of every team, with the full time series of both kept per team.
+    Results are processed chronologically one match day at a time (all the games of a day at once),
+    and the series are stored like the TeamIndex slices: sorted by (team, day), so the rating of a team
+    as of a date is one binary search. An instance is never modified: advance() returns a new one.
+    """
+
+    def __init__(self):
+        self.teams = pd.Index([], dtype=object)
+        self.elo = np.empty(0)
+        self.tilt = np.empty(0)
+        self.last_day = None
+        self.n_games = 0
+        self.goals = 0.0
+        # Ratings after every game, one (team codes, days, elo, tilt) chunk per advance()
+        self._chunks = []
+        self._series = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_games(cls, games):
+        return cls().advance(games)
+
+    def _copy(self):
+        engine = EloTilt()
+        engine.teams, engine.elo, engine.tilt = self.teams, self.elo.copy(), self.tilt.copy()
+        engine.last_day, engine.n_games, engine.goals = self.last_day, self.n_games, self.goals
+        engine._chunks = list(self._chunks)
+        return engine
+
+    def _codes(self, names):
+        """Codes of `names`, adding the teams seen for the first time (at the initial ratings)."""
+        new = pd.Index(pd.unique(names)).difference(self.teams)
+        if len(new):
+            self.teams = self.teams.append(new)
+            self.elo = np.concatenate([self.elo, np.full(len(new), INITIAL_ELO)])
+            self.tilt = np.concatenate([self.tilt, np.full(len(new), INITIAL_TILT)])
+        return self.teams.get_indexer(names)
+
+    def advance(self, games):
+        """
+        New engine with the settled `games` played after last_day processed on top of this one.
+        Games on or before last_day are ignored, so the whole base can be passed on every refresh.
+        """
+        engine = self._copy()
+        games = games.dropna(subset=["FT_Goals_H", "FT_Goals_A"])
+        days = _to_days(games["Date"])
+        keep = days > engine.last_day if engine.last_day is not None else np.ones(len(games), dtype=bool)
+        if not keep.any():
+            return engine
+
+        order = np.argsort(days[keep], kind="stable")
+        days = days[keep][order]
+        home = engine._codes(games["Home"].astype(str).to_numpy()[keep][order])
+        away = engine._codes(games["Away"].astype(str).to_numpy()[keep][order])
+        goals_h = games["FT_Goals_H"].to_numpy(dtype=float)[keep][order]
+        goals_a = games["FT_Goals_A"].to_numpy(dtype=float)[keep][order]
+        elo, tilt = engine.elo, engine.tilt
+        record_elo = np.empty(2 * len(days))
+        record_tilt = np.empty(2 * len(days))
+
+        # One vectorised update per match day: every game of the day is rated with the ratings of the day before
+        bounds = np.flatnonzero(np.diff(days)) + 1
+        for start, stop in zip(np.r_[0, bounds], np.r_[bounds, len(days)]):
+            h, a = home[start:stop], away[start:stop]
+            gh, ga = goals_h[start:stop], goals_a[start:stop]
+            expected = 1 / (10 ** (-(elo[h] + HFA - elo[a]) / 400) + 1)
+            result = np.where(gh > ga, 1.0, np.where(gh == ga, 0.5, 0.0))
+            delta = K * margin_multiplier(gh - ga) * (result - expected)
+
+            average = engine.goals / engine.n_games if engine.n_games else PRIOR_GOALS
+            total = gh + ga
+            tilt_h = TILT_RATE * (total / (average * tilt[a]) - tilt[h])
+            tilt_a = TILT_RATE * (total / (average * tilt[h]) - tilt[a])
+
+            # add.at, so a team with two games on the same day gets both updates
+            np.add.at(elo, h, delta)
+            np.add.at(elo, a, -delta)
+            np.add.at(tilt, h, tilt_h)
+            np.add.at(tilt, a, tilt_a)
+            engine.goals += total.sum()
+            engine.n_games += stop - start
+
+            record_elo[2 * start:2 * stop] = np.column_stack([elo[h], elo[a]]).ravel()
+            record_tilt[2 * start:2 * stop] = np.column_stack([tilt[h], tilt[a]]).ravel()
+
+        codes = np.column_stack([home, away]).ravel()
+        engine._chunks.append((codes, np.repeat(days, 2), record_elo, record_tilt))
+        engine.last_day = int(days[-1])
+        return engine
+
+    def _sorted_series(self):
+        """All the recorded ratings sorted by (team, day), built on the first lookup."""
+        with self._lock:
+            if self._series is None:
+                codes, days, elo, tilt = (np.concatenate(parts) for parts in zip(*self._chunks))
+                keys = codes.astype(np.int64) * (1 << 32) + (days + _DAY_OFFSET)
+                # Stable, so the games of a team on the same day stay in the order they were rated
+                order = np.argsort(keys, kind="stable")
+                self._series = {"keys": keys[order], "elo": elo[order], "tilt": tilt[order]}
+            return self._series
+
+    def ratings(self, teams, dates, inclusive=False):
+        """
+        Elo and Tilt of each team of `teams` as of each date of `dates`: after its last game before the date
+        (or on it, if `inclusive`), so a game is never rated with its own result. Games is the number of
+        games rated so far; teams without any get NaN ratings.
+        """
+        codes = self.teams.get_indexer(pd.Series(teams, dtype=object).astype(str)).astype(np.int64)
+        if not self._chunks:
+            return pd.DataFrame({"Elo": np.nan, "Tilt": np.nan, "Games": np.zeros(len(codes), dtype=np.int64)})
+        series = self._sorted_series()
+        days = _to_days(dates)
+        days = days + 1 if inclusive else days
+        group_keys = codes * (1 << 32)
+        end = np.searchsorted(series["keys"], group_keys + days + _DAY_OFFSET, side="left")
+        start = np.searchsorted(series["keys"], group_keys, side="left")
+        games = np.where(codes < 0, 0, end - start)
+        last = np.maximum(end - 1, 0)
+        return pd.DataFrame({
+            "Elo": np.where(games > 0, series["elo"][last], np.nan),
+            "Tilt": np.where(games > 0, series["tilt"][last], np.nan),
+            "Games": games,
+        })
+
+    def history(self, team):
+        """Date, Elo and Tilt after every game of `team`, oldest first."""
+        code = self.teams.get_indexer([str(team)])[0]
+        if code < 0 or not self._chunks:
+            return pd.DataFrame({"Date": pd.to_datetime([]), "Elo": [], "Tilt": []})
+        series = self._sorted_series()
+        start, end = np.searchsorted(series["keys"], [code * (1 << 32), (code + 1) * (1 << 32)], side="left")
+        days = series["keys"][start:end] - code * (1 << 32) - _DAY_OFFSET
+        return pd.DataFrame({
+            "Date": days.astype("datetime64[D]").astype("datetime64[ns]"),
+            "Elo": series["elo"][start:end],
+            "Tilt": series["tilt"][start:end],
+        })
+
+    def table(self, as_of=None):
+        """Team, Elo and Tilt of every rated team (as of `as_of`, or the latest), like the df_elo_tilt file."""
+        if as_of is None:
+            return pd.DataFrame({"Team": self.teams.to_numpy(), "Elo": self.elo, "Tilt": self.tilt})
+        ratings = self.ratings(self.teams.to_numpy(), [as_of] * len(self.teams))
+        table = pd.DataFrame({"Team": self.teams.to_numpy(), "Elo": ratings["Elo"], "Tilt": ratings["Tilt"]})
+        return table[ratings["Games"].to_numpy() > 0].reset_index(drop=True)
+
+    def fixture_ratings(self, fixtures, as_of=None):
+        """
+        Elo_Home, Tilt_Home, Elo_Away, Tilt_Away and Elo_Difference of every fixture before it is played:
+        as of its own Date, or as of `as_of` for all of them. Point-in-time, so there is no look-ahead.
+        """
+        dates = fixtures["Date"] if as_of is None else [as_of] * len(fixtures)
+        home = self.ratings(fixtures["Home"].to_numpy(), dates)
+        away = self.ratings(fixtures["Away"].to_numpy(), dates)
+        return pd.DataFrame({
+            "Elo_Home": home["Elo"].to_numpy(), "Tilt_Home": home["Tilt"].to_numpy(),
+            "Elo_Away": away["Elo"].to_numpy(), "Tilt_Away": away["Tilt"].to_numpy(),
+            "Elo_Difference": (home["Elo"] - away["Elo"]).to_numpy(),
+        }, index=fixtures.index)
+
+
+# Engine of the latest data version, shared by every session and advanced (not rebuilt) when new results arrive
+_latest = None
+_latest_lock = threading.Lock()
+
+
+def get_elo_engine():
+    """
+    Returns the engine of the current historical data version. A new version only processes the
+    match days after the previous engine's last day; if older games changed, the engine is rebuilt.
+    """
+    global _latest
+    version = historical_store_version()
+    with _latest_lock:
+        if _latest is not None and _latest[0] == version:
+            return _latest[1]
+        games = load_historical_data(columns=HISTORICAL_COLUMNS)
+        if games is None:
+            return None
+        engine = _latest[1] if _latest is not None else EloTilt()
+        if engine.last_day is not None:
+            # Games added, removed or re-scored up to the engine's last day: rebuild it
+            settled = games.dropna(subset=["FT_Goals_H", "FT_Goals_A"])
+            rated = settled[_to_days(settled["Date"]) <= engine.last_day]
+            goals = rated["FT_Goals_H"].to_numpy(dtype=float).sum() + rated["FT_Goals_A"].to_numpy(dtype=float).sum()
+            if len(rated) != engine.n_games or goals != engine.goals:
+                engine = EloTilt()
+        engine = engine.advance(games)
+        _latest = (version, engine)
+        return engine
+
+
+def with_point_in_time_ratings(games, columns=RATING_COLUMNS):
+    """`games` with the rating `columns` of each game as of its own date, for backtests without look-ahead."""
+    engine = get_elo_engine()
+    if engine is None:
+        return None
+    return games.join(engine.fixture_ratings(games)[list(columns)])
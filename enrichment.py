@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# Home field advantage (in Elo points) of the fair odds
+HFA = 50 * 0.15
+
+ODDS_COLUMNS = ["FT_Odd_H", "FT_Odd_D", "FT_Odd_A"]
+GEOMETRY_COLUMNS = ["VAR1", "VAR2", "VAR3"]
+ELO_COLUMNS = ["Elo_Home", "Tilt_Home", "Elo_Away", "Tilt_Away"]
+ELO_TILT_COLUMNS = ["Team", "Elo", "Tilt"]
+
+
+def odds_geometry(fixtures):
+    """VAR1 (distance between the home and away odds) and VAR2 / VAR3 (angles, in degrees) of every game."""
+    odd_h, odd_d, odd_a = fixtures.reindex(columns=ODDS_COLUMNS).to_numpy(dtype=float).T
+    return pd.DataFrame({
+        "VAR1": np.abs(odd_h - odd_a),
+        "VAR2": np.degrees(np.arctan((odd_a - odd_h) / 2)),
+        "VAR3": np.degrees(np.arctan((odd_d - odd_a) / 2)),
+    }, index=fixtures.index)
+
+
+def team_ratings(fixtures, elo_tilt):
+    """Elo and Tilt of the home and away team of every game, looked up by team name (NaN for unknown teams)."""
+    ratings = elo_tilt[ELO_TILT_COLUMNS].drop_duplicates("Team").set_index("Team")
+    home = ratings.reindex(fixtures["Home"].to_numpy())
+    away = ratings.reindex(fixtures["Away"].to_numpy())
+    return pd.DataFrame({
+        "Elo_Home": home["Elo"].to_numpy(), "Tilt_Home": home["Tilt"].to_numpy(),
+        "Elo_Away": away["Elo"].to_numpy(), "Tilt_Away": away["Tilt"].to_numpy(),
+    }, index=fixtures.index)
+
+
+def elo_fair_odds(ratings, hfa=HFA):
+    """Elo difference, win probabilities and fair odds of every game from its Elo_Home / Elo_Away."""
+    elo_home = ratings["Elo_Home"].to_numpy(dtype=float)
+    elo_away = ratings["Elo_Away"].to_numpy(dtype=float)
+    dr = (elo_home + hfa) - elo_away
+    p_home = 1 / (10 ** (-dr / 400) + 1)
+    return pd.DataFrame({
+        "Elo_Difference": elo_home - elo_away,
+        "dr": dr,
+        "P_Home": p_home,
+        "P_Away": 1 - p_home,
+        "Odd_Home_Justa": (1 / p_home).round(2),
+        "Odd_Away_Justa": (1 / (1 - p_home)).round(2),
+    }, index=ratings.index)
+
+
+def enrich_fixtures(fixtures, elo_tilt=None):
+    """
+    Derived columns of the day's games: the odds geometry always, and the Elo / Tilt ratings with the
+    Elo fair odds when ratings are available (from the daily file itself, or else from `elo_tilt`).
+    """
+    columns = [odds_geometry(fixtures)]
+    if set(ELO_COLUMNS[::2]).issubset(fixtures.columns):
+        ratings = fixtures[ELO_COLUMNS[::2]]
+    elif elo_tilt is not None:
+        ratings = team_ratings(fixtures, elo_tilt)
+        columns.append(ratings)
+    else:
+        ratings = None
+    if ratings is not None:
+        columns.append(elo_fair_odds(ratings))
+    return pd.concat(columns, axis=1)
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _cached_enrichment(fixtures, elo_tilt):
+    return enrich_fixtures(fixtures, elo_tilt)
+
+
+def day_enrichment(data, elo_tilt_data=None):
+    """
+    Derived columns of the day's games, computed once per (daily file, Elo & Tilt file) and shared by every tab.
+    Only the columns they are computed from are hashed for the cache key.
+    """
+    fixtures = data[["Home", "Away"] + [col for col in ODDS_COLUMNS + ELO_COLUMNS[::2] if col in data.columns]]
+    elo_tilt = elo_tilt_data[ELO_TILT_COLUMNS] if elo_tilt_data is not None else None
+    return _cached_enrichment(fixtures, elo_tilt)
+
+
+def enrich_day(data, elo_tilt_data=None):
+    """`data` with the derived columns of day_enrichment() joined (columns the daily file already has are kept)."""
+    derived = day_enrichment(data, elo_tilt_data)
+    return data.join(derived.drop(columns=derived.columns.intersection(data.columns)))
@@ -0,0 +1,65 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+
+# Função para parsear intervalos
+def parse_interval(interval):
+    """Converte uma string de intervalo ('<=X', '>=X', 'A - B') para um par de valores numéricos."""
+    interval = interval.strip().replace(" ", "")  # Remover espaços extras
+
+    if interval.startswith("<="):
+        return (-float('inf'), float(interval[2:]))  # Exemplo: '<=0.2000' → (-inf, 0.2000)
+    elif interval.startswith(">="):
+        return (float(interval[2:]), float('inf'))  # Exemplo: '>=0.4001' → (0.4001, inf)
+    elif "-" in interval:
+        limites = [float(x) for x in interval.split("-")]
+        return (limites[0], limites[1])  # Exemplo: '0.2001 - 0.4000' → (0.2001, 0.4000)
+    else:
+        raise ValueError(f"Formato de intervalo desconhecido: {interval}")
+
+
+def _compile_axis(labels):
+    """Turns interval labels into sorted bin edges plus the original position of each bin."""
+    bounds = np.array([parse_interval(label) for label in labels], dtype=float)
+    order = np.argsort(bounds[:, 0], kind="stable")
+    lows, highs = bounds[order, 0], bounds[order, 1]
+    if np.any(lows[1:] <= highs[:-1]):
+        raise ValueError(f"Intervalos sobrepostos: {list(labels)}")
+    return {"lows": lows, "highs": highs, "positions": order}
+
+
+def _bin(axis, values):
+    """Index of the interval that contains each value, or -1 if none does."""
+    values = np.asarray(values)
+    # float32 columns are compared with edges rounded the same way, as pandas would compare them
+    dtype = np.float32 if values.dtype == np.float32 else np.float64
+    values = values.astype(dtype, copy=False)
+    lows, highs = axis["lows"].astype(dtype), axis["highs"].astype(dtype)
+    idx = np.searchsorted(lows, values, side="right") - 1
+    safe_idx = np.clip(idx, 0, None)
+    inside = (idx >= 0) & (values <= highs[safe_idx])
+    return np.where(inside, axis["positions"][safe_idx], -1)
+
+
+@st.cache_data(show_spinner=False)
+def compile_reference_table(df_referencias):
+    """Compiles a df_referencias table (CV intervals x FT_Odd_H intervals) into numeric bin edges."""
+    return {
+        "rows": _compile_axis(df_referencias.index),
+        "columns": _compile_axis(df_referencias.columns),
+        "values": df_referencias.to_numpy(dtype=object),
+    }
+
+
+def lookup_reference(compiled, cv_mo_ft, ft_odd_h):
+    """
+    Determina a referência de cada jogo com base nos intervalos de CV_Match_Odds e FT_Odd_H.
+    Jogos fora de todos os intervalos (ou com valores em falta) ficam com None.
+    """
+    rows = _bin(compiled["rows"], pd.to_numeric(cv_mo_ft, errors="coerce"))
+    cols = _bin(compiled["columns"], pd.to_numeric(ft_odd_h, errors="coerce"))
+    found = (rows >= 0) & (cols >= 0)
+    result = np.full(len(rows), None, dtype=object)
+    result[found] = compiled["values"][rows[found], cols[found]]
+    return result
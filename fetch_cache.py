@@ -0,0 +1,240 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+import requests
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+from dataset_registry import get_shared_frame
+from schemas import read_csv, schema_for
+
+# On-disk cache for the CSV files served from GitHub
+CACHE_DIR = os.getenv("FLUFFY_HTTP_CACHE_DIR", os.path.join(os.getcwd(), ".cache", "http"))
+MAX_CACHE_BYTES = int(os.getenv("FLUFFY_HTTP_CACHE_MB", "512")) * 1024 * 1024
+
+# Time (in seconds) a cached file is served before it is revalidated with the server
+HISTORICAL_TTL = 60 * 60  # df_base_original.csv
+DAILY_TTL = 5 * 60  # jogos_do_dia files
+REFERENCE_TTL = 60 * 60  # df_ligas.csv, df_elo_tilt.csv
+
+REQUEST_TIMEOUT = 30
+# Longest time (in seconds) a page waits for each source of a concurrent load
+SOURCE_TIMEOUT = float(os.getenv("FLUFFY_SOURCE_TIMEOUT", "45"))
+CHUNK_SIZE = 1024 * 1024
+# last_access only orders the eviction, so a cache hit writes it at most once per ACCESS_INTERVAL seconds
+ACCESS_INTERVAL = 60
+
+# One lock per URL so the same file is never downloaded twice at once
+_url_locks = defaultdict(threading.Lock)
+_url_locks_guard = threading.Lock()
+_evict_lock = threading.Lock()
+
+
+def _url_lock(url):
+    with _url_locks_guard:
+        return _url_locks[url]
+
+
+def _key(url):
+    return hashlib.sha1(url.encode()).hexdigest()
+
+
+def _paths(url):
+    key = _key(url)
+    return os.path.join(CACHE_DIR, f"{key}.json"), os.path.join(CACHE_DIR, f"{key}.body")
+
+
+def _read_meta(meta_path):
+    try:
+        with open(meta_path, "r") as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+
+
+def _write_meta(meta_path, meta):
+    tmp_path = meta_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(meta, f)
+    os.replace(tmp_path, meta_path)
+
+
+def _touch(meta_path, meta, force=False):
+    """Records an access; the meta file is only re-written if it changed (`force`) or last_access is old."""
+    now = time.time()
+    if force or now - meta.get("last_access", 0) >= ACCESS_INTERVAL:
+        meta["last_access"] = now
+        _write_meta(meta_path, meta)
+    return meta
+
+
+def _evict(keep=None):
+    """
+    Removes the least recently used files until the cache fits in MAX_CACHE_BYTES.
+    The entry of `keep` (the URL just fetched) and entries another thread is fetching are never removed.
+    """
+    with _evict_lock:
+        entries = []
+        for name in os.listdir(CACHE_DIR):
+            if name.endswith(".json"):
+                meta = _read_meta(os.path.join(CACHE_DIR, name))
+                if meta is not None:
+                    entries.append((meta.get("last_access", 0), meta.get("size", 0), name[:-5], meta.get("url")))
+
+        total = sum(size for _, size, _, _ in entries)
+        for _, size, key, url in sorted(entries):
+            if total <= MAX_CACHE_BYTES:
+                break
+            if url is None or url == keep:
+                continue
+            lock = _url_lock(url)
+            if not lock.acquire(blocking=False):
+                continue
+            try:
+                for ext in (".json", ".body"):
+                    try:
+                        os.remove(os.path.join(CACHE_DIR, key + ext))
+                    except FileNotFoundError:
+                        pass
+            finally:
+                lock.release()
+            total -= size
+
+
+def fetch(url, ttl=DAILY_TTL):
+    """
+    Returns the cache entry for `url` ({"path", "version", ...}) or None if the file does not exist.
+    Fresh entries are served from disk; stale ones are revalidated with ETag/If-Modified-Since.
+    """
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    meta_path, body_path = _paths(url)
+
+    with _url_lock(url):
+        meta = _read_meta(meta_path)
+        if meta is not None and not os.path.exists(body_path):
+            meta = None
+
+        if meta is not None and time.time() - meta["fetched_at"] < ttl:
+            return _touch(meta_path, meta)
+
+        headers = {}
+        if meta is not None:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        try:
+            response = requests.get(url, headers=headers, stream=True, timeout=REQUEST_TIMEOUT)
+        except requests.RequestException:
+            # Serve the stale copy if the server can't be reached
+            if meta is not None:
+                return _touch(meta_path, meta)
+            raise
+
+        with response:
+            if response.status_code == 304 and meta is not None:
+                meta["fetched_at"] = time.time()
+                return _touch(meta_path, meta, force=True)
+
+            if response.status_code == 404:
+                return None
+
+            response.raise_for_status()
+
+            # Stream the body to disk so the file is downloaded only once
+            tmp_path = body_path + ".tmp"
+            size = 0
+            digest = hashlib.sha1()
+            with open(tmp_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=CHUNK_SIZE):
+                    f.write(chunk)
+                    digest.update(chunk)
+                    size += len(chunk)
+            os.replace(tmp_path, body_path)
+
+            now = time.time()
+            meta = {
+                "url": url,
+                "path": body_path,
+                "version": digest.hexdigest(),
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "size": size,
+                "fetched_at": now,
+                "last_access": now,
+            }
+            _write_meta(meta_path, meta)
+
+    _evict(keep=url)
+    return meta
+
+
+def load_csv(url, ttl=DAILY_TTL, columns=None):
+    """
+    Returns the CSV at `url` as a read-only DataFrame view, or None if the file does not exist.
+    Each version of a file is parsed once per process, with the dtypes of its schema, and shared
+    by every session. Pass `columns` to get only the columns the caller uses.
+    """
+    entry = fetch(url, ttl=ttl)
+    if entry is None:
+        return None
+    try:
+        shared = _shared_csv(url, entry)
+    except FileNotFoundError:
+        # The body was evicted by another thread between fetch() and the parse: download it again
+        entry = fetch(url, ttl=0)
+        if entry is None:
+            return None
+        shared = _shared_csv(url, entry)
+    return shared.view(columns)
+
+
+def _shared_csv(url, entry):
+    # `version` changes only when the body changes, so a revalidated file is never re-parsed
+    return get_shared_frame(("csv", url), entry["version"], lambda: read_csv(entry["path"], schema_for(url)))
+
+
+def source_version(url, ttl=DAILY_TTL):
+    """Version of the file at `url` (a hash of its body), or None if it does not exist. Used to key derived results."""
+    try:
+        entry = fetch(url, ttl=ttl)
+    except requests.RequestException:
+        return None
+    return entry["version"] if entry is not None else None
+
+
+def load_concurrently(loaders, timeouts=None, default_timeout=SOURCE_TIMEOUT):
+    """
+    Runs every loader of `loaders` ({name: function}) at the same time, each one downloading and
+    parsing its source in its own thread, so a cold load takes about as long as the slowest source.
+    Returns {name: result}; a loader that fails or exceeds its timeout gets the exception instead.
+    A timed-out loader keeps running in the background and still fills the caches for the next run.
+    """
+    timeouts = timeouts or {}
+    # Loaders may call st.* functions, so the threads run within the calling session
+    ctx = get_script_run_ctx()
+
+    def run(loader):
+        if ctx is not None:
+            add_script_run_ctx(ctx=ctx)
+        return loader()
+
+    pool = ThreadPoolExecutor(max_workers=max(1, len(loaders)), thread_name_prefix="fetch")
+    try:
+        started = time.monotonic()
+        futures = {name: pool.submit(run, loader) for name, loader in loaders.items()}
+        results = {}
+        for name, future in futures.items():
+            timeout = timeouts.get(name, default_timeout)
+            try:
+                results[name] = future.result(timeout=max(0.0, started + timeout - time.monotonic()))
+            except FutureTimeoutError:
+                results[name] = TimeoutError(f"{name} took more than {timeout:.0f}s")
+            except Exception as e:
+                results[name] = e
+        return results
+    finally:
+        pool.shutdown(wait=False)
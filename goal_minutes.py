@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+
+GOAL_MINUTES_COLUMNS = ["Goals_Minutes_Home", "Goals_Minutes_Away"]
+
+# Time segments used by the goal distribution charts
+SEGMENT_EDGES = np.array([0, 15, 30, 45, 60, 75, 90])
+SEGMENT_LABELS = ["0-15", "15-30", "30-45", "45-60", "60-75", "75-90"]
+FIRST_HALF = SEGMENT_LABELS[:3]
+SECOND_HALF = SEGMENT_LABELS[3:]
+
+NO_GOAL = np.iinfo(np.int16).max
+
+
+class GoalMinutes:
+    """
+    Goal minutes of many matches in a ragged, array-backed form:
+    the goals of match i are minutes[offsets[i]:offsets[i + 1]].
+    """
+
+    def __init__(self, offsets, minutes):
+        self.offsets = offsets
+        self.minutes = minutes
+
+    @classmethod
+    def from_series(cls, goals_minutes):
+        """
+        Parses a Goals_Minutes_* column ("[12, 45, 78]" per match) in one vectorised pass.
+        Missing values count as matches without goals; stoppage time ("45+2") keeps the base minute.
+        """
+        goals_minutes = pd.Series(goals_minutes).reset_index(drop=True)
+        found = goals_minutes.astype("string").str.extractall(r"(\d+)(?:\s*\+\s*\d+)?")
+        counts = np.bincount(found.index.get_level_values(0), minlength=len(goals_minutes))
+        offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+        minutes = found[0].to_numpy(dtype=np.int16)
+        return cls(offsets, minutes)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def counts(self):
+        """Number of goals of each match."""
+        return np.diff(self.offsets)
+
+    def take(self, rows):
+        """Returns the matches at positions `rows` as a new GoalMinutes."""
+        rows = np.asarray(rows, dtype=np.int64)
+        starts, ends = self.offsets[rows], self.offsets[rows + 1]
+        counts = ends - starts
+        offsets = np.concatenate([[0], np.cumsum(counts)]).astype(np.int64)
+        # Position of every selected goal in self.minutes
+        gather = np.repeat(starts - offsets[:-1], counts) + np.arange(offsets[-1])
+        return GoalMinutes(offsets, self.minutes[gather])
+
+    def segment_counts(self):
+        """Total goals per time segment ("0-15" ... "75-90"), goals outside 0-90 are ignored."""
+        segments = np.searchsorted(SEGMENT_EDGES, self.minutes, side="right") - 1
+        valid = (self.minutes >= SEGMENT_EDGES[0]) & (self.minutes < SEGMENT_EDGES[-1])
+        totals = np.bincount(segments[valid], minlength=len(SEGMENT_LABELS))
+        return dict(zip(SEGMENT_LABELS, totals.tolist()))
+
+    def first_minutes(self):
+        """Minute of the first goal of each match (NO_GOAL if the match had none)."""
+        first = np.full(len(self), NO_GOAL, dtype=np.int16)
+        has_goals = self.counts() > 0
+        if has_goals.any():
+            first[has_goals] = np.minimum.reduceat(self.minutes, self.offsets[:-1][has_goals])
+        return first
+
+
+def half_totals(segment_counts):
+    """Splits per-segment totals into (first half, second half)."""
+    return (
+        sum(segment_counts[segment] for segment in FIRST_HALF),
+        sum(segment_counts[segment] for segment in SECOND_HALF),
+    )
+
+
+def first_goal_counts(scored, conceded):
+    """Returns (matches where the team scored first, matches where it conceded first)."""
+    first_scored = scored.first_minutes()
+    first_conceded = conceded.first_minutes()
+    scored_first = (first_scored != NO_GOAL) & (first_scored < first_conceded)
+    conceded_first = (first_conceded != NO_GOAL) & (first_scored >= first_conceded)
+    return int(scored_first.sum()), int(conceded_first.sum())
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+from data_store import historical_store_version, load_historical_data
+
+H2H_COLUMNS = ["Home", "Away", "FT_Goals_H", "FT_Goals_A"]
+
+
+def build_h2h_index(historical_data):
+    """
+    Counts how many times each scoreline happened for every (Home, Away) pairing.
+    Returns a Series indexed by (FT_Goals_H, FT_Goals_A, Home, Away), sorted for fast lookups.
+    """
+    scores = historical_data[H2H_COLUMNS].dropna()
+    counts = scores.groupby(["FT_Goals_H", "FT_Goals_A", "Home", "Away"], observed=True).size()
+    return counts.sort_index()
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def _cached_h2h_index(version):
+    historical_data = load_historical_data(columns=H2H_COLUMNS)
+    if historical_data is None:
+        return None
+    return build_h2h_index(historical_data)
+
+
+def get_h2h_index():
+    """Returns the h2h index of the current historical data version, built once and shared by all sessions."""
+    return _cached_h2h_index(historical_store_version())
+
+
+def h2h_score_counts(h2h_index, games, home_goals, away_goals):
+    """Returns, for each row of `games`, how many past Home x Away games ended home_goals x away_goals."""
+    if h2h_index is None or games.empty:
+        return np.zeros(len(games), dtype=int)
+    try:
+        by_pairing = h2h_index.xs((home_goals, away_goals), level=["FT_Goals_H", "FT_Goals_A"])
+    except KeyError:
+        return np.zeros(len(games), dtype=int)
+    keys = pd.MultiIndex.from_arrays([games["Home"], games["Away"]])
+    return by_pairing.reindex(keys, fill_value=0).to_numpy()
+
+
+def h2h_score_happened(h2h_index, games, home_goals, away_goals):
+    """1 if the scoreline ever happened in the pairing of each row of `games`, else 0."""
+    return (h2h_score_counts(h2h_index, games, home_goals, away_goals) > 0).astype(int)
@@ -0,0 +1,79 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+# Games per team (home and away) used to rank the attacks and defences of a league
+GOLEADA_GAMES = 21
+
+RESULT_COLUMNS = [
+    "League", "Time", "Home", "Away", "FT_Odd_H", "FT_Odd_D", "FT_Odd_A", "CV_Match_Type",
+    "Perc_Over25FT_Home", "Perc_Over25FT_Away", "Perc_goleada_casa_H", "Perc_goleada_casa_A", "Poisson_Odd_CS_Other_Home",
+]
+
+
+def league_team_sets(games, n_games=GOLEADA_GAMES):
+    """
+    Top scoring and weak defence teams of one league (`games` date-sorted, oldest first).
+    Each team's last `n_games` home games and last `n_games` away games are kept; teams with at least `n_games`
+    of them qualify, and only games between qualifying teams count. The half of the qualifying teams that
+    scored the most, and the half that conceded the least, are returned as (top_scoring, weak_defense).
+    """
+    home = games["Home"].astype(str).to_numpy()
+    away = games["Away"].astype(str).to_numpy()
+    teams, codes = np.unique(np.concatenate([home, away]), return_inverse=True)
+    home_codes, away_codes = codes[:len(games)], codes[len(games):]
+    goals_h = games["FT_Goals_H"].to_numpy(dtype=float)
+    goals_a = games["FT_Goals_A"].to_numpy(dtype=float)
+
+    # Last n games of each team at each venue: position counted from the newest game
+    recent = (
+        (pd.Series(home_codes).groupby(home_codes).cumcount(ascending=False).to_numpy() < n_games)
+        | (pd.Series(away_codes).groupby(away_codes).cumcount(ascending=False).to_numpy() < n_games)
+    )
+    n_teams = len(teams)
+    played = np.bincount(home_codes[recent], minlength=n_teams) + np.bincount(away_codes[recent], minlength=n_teams)
+    valid = played >= n_games
+    kept = recent & valid[home_codes] & valid[away_codes]
+    if not kept.any():
+        return frozenset(), frozenset()
+
+    h, a = home_codes[kept], away_codes[kept]
+    scored = np.bincount(h, np.nan_to_num(goals_h[kept]), n_teams) + np.bincount(a, np.nan_to_num(goals_a[kept]), n_teams)
+    conceded = np.bincount(h, np.nan_to_num(goals_a[kept]), n_teams) + np.bincount(a, np.nan_to_num(goals_h[kept]), n_teams)
+    present = np.flatnonzero(np.bincount(h, minlength=n_teams) + np.bincount(a, minlength=n_teams))
+
+    # Ties keep the alphabetical order of the teams
+    size = max(1, int(valid.sum()) // 2)
+    top_scoring = present[np.argsort(-scored[present], kind="stable")][:size]
+    weak_defense = present[np.argsort(conceded[present], kind="stable")][:size]
+    return frozenset(teams[top_scoring]), frozenset(teams[weak_defense])
+
+
+@st.cache_data(max_entries=512, show_spinner=False)
+def _cached_team_sets(_team_index, league, last_day, league_rows, league_goals):
+    return league_team_sets(_team_index.league_games(league))
+
+
+def goleada_team_sets(team_index, league):
+    """
+    Team sets of `league`, computed once and kept until the league's results change: the cache key is the
+    league's last game day, number of games and total goals, not the version of the whole base.
+    """
+    games = team_index.league_games(league)
+    if games.empty:
+        return frozenset(), frozenset()
+    goals = np.nansum(games["FT_Goals_H"].to_numpy(dtype=float)) + np.nansum(games["FT_Goals_A"].to_numpy(dtype=float))
+    return _cached_team_sets(team_index, str(league), int(team_index.days[games.index[-1]]), len(games), float(goals))
+
+
+def goleada_candidates(df_LGP, team_index):
+    """Games of df_LGP whose two teams are both among the top scoring and the weak defence teams of their league."""
+    matches = np.zeros(len(df_LGP), dtype=bool)
+    leagues = df_LGP["League"].astype(str).to_numpy()
+    home = df_LGP["Home"].astype(str)
+    away = df_LGP["Away"].astype(str)
+    for league in pd.unique(leagues):
+        top_scoring, weak_defense = goleada_team_sets(team_index, league)
+        teams = list(top_scoring & weak_defense)
+        matches |= (leagues == league) & home.isin(teams).to_numpy() & away.isin(teams).to_numpy()
+    return df_LGP[matches].reindex(columns=RESULT_COLUMNS)
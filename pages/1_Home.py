@@ -6,6 +6,8 @@ import os
 from datetime import datetime
 from auth import logout
 from sidebar_menu import show_role_features
+from static_assets import show_static_image
+from fetch_cache import DAILY_TTL, load_csv
 
 
 st.set_page_config(page_title="Home - Fluffy Chips Web Analyser", page_icon="🏠", layout="wide")
@@ -18,7 +20,7 @@ st.subheader('The place where you can Analyse Football Matches!!!')
 st.divider()
 
 # Load image properly
-st.image("static/tatics.jpg")  # ✅ Fixed image path
+show_static_image("tatics.jpg")
 st.divider()
 
 # Welcome message
@@ -40,12 +42,10 @@ csv_file_url = github_base_url + csv_file_name
 
 # Load CSV file
 try:
-    response = requests.get(csv_file_url)
+    # Load CSV into DataFrame through the shared fetch cache
+    data = load_csv(csv_file_url, ttl=DAILY_TTL)
 
-    if response.status_code == 200:
-        # Load CSV into DataFrame
-        data = pd.read_csv(csv_file_url)
-        
+    if data is not None:
         # Remove irrelevant columns
         columns_to_remove = ['Unnamed: 0.1', 'Unnamed: 0', 'Id']
         filtered_data = data.drop(columns=[col for col in columns_to_remove if col in data.columns], errors='ignore')
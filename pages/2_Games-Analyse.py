@@ -5,13 +5,20 @@ import streamlit as st
 from PIL import Image
 from scipy.stats import poisson
 import os
-import base64
 from datetime import datetime
 import matplotlib.pyplot as plt
 import numpy as np
 from auth import logout
 from sidebar_menu import show_role_features
-import ast
+from fetch_cache import DAILY_TTL, REFERENCE_TTL, load_csv
+from team_index import get_team_index
+from data_store import historical_store_version
+from chart_cache import chart_cache_stats, show_chart
+from static_assets import show_static_image
+from dixon_coles import expected_goals as dixon_coles_xg, load_parameters as load_dixon_coles
+from scoreline_model import fair_odds_table
+from chart_specs import bar_chart, grouped_bar_chart, line_chart, pie_chart
+from goal_minutes import first_goal_counts, half_totals
 
 # Set up the Streamlit page configuration
 st.set_page_config(page_title="Games Analyser - Fluffy Chips Web Analyser", page_icon="📽️", layout="wide")
@@ -31,36 +38,43 @@ st.markdown(f"Your role: **{st.session_state['role']}**")
 st.divider()
 
 # Display the image
-image_path = os.path.join(os.getcwd(), 'static', 'analises002.png')
-st.markdown(
-    f"""
-    <div style="text-align: center;">
-        <img src="data:image/png;base64,{base64.b64encode(open(image_path, "rb").read()).decode()}" alt="Analysis" width="100%">
-    </div>
-    """,
-    unsafe_allow_html=True
-)
+show_static_image('analises002.png', alt="Analysis")
 st.divider()
 
 # Base URL for GitHub CSV files
 github_base_url = "https://raw.githubusercontent.com/RedLegacy227/jogos_do_dia_com_variaveis/main/"
 
-# Function to load data from a URL
-def load_data(url):
+# Columns this page reads from the daily games file and from the historical base
+daily_columns = [
+    'League', 'Home', 'Away',
+    'Avg_Corners_InFavor_H', 'Avg_Corners_Against_H', 'Avg_Corners_InFavor_A', 'Avg_Corners_Against_A',
+    'Avg_Shots_OnTarget_InFavor_H', 'Avg_Shots_OnTarget_Against_H', 'Avg_Shots_OnTarget_InFavor_A', 'Avg_Shots_OnTarget_Against_A',
+    'Avg_Shots_OnTarget_per_Goal_InFavor_H', 'Avg_Shots_OnTarget_per_Goal_Against_H',
+    'Avg_Shots_OnTarget_per_Goal_InFavor_A', 'Avg_Shots_OnTarget_per_Goal_Against_A',
+    'Avg_Goal_Attempts_per_Goal_InFavor_H', 'Avg_Goal_Attempts_per_Goal_Against_H',
+    'Avg_Goal_Attempts_per_Goal_InFavor_A', 'Avg_Goal_Attempts_per_Goal_Against_A',
+    'Avg_Yellow_Cards_H', 'Avg_Yellow_Cards_A', 'Avg_Red_Cards_H', 'Avg_Red_Cards_A'
+]
+required_columns = [
+    'Date', 'League', 'Season', 'Home', 'Away', 'HT_Goals_H', 'HT_Goals_A', 'FT_Goals_H', 'FT_Goals_A', 'FT_Odd_H', 'FT_Odd_D', 'FT_Odd_A', 'FT_Odd_Over25', 'Odd_BTTS_Yes', 'Goals_Minutes_Home', 'Goals_Minutes_Away'
+]
+
+# Function to load data from a URL through the shared fetch cache
+def load_data(url, ttl=DAILY_TTL, columns=None):
     try:
-        data = pd.read_csv(url)
+        data = load_csv(url, ttl=ttl, columns=columns)
+        if data is None:
+            st.error(f"File not found: {url}")
         return data
     except Exception as e:
         st.error(f"Failed to load data from {url}: {e}")
         return None
 
 # Function to filter data based on date and league
-def filter_data(data, date, league):
+def filter_data(team_index, date, league):
     try:
-        filtered_data = data[
-            (data['Date'] < pd.to_datetime(date)) &
-            (data['League'] == league)
-        ]
+        # The league is a contiguous, date-sorted slice of the index, cut at the date by binary search
+        filtered_data = team_index.league_games(league, before=date)
         if filtered_data.empty:
             raise ValueError("No historical data available for the selected date and league.")
         return filtered_data
@@ -69,25 +83,8 @@ def filter_data(data, date, league):
         return None
 
 # Function to count goals per time segment
-def count_goals(goals_list):
-    time_segments = {"0-15": 0, "15-30": 0, "30-45": 0, "45-60": 0, "60-75": 0, "75-90": 0}
-    for goals in goals_list:
-        if isinstance(goals, str):
-            goal_times = ast.literal_eval(goals)
-            for minute in goal_times:
-                if 0 <= minute < 15:
-                    time_segments["0-15"] += 1
-                elif 15 <= minute < 30:
-                    time_segments["15-30"] += 1
-                elif 30 <= minute < 45:
-                    time_segments["30-45"] += 1
-                elif 45 <= minute < 60:
-                    time_segments["45-60"] += 1
-                elif 60 <= minute < 75:
-                    time_segments["60-75"] += 1
-                elif 75 <= minute < 90:
-                    time_segments["75-90"] += 1
-    return time_segments
+def count_goals(goal_minutes):
+    return goal_minutes.segment_counts()
 
 # Function to plot goal distribution
 def plot_goal_distribution(team_name, goals, conceded):
@@ -106,28 +103,8 @@ def plot_goal_distribution(team_name, goals, conceded):
     st.pyplot(fig)
 
 # Function to count first goal occurrences
-def count_first_goal(goals_scored_list, goals_conceded_list):
-    count_scored_first = 0
-    count_conceded_first = 0
-
-    for goals_scored, goals_conceded in zip(goals_scored_list, goals_conceded_list):
-        try:
-            scored_times = ast.literal_eval(goals_scored) if isinstance(goals_scored, str) else []
-            conceded_times = ast.literal_eval(goals_conceded) if isinstance(goals_conceded, str) else []
-        except (SyntaxError, ValueError):
-            continue  # Skip invalid entries
-
-        if scored_times and conceded_times:  # Both teams scored
-            if min(scored_times) < min(conceded_times):
-                count_scored_first += 1  # Team scored first
-            else:
-                count_conceded_first += 1  # Team conceded first
-        elif scored_times:  # Only this team scored
-            count_scored_first += 1
-        elif conceded_times:  # Only the opponent scored
-            count_conceded_first += 1
-
-    return count_scored_first, count_conceded_first
+def count_first_goal(goals_scored, goals_conceded):
+    return first_goal_counts(goals_scored, goals_conceded)
 
 # Main application logic
 try:
@@ -139,10 +116,11 @@ try:
     csv_file_name = f'df_jogos_do_dia_{formatted_date}.csv'
     csv_file_url = github_base_url + csv_file_name
 
-    # Load the CSV data
+    # Keep only the columns of the daily file this page uses; metrics whose columns the file lacks are not shown
     data = load_data(csv_file_url)
     if data is None:
         st.stop()  # Stop the app if data loading fails
+    data = data[[col for col in daily_columns if col in data.columns]]
 
     if "Home" not in data.columns or "Away" not in data.columns:
         raise ValueError("CSV file is missing required columns 'Home' or 'Away'.")
@@ -160,29 +138,37 @@ try:
     # Determine the league based on the selected game
     selected_league = data[data['Home'] == selected_home].iloc[0]['League']
 
-    # Load historical data
-    historical_data_url = "https://raw.githubusercontent.com/RedLegacy227/main_data_base/refs/heads/main/df_base_original.csv"
-    historical_data = load_data(historical_data_url)
-    if historical_data is None:
+    # Per-team, per-venue index of the selected league only, built from that league's slice of the store once per data version
+    team_index = get_team_index(leagues=[selected_league])
+    if team_index is None:
         st.stop()  # Stop the app if historical data loading fails
 
-    historical_data['Date'] = pd.to_datetime(historical_data["Date"])
+    # Charts are rasterised by matplotlib on the server (and cached), or sent as Vega-Lite specs drawn by the browser
+    chart_mode = st.radio("Chart rendering:", ["Matplotlib", "Vega-Lite"], horizontal=True)
+
+    # Rendered charts are cached by chart type, team(s), league, date cutoff and data version
+    chart_key = (selected_league, formatted_date, historical_store_version())
+
+    # Function to draw a chart in the selected mode: `build` draws the matplotlib figure, `spec` the Vega-Lite spec
+    def draw_chart(key, build, spec):
+        if chart_mode == "Vega-Lite":
+            st.vega_lite_chart(spec(), width="stretch")
+        else:
+            show_chart(key + chart_key, build)
 
-    # Filter historical data by date and league
-    filtered_data = filter_data(historical_data, formatted_date, selected_league)
+    # Games of the league before the selected date
+    filtered_data = filter_data(team_index, formatted_date, selected_league)
     if filtered_data is None:
         st.stop()  # Stop the app if filtering fails
 
-    required_columns = [
-        'Date', 'League', 'Season', 'Home', 'Away', 'HT_Goals_H', 'HT_Goals_A', 'FT_Goals_H', 'FT_Goals_A', 'FT_Odd_H', 'FT_Odd_D', 'FT_Odd_A', 'FT_Odd_Over25', 'Odd_BTTS_Yes', 'Goals_Minutes_Home', 'Goals_Minutes_Away'
-    ]
-
     if not all(col in filtered_data.columns for col in required_columns):
         raise ValueError("Historical data is missing required columns.")
 
-    filtered_data = filtered_data[
-        (filtered_data["Home"] == selected_home) & (filtered_data["Away"] == selected_away) & (filtered_data['League'] == selected_league)
-    ][required_columns]
+    # Head-to-head games come from the home team's home games only, not from a scan of the league
+    home_games = team_index.last_games(
+        selected_home, None, before=formatted_date, venue="Home", league=selected_league, newest_first=False
+    )
+    filtered_data = home_games[home_games["Away"] == selected_away][required_columns]
 
     if not filtered_data.empty:
         st.markdown(f"#### Past Games Between ***{selected_home}*** and ***{selected_away}*** ####")
@@ -201,32 +187,40 @@ try:
             sizes = [home_wins, draws, away_wins]
             colors = ['darkgreen', 'cyan', 'orange']
 
-            fig1, ax1 = plt.subplots(figsize=(10, 10))
-            wedges, texts, autotexts = ax1.pie(
-                sizes,
-                autopct='%1.1f%%',
-                startangle=90,
-                colors=colors,
-                textprops=dict(color="white", weight="bold", fontsize=40)
-            )
-            ax1.axis('equal')
-            ax1.set_title("Final Result", fontsize=20)
-            ax1.legend(
-                wedges, labels, title="Results", loc="center left", bbox_to_anchor=(1, 0, 0.5, 1), fontsize=20
-            )
-            st.pyplot(fig1)
+            def h2h_results_chart():
+                fig1, ax1 = plt.subplots(figsize=(10, 10))
+                wedges, texts, autotexts = ax1.pie(
+                    sizes,
+                    autopct='%1.1f%%',
+                    startangle=90,
+                    colors=colors,
+                    textprops=dict(color="white", weight="bold", fontsize=40)
+                )
+                ax1.axis('equal')
+                ax1.set_title("Final Result", fontsize=20)
+                ax1.legend(
+                    wedges, labels, title="Results", loc="center left", bbox_to_anchor=(1, 0, 0.5, 1), fontsize=20
+                )
+                return fig1
+            draw_chart(("h2h_results", selected_home, selected_away), h2h_results_chart,
+                       lambda: pie_chart(labels, sizes, colors, "Final Result"))
 
             # Line chart (Odds)
-            fig3, ax3 = plt.subplots(figsize=(10, 6))
-            ax3.plot(filtered_data["Date"], filtered_data["FT_Odd_H"], color='darkgreen', label='FT_Odd_H')
-            ax3.plot(filtered_data["Date"], filtered_data["FT_Odd_D"], color='cyan', label='FT_Odd_D')
-            ax3.plot(filtered_data["Date"], filtered_data["FT_Odd_A"], color='orange', label='FT_Odd_A')
-            ax3.set_xlabel('Date')
-            ax3.set_ylabel('Odds')
-            ax3.legend(fontsize=20)
-            ax3.set_title('Odds Trends', fontsize=20)
-            ax3.grid(True)
-            st.pyplot(fig3)
+            def h2h_odds_chart():
+                fig3, ax3 = plt.subplots(figsize=(10, 6))
+                ax3.plot(filtered_data["Date"], filtered_data["FT_Odd_H"], color='darkgreen', label='FT_Odd_H')
+                ax3.plot(filtered_data["Date"], filtered_data["FT_Odd_D"], color='cyan', label='FT_Odd_D')
+                ax3.plot(filtered_data["Date"], filtered_data["FT_Odd_A"], color='orange', label='FT_Odd_A')
+                ax3.set_xlabel('Date')
+                ax3.set_ylabel('Odds')
+                ax3.legend(fontsize=20)
+                ax3.set_title('Odds Trends', fontsize=20)
+                ax3.grid(True)
+                return fig3
+            draw_chart(("h2h_odds", selected_home, selected_away), h2h_odds_chart, lambda: line_chart(
+                filtered_data["Date"], {col: filtered_data[col] for col in ["FT_Odd_H", "FT_Odd_D", "FT_Odd_A"]},
+                ['darkgreen', 'cyan', 'orange'], "Odds Trends", "Date", "Odds"
+            ))
 
         with col2:
             # Bar chart
@@ -234,21 +228,25 @@ try:
             home_goals = filtered_data["FT_Goals_H"]
             away_goals = filtered_data["FT_Goals_A"]
 
-            fig2, ax2 = plt.subplots(figsize=(10, 6.2))
-            bar_width = 0.35
-            x = np.arange(len(games))
+            def h2h_goals_chart():
+                fig2, ax2 = plt.subplots(figsize=(10, 6.2))
+                bar_width = 0.35
+                x = np.arange(len(games))
 
-            ax2.bar(x - bar_width / 2, home_goals, bar_width, label="Home Goals", color='darkgreen', alpha=0.7)
-            ax2.bar(x + bar_width / 2, away_goals, bar_width, label="Away Goals", color='orange', alpha=0.7)
+                ax2.bar(x - bar_width / 2, home_goals, bar_width, label="Home Goals", color='darkgreen', alpha=0.7)
+                ax2.bar(x + bar_width / 2, away_goals, bar_width, label="Away Goals", color='orange', alpha=0.7)
 
-            ax2.set_xticks(x)
-            ax2.set_xticklabels(games, rotation=45)
-            ax2.set_ylabel("Goals")
-            ax2.set_ylim(0, max(max(home_goals), max(away_goals)) + 1)
-            ax2.set_title("Goals Scored", fontsize=20)
-            ax2.legend(fontsize=20)
+                ax2.set_xticks(x)
+                ax2.set_xticklabels(games, rotation=45)
+                ax2.set_ylabel("Goals")
+                ax2.set_ylim(0, max(max(home_goals), max(away_goals)) + 1)
+                ax2.set_title("Goals Scored", fontsize=20)
+                ax2.legend(fontsize=20)
 
-            st.pyplot(fig2)
+                return fig2
+            draw_chart(("h2h_goals", selected_home, selected_away), h2h_goals_chart, lambda: grouped_bar_chart(
+                games, {"Home Goals": home_goals, "Away Goals": away_goals}, ['darkgreen', 'orange'], "Goals Scored"
+            ))
 
             # Additional statistics
             total_games = len(filtered_data)
@@ -282,11 +280,9 @@ try:
     st.divider()
     
     # Load data for the last 7 games of the home team
-    home_last_7 = historical_data[
-        (historical_data["Home"] == selected_home) &
-        (historical_data['League'] == selected_league) &
-        (historical_data["Date"] <= pd.to_datetime(formatted_date))
-    ].sort_values(by="Date", ascending=False).head(7)
+    home_last_7 = team_index.last_games(
+        selected_home, 7, before=formatted_date, venue="Home", league=selected_league, inclusive=True
+    )
 
     if not home_last_7.empty:
         st.markdown(f"#### Last 7 Games of ***{selected_home}*** - Playing @Home ####")
@@ -310,20 +306,23 @@ try:
             sizes = [home_wins, draws, away_wins]
             colors = ['darkgreen', 'cyan', 'orange']
 
-            fig4, ax4 = plt.subplots(figsize=(10, 9.1))
-            wedges, texts, autotexts = ax4.pie(
-                sizes,
-                autopct='%1.1f%%',
-                startangle=90,
-                colors=colors,
-                textprops=dict(color="white", weight="bold", fontsize=40)
-            )
-            ax4.axis('equal')
-            ax4.set_title(f"{selected_home} - Last 7 Games @Home", fontsize=20)
-            ax4.legend(
-                wedges, labels, title="Results", loc="center left", bbox_to_anchor=(1, 0, 0.5, 1), fontsize=20
-            )
-            st.pyplot(fig4)
+            def home_results_chart():
+                fig4, ax4 = plt.subplots(figsize=(10, 9.1))
+                wedges, texts, autotexts = ax4.pie(
+                    sizes,
+                    autopct='%1.1f%%',
+                    startangle=90,
+                    colors=colors,
+                    textprops=dict(color="white", weight="bold", fontsize=40)
+                )
+                ax4.axis('equal')
+                ax4.set_title(f"{selected_home} - Last 7 Games @Home", fontsize=20)
+                ax4.legend(
+                    wedges, labels, title="Results", loc="center left", bbox_to_anchor=(1, 0, 0.5, 1), fontsize=20
+                )
+                return fig4
+            draw_chart(("last_7_results", selected_home, "Home"), home_results_chart,
+                       lambda: pie_chart(labels, sizes, colors, f"{selected_home} - Last 7 Games @Home"))
 
             # Statistics for the last 7 home games
             total_games_home = len(home_last_7)
@@ -356,26 +355,29 @@ try:
             home_goals = home_last_7["FT_Goals_H"]
             away_goals = home_last_7["FT_Goals_A"]
 
-            fig5, ax5 = plt.subplots(figsize=(10, 6))
-            bar_width = 0.35
-            x = np.arange(len(home_last_7))
-
-            ax5.bar(x - bar_width / 2, home_goals, bar_width, label="Home Goals", color='darkgreen', alpha=0.7)
-            ax5.bar(x + bar_width / 2, away_goals, bar_width, label="Away Goals", color='orange', alpha=0.7)
-            ax5.set_xticks(x)
-            ax5.set_xticklabels(home_last_7["Date"].dt.strftime('%Y-%m-%d'), rotation=45)
-            ax5.set_ylim(0, max(max(home_goals), max(away_goals)) + 1)
-            ax5.set_ylabel("Goals")
-            ax5.set_title("Goals Scored - Home Games", fontsize=20)
-            ax5.legend(fontsize=20)
-            st.pyplot(fig5)
+            def home_goals_chart():
+                fig5, ax5 = plt.subplots(figsize=(10, 6))
+                bar_width = 0.35
+                x = np.arange(len(home_last_7))
+
+                ax5.bar(x - bar_width / 2, home_goals, bar_width, label="Home Goals", color='darkgreen', alpha=0.7)
+                ax5.bar(x + bar_width / 2, away_goals, bar_width, label="Away Goals", color='orange', alpha=0.7)
+                ax5.set_xticks(x)
+                ax5.set_xticklabels(home_last_7["Date"].dt.strftime('%Y-%m-%d'), rotation=45)
+                ax5.set_ylim(0, max(max(home_goals), max(away_goals)) + 1)
+                ax5.set_ylabel("Goals")
+                ax5.set_title("Goals Scored - Home Games", fontsize=20)
+                ax5.legend(fontsize=20)
+                return fig5
+            draw_chart(("last_7_goals", selected_home, "Home"), home_goals_chart, lambda: grouped_bar_chart(
+                home_last_7["Date"], {"Home Goals": home_goals, "Away Goals": away_goals},
+                ['darkgreen', 'orange'], "Goals Scored - Home Games"
+            ))
 
     # Load data for the last 7 games of the away team
-    away_last_7 = historical_data[
-        (historical_data["Away"] == selected_away) &
-        (historical_data['League'] == selected_league) &
-        (historical_data["Date"] <= pd.to_datetime(formatted_date))
-    ].sort_values(by="Date", ascending=False).head(7)
+    away_last_7 = team_index.last_games(
+        selected_away, 7, before=formatted_date, venue="Away", league=selected_league, inclusive=True
+    )
 
     if not away_last_7.empty:
         st.markdown(f"#### Last 7 Games of ***{selected_away}*** - Playing @Away ####")
@@ -399,20 +401,23 @@ try:
             sizes = [home_wins, draws, away_wins]
             colors = ['darkgreen', 'cyan', 'orange']
 
-            fig6, ax6 = plt.subplots(figsize=(10, 9.1))
-            wedges, texts, autotexts = ax6.pie(
-                sizes,
-                autopct='%1.1f%%',
-                startangle=90,
-                colors=colors,
-                textprops=dict(color="white", weight="bold", fontsize=40)
-            )
-            ax6.axis('equal')
-            ax6.set_title(f"{selected_away} - Last 7 Games @Away", fontsize=20)
-            ax6.legend(
-                wedges, labels, title="Results", loc="center left", bbox_to_anchor=(1, 0, 0.5, 1), fontsize=20
-            )
-            st.pyplot(fig6)
+            def away_results_chart():
+                fig6, ax6 = plt.subplots(figsize=(10, 9.1))
+                wedges, texts, autotexts = ax6.pie(
+                    sizes,
+                    autopct='%1.1f%%',
+                    startangle=90,
+                    colors=colors,
+                    textprops=dict(color="white", weight="bold", fontsize=40)
+                )
+                ax6.axis('equal')
+                ax6.set_title(f"{selected_away} - Last 7 Games @Away", fontsize=20)
+                ax6.legend(
+                    wedges, labels, title="Results", loc="center left", bbox_to_anchor=(1, 0, 0.5, 1), fontsize=20
+                )
+                return fig6
+            draw_chart(("last_7_results", selected_away, "Away"), away_results_chart,
+                       lambda: pie_chart(labels, sizes, colors, f"{selected_away} - Last 7 Games @Away"))
 
             # Statistics for the last 7 away games
             total_games_away = len(away_last_7)
@@ -445,29 +450,32 @@ try:
             home_goals = away_last_7["FT_Goals_H"]
             away_goals = away_last_7["FT_Goals_A"]
 
-            fig7, ax7 = plt.subplots(figsize=(10, 6))
-            bar_width = 0.35
-            x = np.arange(len(away_last_7))
-
-            ax7.bar(x - bar_width / 2, home_goals, bar_width, label="Home Goals", color='darkgreen', alpha=0.7)
-            ax7.bar(x + bar_width / 2, away_goals, bar_width, label="Away Goals", color='orange', alpha=0.7)
-            ax7.set_xticks(x)
-            ax7.set_xticklabels(away_last_7["Date"].dt.strftime('%Y-%m-%d'), rotation=45)
-            ax7.set_ylim(0, max(max(home_goals), max(away_goals)) + 1)
-            ax7.set_ylabel("Goals")
-            ax7.set_title("Goals Scored - Away Games", fontsize=20)
-            ax7.legend(fontsize=20)
-            st.pyplot(fig7)
+            def away_goals_chart():
+                fig7, ax7 = plt.subplots(figsize=(10, 6))
+                bar_width = 0.35
+                x = np.arange(len(away_last_7))
+
+                ax7.bar(x - bar_width / 2, home_goals, bar_width, label="Home Goals", color='darkgreen', alpha=0.7)
+                ax7.bar(x + bar_width / 2, away_goals, bar_width, label="Away Goals", color='orange', alpha=0.7)
+                ax7.set_xticks(x)
+                ax7.set_xticklabels(away_last_7["Date"].dt.strftime('%Y-%m-%d'), rotation=45)
+                ax7.set_ylim(0, max(max(home_goals), max(away_goals)) + 1)
+                ax7.set_ylabel("Goals")
+                ax7.set_title("Goals Scored - Away Games", fontsize=20)
+                ax7.legend(fontsize=20)
+                return fig7
+            draw_chart(("last_7_goals", selected_away, "Away"), away_goals_chart, lambda: grouped_bar_chart(
+                away_last_7["Date"], {"Home Goals": home_goals, "Away Goals": away_goals},
+                ['darkgreen', 'orange'], "Goals Scored - Away Games"
+            ))
 
     # Load league statistics
     leagues_url = "https://raw.githubusercontent.com/RedLegacy227/dados_ligas/refs/heads/main/df_ligas.csv"
-    leagues_data = load_data(leagues_url)
+    leagues_data = load_data(leagues_url, ttl=REFERENCE_TTL)
     if leagues_data is None:
         st.stop()  # Stop the app if league data loading fails
     
-    if "League" in historical_data.columns:
-        selected_league = historical_data["League"].iloc[0]
-        league_stats = leagues_data[leagues_data["League"] == selected_league]
+    league_stats = leagues_data[leagues_data["League"] == selected_league]
     
     if not league_stats.empty:
         # Average goals scored and conceded for the league
@@ -477,18 +485,12 @@ try:
         league_avg_gs_home = league_stats["Avg_G_Conceded_Away_Teams"].iloc[0]
     
         # Filter historical data for the home team playing at home in the same league
-        home_league_data = historical_data[
-            (historical_data["League"] == selected_league) &
-            (historical_data["Home"] == selected_home)
-        ]
+        home_league_data = team_index.last_games(selected_home, None, venue="Home", league=selected_league)
         home_goals_scored = home_league_data["FT_Goals_H"].mean()
         home_goals_conceded = home_league_data["FT_Goals_A"].mean()
     
         # Filter historical data for the away team playing away in the same league
-        away_league_data = historical_data[
-            (historical_data["League"] == selected_league) &
-            (historical_data["Away"] == selected_away)
-        ]
+        away_league_data = team_index.last_games(selected_away, None, venue="Away", league=selected_league)
         away_goals_scored = away_league_data["FT_Goals_A"].mean()
         away_goals_conceded = away_league_data["FT_Goals_H"].mean()
     
@@ -530,6 +532,20 @@ try:
             st.markdown(f"#### Expected Goals (xG) ####")
             st.markdown(f"🥅 Expected Goals for ***{selected_home}*** ➡️ ***{xg_home:.2f}***")
             st.markdown(f"🥅 Expected Goals for ***{selected_away}*** ➡️ ***{xg_away:.2f}***")
+
+            # Dixon-Coles xG from the parameters fitted offline (dixon_coles.py), when the league has them
+            dc_xg_home, dc_xg_away, dc_rho = dixon_coles_xg(
+                load_dixon_coles(), [selected_league], [selected_home], [selected_away]
+            )
+            if not np.isnan(dc_xg_home[0]):
+                dc_odds = fair_odds_table(dc_xg_home, dc_xg_away, dc_rho, prefix="").iloc[0]
+                st.markdown(f"#### Dixon-Coles Model ####")
+                st.markdown(f"🥅 Expected Goals for ***{selected_home}*** ➡️ ***{dc_xg_home[0]:.2f}***")
+                st.markdown(f"🥅 Expected Goals for ***{selected_away}*** ➡️ ***{dc_xg_away[0]:.2f}***")
+                st.markdown(
+                    f"⚖️ Fair Odds ➡️ Home ***{dc_odds['H']:.2f}*** | Draw ***{dc_odds['D']:.2f}*** | Away ***{dc_odds['A']:.2f}*** | "
+                    f"Over 2.5 ***{dc_odds['Over25']:.2f}*** | BTTS ***{dc_odds['BTTS_Yes']:.2f}***"
+                )
     
     else:
         st.error("League statistics not found for the selected league.")
@@ -540,77 +556,81 @@ try:
         (data['Away'] == selected_away)
     ]
 
+    # Value of a daily-file metric for the selected game, None if the file doesn't have the column
+    def team_stat(column):
+        return team_data[column].values[0] if column in team_data.columns else None
+
+    def stat_line(label, team, value):
+        if value is not None:
+            st.markdown(f"{label} ***{team}*** ➡️ ***{value:.2f}***")
+
     if not team_data.empty:
-        stats_crn_IF_home = team_data['Avg_Corners_InFavor_H'].values[0]
-        stats_crn_Ag_home = team_data['Avg_Corners_Against_H'].values[0]
-        stats_crn_IF_away = team_data['Avg_Corners_InFavor_A'].values[0]
-        stats_crn_Ag_away = team_data['Avg_Corners_Against_A'].values[0]
-        stats_shots_ot_IF_home = team_data['Avg_Shots_OnTarget_InFavor_H'].values[0]
-        stats_shots_ot_Ag_home = team_data['Avg_Shots_OnTarget_Against_H'].values[0]
-        stats_shots_ot_IF_away = team_data['Avg_Shots_OnTarget_InFavor_A'].values[0]
-        stats_shots_ot_Ag_away = team_data['Avg_Shots_OnTarget_Against_A'].values[0]
-        stats_shots_ot_pG_IF_home = team_data['Avg_Shots_OnTarget_per_Goal_InFavor_H'].values[0]
-        stats_shots_ot_pG_Ag_home = team_data['Avg_Shots_OnTarget_per_Goal_Against_H'].values[0]
-        stats_shots_ot_pG_IF_away = team_data['Avg_Shots_OnTarget_per_Goal_InFavor_A'].values[0]
-        stats_shots_ot_pG_Ag_away = team_data['Avg_Shots_OnTarget_per_Goal_Against_A'].values[0]
-        stats_G_Attempts_pG_IF_home = team_data['Avg_Goal_Attempts_per_Goal_InFavor_H'].values[0]
-        stats_G_Attempts_pG_Ag_home = team_data['Avg_Goal_Attempts_per_Goal_Against_H'].values[0]
-        stats_G_Attempts_pG_IF_away = team_data['Avg_Goal_Attempts_per_Goal_InFavor_A'].values[0]
-        stats_G_Attempts_pG_Ag_away = team_data['Avg_Goal_Attempts_per_Goal_Against_A'].values[0]
-        stats_yellow_cards_home = team_data['Avg_Yellow_Cards_H'].values[0]
-        stats_yellow_cards_away = team_data['Avg_Yellow_Cards_A'].values[0]
-        stats_red_cards_home = team_data['Avg_Red_Cards_H'].values[0]
-        stats_red_cards_away = team_data['Avg_Red_Cards_A'].values[0]
+        stats_crn_IF_home = team_stat('Avg_Corners_InFavor_H')
+        stats_crn_Ag_home = team_stat('Avg_Corners_Against_H')
+        stats_crn_IF_away = team_stat('Avg_Corners_InFavor_A')
+        stats_crn_Ag_away = team_stat('Avg_Corners_Against_A')
+        stats_shots_ot_IF_home = team_stat('Avg_Shots_OnTarget_InFavor_H')
+        stats_shots_ot_Ag_home = team_stat('Avg_Shots_OnTarget_Against_H')
+        stats_shots_ot_IF_away = team_stat('Avg_Shots_OnTarget_InFavor_A')
+        stats_shots_ot_Ag_away = team_stat('Avg_Shots_OnTarget_Against_A')
+        stats_shots_ot_pG_IF_home = team_stat('Avg_Shots_OnTarget_per_Goal_InFavor_H')
+        stats_shots_ot_pG_Ag_home = team_stat('Avg_Shots_OnTarget_per_Goal_Against_H')
+        stats_shots_ot_pG_IF_away = team_stat('Avg_Shots_OnTarget_per_Goal_InFavor_A')
+        stats_shots_ot_pG_Ag_away = team_stat('Avg_Shots_OnTarget_per_Goal_Against_A')
+        stats_G_Attempts_pG_IF_home = team_stat('Avg_Goal_Attempts_per_Goal_InFavor_H')
+        stats_G_Attempts_pG_Ag_home = team_stat('Avg_Goal_Attempts_per_Goal_Against_H')
+        stats_G_Attempts_pG_IF_away = team_stat('Avg_Goal_Attempts_per_Goal_InFavor_A')
+        stats_G_Attempts_pG_Ag_away = team_stat('Avg_Goal_Attempts_per_Goal_Against_A')
+        stats_yellow_cards_home = team_stat('Avg_Yellow_Cards_H')
+        stats_yellow_cards_away = team_stat('Avg_Yellow_Cards_A')
+        stats_red_cards_home = team_stat('Avg_Red_Cards_H')
+        stats_red_cards_away = team_stat('Avg_Red_Cards_A')
         
         with col1:
             st.divider()
             st.markdown(f"#### Average Stats on the Last 7 Games ####")
             st.divider()
-            st.markdown(f"🎯 Shots On Target In Favor ***{selected_home}*** ➡️ ***{stats_shots_ot_IF_home:.2f}***")
-            st.markdown(f"🎯 Shots On Target Against ***{selected_home}*** ➡️ ***{stats_shots_ot_Ag_home:.2f}***")
-            st.markdown(f"🎯 Shots On Target In Favor ***{selected_away}*** ➡️ ***{stats_shots_ot_IF_away:.2f}***")
-            st.markdown(f"🎯 Shots On Target Against ***{selected_away}*** ➡️ ***{stats_shots_ot_Ag_away:.2f}***")
+            stat_line("🎯 Shots On Target In Favor", selected_home, stats_shots_ot_IF_home)
+            stat_line("🎯 Shots On Target Against", selected_home, stats_shots_ot_Ag_home)
+            stat_line("🎯 Shots On Target In Favor", selected_away, stats_shots_ot_IF_away)
+            stat_line("🎯 Shots On Target Against", selected_away, stats_shots_ot_Ag_away)
             st.divider()
-            st.markdown(f"⚽ Shots On Target per Goal In Favor ***{selected_home}*** ➡️ ***{stats_shots_ot_pG_IF_home:.2f}***")
-            st.markdown(f"⚽ Shots On Target per Goal Against ***{selected_home}*** ➡️ ***{stats_shots_ot_pG_Ag_home:.2f}***")
-            st.markdown(f"⚽ Shots On Target per Goal In Favor ***{selected_away}*** ➡️ ***{stats_shots_ot_pG_IF_away:.2f}***")
-            st.markdown(f"⚽ Shots On Target per Goal Against ***{selected_away}*** ➡️ ***{stats_shots_ot_pG_Ag_away:.2f}***")
+            stat_line("⚽ Shots On Target per Goal In Favor", selected_home, stats_shots_ot_pG_IF_home)
+            stat_line("⚽ Shots On Target per Goal Against", selected_home, stats_shots_ot_pG_Ag_home)
+            stat_line("⚽ Shots On Target per Goal In Favor", selected_away, stats_shots_ot_pG_IF_away)
+            stat_line("⚽ Shots On Target per Goal Against", selected_away, stats_shots_ot_pG_Ag_away)
             st.divider()
-            st.markdown(f"🟨 Yellow Cards Taken ***{selected_home}*** ➡️ ***{stats_yellow_cards_home:.2f}***")
-            st.markdown(f"🟨 Yellow Cards Taken ***{selected_away}*** ➡️ ***{stats_yellow_cards_away:.2f}***")
+            stat_line("🟨 Yellow Cards Taken", selected_home, stats_yellow_cards_home)
+            stat_line("🟨 Yellow Cards Taken", selected_away, stats_yellow_cards_away)
         with col2:
             st.divider()
             st.markdown(f"#### Average Stats on the Last 7 Games ####")
             st.divider()
-            st.markdown(f"🥅 Goal Attempt per Goal In Favor ***{selected_home}*** ➡️ ***{stats_G_Attempts_pG_IF_home:.2f}***")
-            st.markdown(f"🥅 Goal Attempt per Goal Against ***{selected_home}*** ➡️ ***{stats_G_Attempts_pG_Ag_home:.2f}***")
-            st.markdown(f"🥅 Goal Attempt per Goal In Favor ***{selected_away}*** ➡️ ***{stats_G_Attempts_pG_IF_away:.2f}***")
-            st.markdown(f"🥅 Goal Attempt per Goal Against ***{selected_away}*** ➡️ ***{stats_G_Attempts_pG_Ag_away:.2f}***")
+            stat_line("🥅 Goal Attempt per Goal In Favor", selected_home, stats_G_Attempts_pG_IF_home)
+            stat_line("🥅 Goal Attempt per Goal Against", selected_home, stats_G_Attempts_pG_Ag_home)
+            stat_line("🥅 Goal Attempt per Goal In Favor", selected_away, stats_G_Attempts_pG_IF_away)
+            stat_line("🥅 Goal Attempt per Goal Against", selected_away, stats_G_Attempts_pG_Ag_away)
             st.divider()
-            st.markdown(f"🚩 Corners Average In Favor ***{selected_home}*** ➡️ ***{stats_crn_IF_home:.2f}***")
-            st.markdown(f"🚩 Corners Average Against ***{selected_home}*** ➡️ ***{stats_crn_Ag_home:.2f}***")
-            st.markdown(f"🚩 Corners Average In Favor ***{selected_away}*** ➡️ ***{stats_crn_IF_away:.2f}***")
-            st.markdown(f"🚩 Corners Average Against ***{selected_away}*** ➡️ ***{stats_crn_Ag_away:.2f}***")
+            stat_line("🚩 Corners Average In Favor", selected_home, stats_crn_IF_home)
+            stat_line("🚩 Corners Average Against", selected_home, stats_crn_Ag_home)
+            stat_line("🚩 Corners Average In Favor", selected_away, stats_crn_IF_away)
+            stat_line("🚩 Corners Average Against", selected_away, stats_crn_Ag_away)
             st.divider()   
-            st.markdown(f"🟥 Red Cards Taken ***{selected_home}*** ➡️ ***{stats_red_cards_home:.2f}***")
-            st.markdown(f"🟥 Red Cards Taken ***{selected_away}*** ➡️ ***{stats_red_cards_away:.2f}***")
+            stat_line("🟥 Red Cards Taken", selected_home, stats_red_cards_home)
+            stat_line("🟥 Red Cards Taken", selected_away, stats_red_cards_away)
 
     else:
         st.error("Not enough data available for the selected teams.")
 
     # Load data for the last 21 games of the home team
-    past_games_home = historical_data[
-        (historical_data['Home'] == selected_home) &
-        (historical_data['League'] == selected_league) &
-        (historical_data['Date'] < pd.to_datetime(formatted_date))
-    ].tail(15)
+    past_games_home = team_index.last_games(
+        selected_home, 15, before=formatted_date, venue="Home", league=selected_league, newest_first=False
+    )
     
     # Load data for the last 21 games of the away team
-    past_games_away = historical_data[
-        (historical_data['Away'] == selected_away) &
-        (historical_data['League'] == selected_league) &
-        (historical_data['Date'] < pd.to_datetime(formatted_date))
-    ].tail(15)
+    past_games_away = team_index.last_games(
+        selected_away, 15, before=formatted_date, venue="Away", league=selected_league, newest_first=False
+    )
     
     # Function to summarize goals in time segments
     def summarize_half_goals(goals, half_segments):
@@ -635,94 +655,109 @@ try:
     # Plot goal distribution for the home team
     st.divider()
     st.markdown(f"#### Time of Goals of ***{selected_home}*** and ***{selected_away}*** on the last 15 Games ####")
-    home_goals_scored = count_goals(past_games_home['Goals_Minutes_Home'])
-    home_goals_conceded = count_goals(past_games_home['Goals_Minutes_Away'])
-    fig_home = plot_goal_distribution(selected_home, home_goals_scored, home_goals_conceded)
+    # Goal minutes of the selected games, already parsed by the team index
+    home_minutes_scored = team_index.goal_minutes['Goals_Minutes_Home'].take(past_games_home.index)
+    home_minutes_conceded = team_index.goal_minutes['Goals_Minutes_Away'].take(past_games_home.index)
+    away_minutes_scored = team_index.goal_minutes['Goals_Minutes_Away'].take(past_games_away.index)
+    away_minutes_conceded = team_index.goal_minutes['Goals_Minutes_Home'].take(past_games_away.index)
+
+    home_goals_scored = count_goals(home_minutes_scored)
+    home_goals_conceded = count_goals(home_minutes_conceded)
     
     # Plot goal distribution for the away team
-    away_goals_scored = count_goals(past_games_away['Goals_Minutes_Away'])
-    away_goals_conceded = count_goals(past_games_away['Goals_Minutes_Home'])
-    fig_away = plot_goal_distribution(selected_away, away_goals_scored, away_goals_conceded)
+    away_goals_scored = count_goals(away_minutes_scored)
+    away_goals_conceded = count_goals(away_minutes_conceded)
     
     # Calculate first half and second half goals for both teams
-    home_first_half_goals = sum([home_goals_scored[segment] for segment in ['0-15', '15-30', '30-45']])
-    home_second_half_goals = sum([home_goals_scored[segment] for segment in ['45-60', '60-75', '75-90']])
-    away_first_half_goals = sum([away_goals_scored[segment] for segment in ['0-15', '15-30', '30-45']])
-    away_second_half_goals = sum([away_goals_scored[segment] for segment in ['45-60', '60-75', '75-90']])
+    home_first_half_goals, home_second_half_goals = half_totals(home_goals_scored)
+    away_first_half_goals, away_second_half_goals = half_totals(away_goals_scored)
     
     # Calculate first half and second half goals conceded for both teams
-    home_first_half_conceded = sum([home_goals_conceded[segment] for segment in ['0-15', '15-30', '30-45']])
-    home_second_half_conceded = sum([home_goals_conceded[segment] for segment in ['45-60', '60-75', '75-90']])
-    away_first_half_conceded = sum([away_goals_conceded[segment] for segment in ['0-15', '15-30', '30-45']])
-    away_second_half_conceded = sum([away_goals_conceded[segment] for segment in ['45-60', '60-75', '75-90']])
-    
-    # Plot the data side by side
-    fig22, ax = plt.subplots(figsize=(10, 6))
-    half_labels = ["First Half", "Second Half"]
-    home_goals = [home_first_half_goals, home_first_half_conceded, home_second_half_goals, home_second_half_conceded]
-    away_goals = [away_first_half_goals, away_first_half_conceded, away_second_half_goals, away_second_half_conceded]
-    
-    x = np.arange(len(half_labels))
-    width = 0.35
+    home_first_half_conceded, home_second_half_conceded = half_totals(home_goals_conceded)
+    away_first_half_conceded, away_second_half_conceded = half_totals(away_goals_conceded)
     
     # Create the bar chart with 2 groups and 4 columns within each group
-    fig22, ax = plt.subplots(figsize=(10, 6))
-    half_labels = ["First Half", "Second Half"]
-    x = np.arange(len(half_labels))  # Positions for "First Half" and "Second Half"
-    width = 0.2  # Width of the bars
-    
-    # Add the bars with offsets within each half
-    ax.bar(x - 1.5 * width, [home_first_half_goals, home_second_half_goals], width, label=f'{selected_home} Scored', color='green')
-    ax.bar(x - 0.5 * width, [home_first_half_conceded, home_second_half_conceded], width, label=f'{selected_home} Conceded', color='darkgreen')
-    ax.bar(x + 0.5 * width, [away_first_half_goals, away_second_half_goals], width, label=f'{selected_away} Scored', color='blue')
-    ax.bar(x + 1.5 * width, [away_first_half_conceded, away_second_half_conceded], width, label=f'{selected_away} Conceded', color='darkblue')
-    
-    # Configure the labels of the chart
-    ax.set_xticks(x)
-    ax.set_xticklabels(half_labels)
-    ax.set_ylabel("Goals")
-    ax.set_title("First & Second Half Goals")
-    ax.legend()
-    ax.grid(axis="y", linestyle="--", alpha=0.7)
+    def half_goals_chart():
+        fig22, ax = plt.subplots(figsize=(10, 6))
+        half_labels = ["First Half", "Second Half"]
+        x = np.arange(len(half_labels))  # Positions for "First Half" and "Second Half"
+        width = 0.2  # Width of the bars
+
+        # Add the bars with offsets within each half
+        ax.bar(x - 1.5 * width, [home_first_half_goals, home_second_half_goals], width, label=f'{selected_home} Scored', color='green')
+        ax.bar(x - 0.5 * width, [home_first_half_conceded, home_second_half_conceded], width, label=f'{selected_home} Conceded', color='darkgreen')
+        ax.bar(x + 0.5 * width, [away_first_half_goals, away_second_half_goals], width, label=f'{selected_away} Scored', color='blue')
+        ax.bar(x + 1.5 * width, [away_first_half_conceded, away_second_half_conceded], width, label=f'{selected_away} Conceded', color='darkblue')
+
+        # Configure the labels of the chart
+        ax.set_xticks(x)
+        ax.set_xticklabels(half_labels)
+        ax.set_ylabel("Goals")
+        ax.set_title("First & Second Half Goals")
+        ax.legend()
+        ax.grid(axis="y", linestyle="--", alpha=0.7)
+        return fig22
     
-    home_first_goal, home_conceded_first = count_first_goal(
-            past_games_home['Goals_Minutes_Home'], past_games_home['Goals_Minutes_Away']
-            )
-        
-    away_first_goal, away_conceded_first = count_first_goal(
-        past_games_away['Goals_Minutes_Away'], past_games_away['Goals_Minutes_Home']
-        )
+    home_first_goal, home_conceded_first = count_first_goal(home_minutes_scored, home_minutes_conceded)
+    away_first_goal, away_conceded_first = count_first_goal(away_minutes_scored, away_minutes_conceded)
     
     # Create a bar chart to display the first goal occurrences
-    fig27, ax = plt.subplots(figsize=(10, 6))
-    
     # Labels and data for the bar chart
-    labels = [f'{selected_home} Scored', f'{selected_home} Conceded', f'{selected_away} Scored', f'{selected_away} Conceded']
-    values = [home_first_goal, home_conceded_first, away_first_goal, away_conceded_first]
-    colors = ['green', 'darkgreen', 'blue', 'darkblue']
-    
-    # Create the bar chart
-    ax.bar(labels, values, color=colors)
-    
-    # Configure the labels of the chart
-    ax.set_ylabel("Number of Times")
-    ax.set_title("First Goal Occurrences in the Last 15 Games")
-    ax.grid(axis="y", linestyle="--", alpha=0.7)
+    first_goal_labels = [f'{selected_home} Scored', f'{selected_home} Conceded', f'{selected_away} Scored', f'{selected_away} Conceded']
+    first_goal_values = [home_first_goal, home_conceded_first, away_first_goal, away_conceded_first]
+    first_goal_colors = ['green', 'darkgreen', 'blue', 'darkblue']
+
+    def first_goal_chart():
+        fig27, ax = plt.subplots(figsize=(10, 6))
+
+        # Create the bar chart
+        ax.bar(first_goal_labels, first_goal_values, color=first_goal_colors)
+
+        # Configure the labels of the chart
+        ax.set_ylabel("Number of Times")
+        ax.set_title("First Goal Occurrences in the Last 15 Games")
+        ax.grid(axis="y", linestyle="--", alpha=0.7)
+        return fig27
     
     # Display the plots side by side
     col1, col2 = st.columns(2)
     with col1:
-        st.pyplot(fig_home)
+        draw_chart(("goal_distribution", selected_home, "Home"),
+                   lambda: plot_goal_distribution(selected_home, home_goals_scored, home_goals_conceded),
+                   lambda: grouped_bar_chart(list(home_goals_scored), {
+                       "Scored": list(home_goals_scored.values()), "Conceded": list(home_goals_conceded.values())
+                   }, ['green', 'red'], f"Goal Distribution - {selected_home}"))
     with col2:
-        st.pyplot(fig_away)
+        draw_chart(("goal_distribution", selected_away, "Away"),
+                   lambda: plot_goal_distribution(selected_away, away_goals_scored, away_goals_conceded),
+                   lambda: grouped_bar_chart(list(away_goals_scored), {
+                       "Scored": list(away_goals_scored.values()), "Conceded": list(away_goals_conceded.values())
+                   }, ['green', 'red'], f"Goal Distribution - {selected_away}"))
     with col1:
         st.markdown(f"#### First Half & Second Half Goals Distribution on the Last 15 Games ####")
         # Display the plot
-        st.pyplot(fig22)
+        draw_chart(("half_goals", selected_home, selected_away), half_goals_chart, lambda: grouped_bar_chart(
+            ["First Half", "Second Half"], {
+                f'{selected_home} Scored': [home_first_half_goals, home_second_half_goals],
+                f'{selected_home} Conceded': [home_first_half_conceded, home_second_half_conceded],
+                f'{selected_away} Scored': [away_first_half_goals, away_second_half_goals],
+                f'{selected_away} Conceded': [away_first_half_conceded, away_second_half_conceded],
+            }, ['green', 'darkgreen', 'blue', 'darkblue'], "First & Second Half Goals"
+        ))
     with col2:
         st.markdown(f"#### Who Scored and Conceded First in the Last 15 Games? ####")
         # Display the chart in Streamlit
-        st.pyplot(fig27)
+        draw_chart(("first_goal", selected_home, selected_away), first_goal_chart, lambda: bar_chart(
+            first_goal_labels, first_goal_values, first_goal_colors,
+            "First Goal Occurrences in the Last 15 Games", "Number of Times"
+        ))
+
+    # Hit rate of the rendered-chart cache, shared by every session of the server
+    chart_stats = chart_cache_stats()
+    st.caption(
+        f"Chart cache: {chart_stats['hits']} hits / {chart_stats['misses']} misses "
+        f"({chart_stats['hit_rate']:.1f}% hit rate, {chart_stats['charts']} charts, {chart_stats['bytes'] / 1024 ** 2:.1f} MB)"
+    )
 
 except Exception as e:
     st.error(f"General Error: {e}")
\ No newline at end of file
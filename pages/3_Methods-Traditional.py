@@ -1,13 +1,12 @@
-import pandas as pd
-import numpy as np
 import streamlit as st
-from PIL import Image
-import os
-import base64
-import requests
 from datetime import datetime
 from auth import logout
 from sidebar_menu import show_role_features
+from static_assets import show_static_image
+from fetch_cache import DAILY_TTL, REFERENCE_TTL, load_concurrently, load_csv
+from rules_engine import compile_rules, filter_by_rules, rule_matches
+from enrichment import enrich_day
+from elo_tilt import get_elo_engine
 
 # Streamlit App Title and Headers
 st.set_page_config(page_title="Methods - Fluffy Chips Web Analyser", page_icon="🔋", layout="wide")
@@ -28,16 +27,11 @@ st.divider()
 st.subheader('_Methods for Today_')
 
 # Display Image
-image_path = os.path.join(os.getcwd(), 'static', 'analises001.png')
-if os.path.exists(image_path):
-    st.image(image_path, use_container_width=True)
-else:
-    st.warning("Image not found. Please check the file path.")
+show_static_image('analises001.png')
 
 st.divider()
 # URLs for CSV Files
 github_base_url = "https://raw.githubusercontent.com/RedLegacy227/jogos_do_dia_com_variaveis/main/"
-historical_data_url = "https://raw.githubusercontent.com/RedLegacy227/main_data_base/main/df_base_original.csv"
 leagues_url = "https://raw.githubusercontent.com/RedLegacy227/dados_ligas/main/df_ligas.csv"
 elo_tilt_url = "https://raw.githubusercontent.com/RedLegacy227/elo_tilt/main/df_elo_tilt.csv"
 
@@ -49,73 +43,224 @@ formatted_date = selected_date.strftime("%Y-%m-%d")
 csv_file_name = f'df_jogos_do_dia_{formatted_date}.csv'
 csv_file_url = github_base_url + csv_file_name
 
-# Function to Load Data with Caching
-@st.cache_data(ttl=0)
-def load_data(url):
+# Function to Load Data through the shared fetch cache
+def load_data(url, ttl=DAILY_TTL):
     try:
-        response = requests.get(url)
-        if response.status_code == 200:
-            return pd.read_csv(url)
-        else:
+        data = load_csv(url, ttl=ttl)
+        if data is None:
             st.error(f"No Games Available for the Chosen Date: {formatted_date}")
-            return None
+        return data
     except Exception as e:
         st.error(f"Error loading data: {e}")
         return None
 
-# Function to check head-to-head results
-def check_h2h_lay_0x1(home_team, away_team, historical_data):
-    h2h_games = historical_data[
-        (historical_data['Home'] == home_team) & (historical_data['Away'] == away_team)
-    ]
-    return int(any((h2h_games['FT_Goals_H'] == 0) & (h2h_games['FT_Goals_A'] == 1)))
-
-# Function to check head-to-head results for Lay 1x1
-def check_h2h_lay_1x1(home_team, away_team, historical_data):
-    h2h_games = historical_data[
-        (historical_data['Home'] == home_team) & (historical_data['Away'] == away_team)
-    ]
-    return int(any((h2h_games['FT_Goals_H'] == 1) & (h2h_games['FT_Goals_A'] == 1)))
+# Rules of the league methods: (column, low, high, inclusive) ranges plus exact matches
+back_home_rules = compile_rules({
+    "back_home_Port_01_01_ft": {
+        "league": 'PORTUGAL - LIGA PORTUGAL',
+        "equals": [("Home_Score_Take", 'No'), ("Away_Score_Take", 'Yes')],
+        "ranges": [("Avg_G_Diff_A_FT_Value", -0.0900, 0.0250, "neither")],
+    },
+    "back_home_Port_01_02_ft": {
+        "league": 'PORTUGAL - LIGA PORTUGAL',
+        "equals": [("Home_Score_Take", 'No'), ("Away_Score_Take", 'Yes')],
+        "ranges": [
+            ("Poisson_GS_A_2", 0.2520, 0.2710, "neither"),
+            ("Avg_Points_A", 0.9780, 1.6950, "neither"),
+        ],
+    },
+    "back_home_Port_01_03_ft": {
+        "league": 'PORTUGAL - LIGA PORTUGAL',
+        "equals": [("Home_Score_Take", 'No'), ("Away_Score_Take", 'Yes')],
+        "ranges": [
+            ("Avg_Points_A", 0.9780, 1.6950, "neither"),
+            ("Avg_G_Conceded_A_FT_Value", 1.5120, 4.0670, "neither"),
+        ],
+    },
+    "back_home_Port_01_04_ft": {
+        "league": 'PORTUGAL - LIGA PORTUGAL',
+        "ranges": [
+            ("DifPer_HomeDraw", 6.46, 9.28, "both"),
+            ("Poisson_GS_H_0", 0.50, 0.55, "both"),
+            ("H_BTTSN", 1.12, 1.22, "both"),
+            ("Poisson_GS_H_2", 0.10, 0.13, "both"),
+            ("Final_Avg_RPS_MO_A", 3.94, 4.39, "both"),
+        ],
+    },
+    "back_home_nacleague_01_01_ft": {
+        "league": 'EUROPE - UEFA NATIONS LEAGUE',
+        "ranges": [
+            ("Angle_HomeAway", -14.63, -10.23, "both"),
+            ("A_Un", 0.20, 0.33, "both"),
+            ("DifAbs_HomeDraw", 0.28, 0.40, "both"),
+            ("D_A", 1.57, 1.92, "both"),
+        ],
+    },
+    "back_home_argentina_01_01_ft": {
+        "league": 'ARGENTINA - TORNEO BETANO',
+        "ranges": [
+            ("Final_Avg_G_Conceded_H_SH", 0.04, 0.33, "both"),
+            ("Final_Avg_RPS_BTTS_A", 7.54, 12.63, "both"),
+            ("H_BTTSY", 0.56, 0.76, "both"),
+            ("BTTSY_BTTSN", 0.60, 0.70, "both"),
+        ],
+    },
+    "back_home_austria02_ft": {
+        "league": 'AUSTRIA - 2. LIGA',
+        "ranges": [
+            ("DifAbs_HomeDraw", 0.14, 0.19, "both"),
+            ("D_Ov", 0.51, 0.59, "both"),
+        ],
+    },
+    "back_home_brasil01_ft": {
+        "league": 'BRASIL - SERIE A BETANO',
+        "equals": [("CV_OvUn_FT", 0.25)],
+        "ranges": [
+            ("Final_Avg_RPS_MO_H", 5.85, 4.95, "both"),
+            ("Poisson_GM_A_0", 0.19, 0.12, "both"),
+            ("Poisson_GM_H_4", 0.10, 0.06, "both"),
+        ],
+    },
+    "back_home_brasil02_ft": {
+        "league": 'BRASIL - SERIE A BETANO',
+        "ranges": [
+            ("DifPer_HomeDraw", 1.40, 1.80, "both"),
+            ("Final_Avg_CG_Conceded_H_02", 4.07, 7.06, "both"),
+        ],
+    },
+    "back_home_croatia01_ft": {
+        "league": 'CROATIA - HNL',
+        "ranges": [
+            ("Final_Avg_prob_H", 2.43, 7.52, "both"),
+            ("Final_Avg_CG_Scored_A_02", 12.95, 18.33, "both"),
+        ],
+    },
+    "back_home_colombia01_ft": {
+        "league": 'COLOMBIA - PRIMERA A',
+        "ranges": [("Poisson_GM_A_0", 0.23, 0.27, "both")],
+    },
+    "back_home_colombia02_ft": {
+        "league": 'COLOMBIA - PRIMERA B',
+        "ranges": [
+            ("DifAbs_HomeDraw", 0.46, 0.54, "both"),
+            ("Angle_HomeDraw", -15.06, -13.07, "both"),
+        ],
+    },
+})
+
+back_away_rules = compile_rules({
+    "back_away_argentina01_ft": {
+        "league": 'ARGENTINA - TORNEO BETANO',
+        "ranges": [("Poisson_GS_A_1", 0.20, 0.27, "both")],
+    },
+    "back_away_portugal01_ft": {
+        "league": 'PORTUGAL - LIGA PORTUGAL',
+        "ranges": [("DifAbs_DrawAway", 0.17, 0.25, "both")],
+    },
+    "back_away_austria02_ft": {
+        "league": 'AUSTRIA - 2. LIGA',
+        "ranges": [
+            ("D_A", 0.92, 1.17, "both"),
+            ("Final_Avg_G_Conceded_A_SH", 0.03, 0.30, "both"),
+            ("DifPer_HomeAway", 0.58, 1.71, "both"),
+        ],
+    },
+    "back_away_austria01_ft": {
+        "league": 'AUSTRIA - BUNDESLIGA',
+        "ranges": [("Poisson_GM_H_0", 0.20, 0.56, "both")],
+    },
+    "back_away_brasil02_ft": {
+        "league": 'BRASIL - SERIE B',
+        "ranges": [
+            ("Final_Avg_RPS_MO_A", 9.40, 10.32, "both"),
+            ("Poisson_GM_H_1", 0.33, 0.34, "both"),
+        ],
+    },
+    "back_away_portugal03_ft": {
+        "league": 'PORTUGAL - LIGA 3',
+        "ranges": [
+            ("D_BTTSN", 0.64, 0.70, "both"),
+            ("H_Un", 1.05, 1.33, "both"),
+        ],
+    },
+})
+
+over05_ht_rules = compile_rules({
+    "back_over05_argentina01_ht": {
+        "league": 'WORLD - WORLD CHAMPIONSHIP',
+        "ranges": [
+            ("BTTSN_BTTSY", 3.00, 3.81, "both"),
+            ("H_BTTSY", 3.30, 4.29, "both"),
+        ],
+    },
+})
+
+under05_ht_rules = compile_rules({
+    "back_under05_argentina01_ht": {
+        "league": 'WORLD - WORLD CHAMPIONSHIP',
+        "ranges": [
+            ("Angle_UnOv", -3.21, -1.16, "both"),
+            ("D_BTTSY", 0.37, 0.47, "both"),
+        ],
+    },
+})
+
+under_15_ft_rules = compile_rules({
+    "under_15_croatia_01_ft": {
+        "league": 'CROATIA - HNL',
+        "equals": [("Points", 'Points_Home'), ("RPS_OVUnd", 'Bigger_Away')],
+        "ranges": [
+            ("Poisson_GS_H_2", 0.1660, 0.2610, "neither"),
+            ("Avg_CG_Scored_A_02", 0.5550, 0.8390, "neither"),
+        ],
+    },
+    "under_15_croatia_02_ft": {
+        "league": 'CROATIA - HNL',
+        "equals": [("Points", 'Points_Home'), ("RPS_OVUnd", 'Bigger_Away')],
+        "ranges": [
+            ("Poisson_GS_H_2", 0.1660, 0.2610, "neither"),
+            ("Avg_CG_Conceded_H_02", 0.7080, 0.9270, "neither"),
+        ],
+    },
+    "under_15_croatia_03_ft": {
+        "league": 'CROATIA - HNL',
+        "equals": [("Points", 'Points_Home'), ("RPS_OVUnd", 'Bigger_Away')],
+        "ranges": [
+            ("prob_G_Scored_H", 0.9020, 1.5720, "neither"),
+            ("prob_G_Conceded_H", 0.9370, 1.3880, "neither"),
+        ],
+    },
+})
 
 # Load Data
+# The three sources are downloaded and parsed at the same time, so the wait is the slowest of them
 with st.spinner("Fetching data..."):
-    try:
-        data = load_data(csv_file_url)
-        if data is not None:
-            data_Ov25_FT = data.copy()
-            data_btts = data.copy()
-            lay_home = data.copy()
-            lay_away = data.copy()
-        else:
-            data_Ov25_FT = None
-            data_btts = None
-            lay_home = None
-            lay_away = None
-    except Exception as e:
-        st.error("No Data Available for the Chosen Date")
-        data = None
-        data_Ov25_FT = None
-        data_btts = None
-        lay_home = None
-        lay_away = None
-
-    try:
-        historical_data = load_data(historical_data_url)
-    except Exception as e:
-        st.error("No Historical Data Available for the Chosen Date")
-        historical_data = None
+    sources = load_concurrently({
+        "data": lambda: load_data(csv_file_url),
+        "leagues_data": lambda: load_data(leagues_url, ttl=REFERENCE_TTL),
+        "elo_tilt_data": lambda: load_data(elo_tilt_url, ttl=REFERENCE_TTL),
+    })
+
+    def source_result(name, error_message):
+        result = sources[name]
+        if isinstance(result, Exception):
+            st.error(error_message)
+            return None
+        return result
 
-    try:
-        leagues_data = load_data(leagues_url)
-    except Exception as e:
-        st.error("No Leagues Data Available for the Chosen Date")
-        leagues_data = None
+    data = source_result("data", "No Data Available for the Chosen Date")
+    leagues_data = source_result("leagues_data", "No Leagues Data Available for the Chosen Date")
+    elo_tilt_data = source_result("elo_tilt_data", "No Elo & Tilt Data Available for the Chosen Date")
 
-    try:
-        elo_tilt_data = load_data(elo_tilt_url)
-    except Exception as e:
-        st.error("No Elo & Tilt Data Available for the Chosen Date")
-        elo_tilt_data = None
+    # VAR1/2/3, Elo & Tilt and the Elo fair odds are computed once per daily file and shared by every tab,
+    # which only filter `data` (never modify it), so no tab needs its own copy
+    if data is not None:
+        elo_ratings = elo_tilt_data
+        if elo_ratings is None:
+            # Without the Elo & Tilt file, the ratings of the in-house engine as of the chosen date are used
+            engine = get_elo_engine()
+            elo_ratings = engine.table(as_of=selected_date) if engine is not None else None
+        data = enrich_day(data, elo_ratings)
 
 # Display Success Messages
 if data is not None:
@@ -123,11 +268,6 @@ if data is not None:
 else:
     st.error("No Data Available for the Chosen Date")
 
-if historical_data is not None:
-    st.success("Historical Data loaded successfully!")
-else:
-    st.error("No Historical Data Available for the Chosen Date")
-
 if leagues_data is not None:
     st.success("Leagues Data loaded successfully!")
 else:
@@ -140,724 +280,419 @@ else:
 
 # Create Tabs
 tabs = ['Back Home', 'Back Away', 'Lay Home', 'Lay Away', 'Over 0,5 HT', 'Under 0,5 HT', 'Over 1,5 FT', 'Under 1,5 FT', 'Over 2,5 FT', ' BTTS', 'Louro José', 'Best Teams']
-tab_views = st.tabs(tabs)
+# Only the selected tab runs: switching tabs reruns the page and the other tabs are skipped
+tab_views = st.tabs(tabs, key="methods_traditional_tab", on_change="rerun")
 
 with tab_views[0]:
-    st.markdown(f'#### Todays Games for Back_Home - Method Automatic Pivot Table ####')
-
-    # List of columns to display
-    columns_to_display = [
-        'Time', 'League', 'Home', 'Away', 'Round', 'FT_Odd_H', 'FT_Odd_D', 'FT_Odd_A', 'CV_Match_Type', 'Favorite', 'Perc_Home_Win_FT', 'Perc_Draw_Win_H_FT', 'Perc_Draw_Win_A_FT', 'Perc_Away_Win_FT'
-    ]
+    if tab_views[0].open:
+        st.markdown(f'#### Todays Games for Back_Home - Method Automatic Pivot Table ####')
 
-    if data is not None:
-        # Create a list to hold all filtered dataframes
-        filtered_dataframes = []
-
-        # Apply filters for each league and method
-        back_home_Port_01_01_ft_flt = data[
-            (data["League"] == 'PORTUGAL - LIGA PORTUGAL') &
-            (data["Home_Score_Take"] == 'No') &
-            (data["Away_Score_Take"] == 'Yes') &
-            (data["Avg_G_Diff_A_FT_Value"] > -0.0900) &
-            (data["Avg_G_Diff_A_FT_Value"] < 0.0250)
-        ]
-        filtered_dataframes.append(back_home_Port_01_01_ft_flt)
-
-        back_home_Port_01_02_ft_flt = data[
-            (data["League"] == 'PORTUGAL - LIGA PORTUGAL') &
-            (data["Home_Score_Take"] == 'No') &
-            (data["Away_Score_Take"] == 'Yes') &
-            (data["Poisson_GS_A_2"] > 0.2520) &
-            (data["Poisson_GS_A_2"] < 0.2710) &
-            (data["Avg_Points_A"] > 0.9780) &
-            (data["Avg_Points_A"] < 1.6950)
-        ]
-        filtered_dataframes.append(back_home_Port_01_02_ft_flt)
-
-        back_home_Port_01_03_ft_flt = data[
-            (data["League"] == 'PORTUGAL - LIGA PORTUGAL') &
-            (data["Home_Score_Take"] == 'No') &
-            (data["Away_Score_Take"] == 'Yes') &
-            (data["Avg_Points_A"] > 0.9780) &
-            (data["Avg_Points_A"] < 1.6950) &
-            (data["Avg_G_Conceded_A_FT_Value"] > 1.5120) &
-            (data["Avg_G_Conceded_A_FT_Value"] < 4.0670)
-        ]
-        filtered_dataframes.append(back_home_Port_01_03_ft_flt)
-
-        back_home_Port_01_04_ft_flt = data[
-            (data["League"] == 'PORTUGAL - LIGA PORTUGAL') &
-            (data["DifPer_HomeDraw"] >= 6.46) &
-            (data["DifPer_HomeDraw"] <= 9.28) &
-            (data["Poisson_GS_H_0"] >= 0.50) &
-            (data["Poisson_GS_H_0"] <= 0.55) &
-            (data["H_BTTSN"] >= 1.12) &
-            (data["H_BTTSN"] <= 1.22) &
-            (data["Poisson_GS_H_2"] >= 0.10) &
-            (data["Poisson_GS_H_2"] <= 0.13) &
-            (data["Final_Avg_RPS_MO_A"] >= 3.94) & 
-            (data["Final_Avg_RPS_MO_A"] <= 4.39)
-        ]
-        filtered_dataframes.append(back_home_Port_01_04_ft_flt)
-
-        back_home_nacleague_01_01_ft_flt = data[
-            (data["League"] == 'EUROPE - UEFA NATIONS LEAGUE') &
-            (data["Angle_HomeAway"] >= -14.63) &
-            (data["Angle_HomeAway"] <= -10.23) &
-            (data["A_Un"] >= 0.20) &
-            (data["A_Un"] <= 0.33) &
-            (data["DifAbs_HomeDraw"] >= 0.28) &
-            (data["DifAbs_HomeDraw"] <= 0.40) &
-            (data["D_A"] >= 1.57) &
-            (data["D_A"] <= 1.92) 
-        ]
-        filtered_dataframes.append(back_home_nacleague_01_01_ft_flt)
-        
-        back_home_argentina_01_01_ft_flt = data[
-            (data["League"] == 'ARGENTINA - TORNEO BETANO') &
-            (data["Final_Avg_G_Conceded_H_SH"] >= 0.04) &
-            (data["Final_Avg_G_Conceded_H_SH"] <= 0.33) &
-            (data["Final_Avg_RPS_BTTS_A"] >= 7.54) &
-            (data["Final_Avg_RPS_BTTS_A"] <= 12.63) &
-            (data["H_BTTSY"] >= 0.56) &
-            (data["H_BTTSY"] <= 0.76) &
-            (data["BTTSY_BTTSN"] >= 0.60) &
-            (data["BTTSY_BTTSN"] <= 0.70) 
-        ]
-        filtered_dataframes.append(back_home_argentina_01_01_ft_flt)
-        
-        back_home_austria02_ft_flt = data[
-            (data["League"] == 'AUSTRIA - 2. LIGA') &
-            (data["DifAbs_HomeDraw"] >= 0.14) &
-            (data["DifAbs_HomeDraw"] <= 0.19) &
-            (data["D_Ov"] >= 0.51) &
-            (data["D_Ov"] <= 0.59)  
-        ]
-        filtered_dataframes.append(back_home_austria02_ft_flt)
-        
-        back_home_brasil01_ft_flt = data[
-            (data["League"] == 'BRASIL - SERIE A BETANO') &
-            (data["CV_OvUn_FT"] == 0.25) &
-            (data["Final_Avg_RPS_MO_H"] <= 4.95) &
-            (data["Final_Avg_RPS_MO_H"] >= 5.85) &
-            (data["Poisson_GM_A_0"] <= 0.12) &
-            (data["Poisson_GM_A_0"] >= 0.19) &
-            (data["Poisson_GM_H_4"] <= 0.06) &
-            (data["Poisson_GM_H_4"] >= 0.10)
-        ]
-        filtered_dataframes.append(back_home_brasil01_ft_flt)
-        
-        back_home_brasil02_ft_flt = data[
-            (data["League"] == 'BRASIL - SERIE A BETANO') &
-            (data["DifPer_HomeDraw"] >= 1.40) &
-            (data["DifPer_HomeDraw"] <= 1.80) &
-            (data["Final_Avg_CG_Conceded_H_02"] >= 4.07) &
-            (data["Final_Avg_CG_Conceded_H_02"] <= 7.06)
-        ]
-        filtered_dataframes.append(back_home_brasil02_ft_flt)
-        
-        back_home_croatia01_ft_flt = data[
-            (data["League"] == 'CROATIA - HNL') &
-            (data["Final_Avg_prob_H"] >= 2.43) &
-            (data["Final_Avg_prob_H"] <= 7.52) &
-            (data["Final_Avg_CG_Scored_A_02"] >= 12.95) &
-            (data["Final_Avg_CG_Scored_A_02"] <= 18.33)
-        ]
-        filtered_dataframes.append(back_home_croatia01_ft_flt)
-        
-        back_home_colombia01_ft_flt = data[
-            (data["League"] == 'COLOMBIA - PRIMERA A') &
-            (data["Poisson_GM_A_0"] >= 0.23) &
-            (data["Poisson_GM_A_0"] <= 0.27) 
-        ]
-        filtered_dataframes.append(back_home_colombia01_ft_flt)
-        
-        back_home_colombia02_ft_flt = data[
-            (data["League"] == 'COLOMBIA - PRIMERA B') &
-            (data["DifAbs_HomeDraw"] >= 0.46) &
-            (data["DifAbs_HomeDraw"] <= 0.54) &
-            (data["Angle_HomeDraw"] >= -15.06) &
-            (data["Angle_HomeDraw"] <= -13.07) 
+        # List of columns to display
+        columns_to_display = [
+            'Time', 'League', 'Home', 'Away', 'Round', 'FT_Odd_H', 'FT_Odd_D', 'FT_Odd_A', 'CV_Match_Type', 'Favorite', 'Perc_Home_Win_FT', 'Perc_Draw_Win_H_FT', 'Perc_Draw_Win_A_FT', 'Perc_Away_Win_FT'
         ]
-        filtered_dataframes.append(back_home_colombia02_ft_flt)
-        
-        # Concatenate all filtered dataframes
-        df_ligas_back_home = pd.concat(filtered_dataframes, ignore_index=True)
 
-        # Sort by 'Time' and select only the desired columns
-        df_ligas_back_home = df_ligas_back_home[columns_to_display].sort_values(by='Time', ascending=True)
+        if data is not None:
+            # Apply the rules of every league and method in a single pass
+            df_ligas_back_home = filter_by_rules(data, back_home_rules)
 
-        # Display the final dataframe
-        if not df_ligas_back_home.empty:
-            st.dataframe(df_ligas_back_home, use_container_width=True, hide_index=True)
+            # Sort by 'Time' and select only the desired columns
+            df_ligas_back_home = df_ligas_back_home[columns_to_display].sort_values(by='Time', ascending=True)
+
+            # Display the final dataframe
+            if not df_ligas_back_home.empty:
+                st.dataframe(df_ligas_back_home, use_container_width=True, hide_index=True)
+            else:
+                st.warning("No games found with the specified criteria.")
         else:
-            st.warning("No games found with the specified criteria.")
-    else:
-        st.error("No Data Available for the Chosen Date")
+            st.error("No Data Available for the Chosen Date")
         
 with tab_views[1]:
-    st.markdown(f'#### Back Away - Method Automatic Pivot Table ####')
+    if tab_views[1].open:
+        st.markdown(f'#### Back Away - Method Automatic Pivot Table ####')
 
-    # List of columns to display
-    columns_to_display = [
-        'Time', 'League', 'Home', 'Away', 'Round', 'FT_Odd_H', 'FT_Odd_D', 'FT_Odd_A', 'CV_Match_Type', 'Favorite', 'Perc_Home_Win_FT', 'Perc_Draw_Win_H_FT', 'Perc_Draw_Win_A_FT', 'Perc_Away_Win_FT'
-    ]
-
-    if data is not None:
-        # Create a list to hold all filtered dataframes
-        filtered_dataframes = []
-
-        # Apply filters for each league and method
-        back_away_argentina01_ft_flt = data[
-            (data["League"] == 'ARGENTINA - TORNEO BETANO') &
-            (data["Poisson_GS_A_1"] >= 0.20) &
-            (data["Poisson_GS_A_1"] <= 0.27)
+        # List of columns to display
+        columns_to_display = [
+            'Time', 'League', 'Home', 'Away', 'Round', 'FT_Odd_H', 'FT_Odd_D', 'FT_Odd_A', 'CV_Match_Type', 'Favorite', 'Perc_Home_Win_FT', 'Perc_Draw_Win_H_FT', 'Perc_Draw_Win_A_FT', 'Perc_Away_Win_FT'
         ]
-        filtered_dataframes.append(back_away_argentina01_ft_flt)
 
-        back_away_portugal01_ft_flt = data[
-            (data["League"] == 'PORTUGAL - LIGA PORTUGAL') &
-            (data["DifAbs_DrawAway"] >= 0.17) &
-            (data["DifAbs_DrawAway"] <= 0.25)
-        ]
-        filtered_dataframes.append(back_away_portugal01_ft_flt)
-        
-        back_away_austria02_ft_flt = data[
-            (data["League"] == 'AUSTRIA - 2. LIGA') &
-            (data["D_A"] >= 0.92) &
-            (data["D_A"] <= 1.17) &
-            (data["Final_Avg_G_Conceded_A_SH"] >= 0.03) &
-            (data["Final_Avg_G_Conceded_A_SH"] <= 0.30) &
-            (data["DifPer_HomeAway"] >= 0.58) &
-            (data["DifPer_HomeAway"] <= 1.71)  
-        ]
-        filtered_dataframes.append(back_away_austria02_ft_flt)
-        
-        back_away_austria01_ft_flt = data[
-            (data["League"] == 'AUSTRIA - BUNDESLIGA') &
-            (data["Poisson_GM_H_0"] >= 0.20) &
-            (data["Poisson_GM_H_0"] <= 0.56) 
-        ]
-        filtered_dataframes.append(back_away_austria01_ft_flt)
-        
-        back_away_brasil02_ft_flt = data[
-            (data["League"] == 'BRASIL - SERIE B') &
-            (data["Final_Avg_RPS_MO_A"] >= 9.40) &
-            (data["Final_Avg_RPS_MO_A"] <= 10.32) &
-            (data["Poisson_GM_H_1"] >= 0.33) &
-            (data["Poisson_GM_H_1"] <= 0.34) 
-        ]
-        filtered_dataframes.append(back_away_brasil02_ft_flt)
-        
-        back_away_portugal03_ft_flt = data[
-            (data["League"] == 'PORTUGAL - LIGA 3') &
-            (data["D_BTTSN"] >= 0.64) &
-            (data["D_BTTSN"] <= 0.70) &
-            (data["H_Un"] >= 1.05) &
-            (data["H_Un"] <= 1.33)
-        ]
-        filtered_dataframes.append(back_away_portugal03_ft_flt)
-        
-        # Concatenate all filtered dataframes
-        df_ligas_back_away = pd.concat(filtered_dataframes, ignore_index=True)
+        if data is not None:
+            # Apply the rules of every league and method in a single pass
+            df_ligas_back_away = filter_by_rules(data, back_away_rules)
 
-        # Sort by 'Time' and select only the desired columns
-        df_ligas_back_away = df_ligas_back_away[columns_to_display].sort_values(by='Time', ascending=True)
+            # Sort by 'Time' and select only the desired columns
+            df_ligas_back_away = df_ligas_back_away[columns_to_display].sort_values(by='Time', ascending=True)
 
-        # Display the final dataframe
-        if not df_ligas_back_away.empty:
-            st.dataframe(df_ligas_back_away, use_container_width=True, hide_index=True)
+            # Display the final dataframe
+            if not df_ligas_back_away.empty:
+                st.dataframe(df_ligas_back_away, use_container_width=True, hide_index=True)
+            else:
+                st.warning("No games found with the specified criteria.")
         else:
-            st.warning("No games found with the specified criteria.")
-    else:
-        st.error("No Data Available for the Chosen Date")
+            st.error("No Data Available for the Chosen Date")
         
 with tab_views[2]:
-    st.markdown(f"#### Todays Games for Lay Home ####")
-    try:
-        lay_home['VAR1'] = np.sqrt((lay_home['FT_Odd_H'] - lay_home['FT_Odd_A'])**2)
-        lay_home['VAR2'] = np.degrees(np.arctan((lay_home['FT_Odd_A'] - lay_home['FT_Odd_H']) / 2))
-        lay_home['VAR3'] = np.degrees(np.arctan((lay_home['FT_Odd_D'] - lay_home['FT_Odd_A']) / 2))
-    except KeyError as e:
-        st.error(f"No Games Available for Lay Home: {e}")
-    
-    if lay_home is not None:
-        try:
-            # Carregar os dados de Elo e Tilt apenas uma vez
-            if 'Elo_Home' not in lay_home.columns or 'Elo_Away' not in lay_home.columns:
-                df_elo_tilt = elo_tilt_data
-                
-                # Merge para adicionar dados de Elo e Tilt
-                lay_home = lay_home.merge(df_elo_tilt[['Team', 'Elo', 'Tilt']], left_on='Home', right_on='Team', how='left')
-                lay_home = lay_home.rename(columns={'Elo': 'Elo_Home', 'Tilt': 'Tilt_Home'})
-                lay_home = lay_home.merge(df_elo_tilt[['Team', 'Elo', 'Tilt']], left_on='Away', right_on='Team', how='left')
-                lay_home = lay_home.rename(columns={'Elo': 'Elo_Away', 'Tilt': 'Tilt_Away'})
-                
-                # Calcular a diferença de Elo
-                lay_home['Elo_Difference'] = lay_home['Elo_Home'] - lay_home['Elo_Away']
-            
-            # Calcular as odds justas
-            HFA = 50 * 0.15
-            lay_home['dr'] = (lay_home['Elo_Home'] + HFA) - lay_home['Elo_Away']
-            lay_home['P_Home'] = 1 / (10 ** (-lay_home['dr'] / 400) + 1)
-            lay_home['P_Away'] = 1 - lay_home['P_Home']
-            lay_home['Odd_Home_Justa'] = (1 / lay_home['P_Home']).round(2)
-            lay_home['Odd_Away_Justa'] = (1 / lay_home['P_Away']).round(2)
-            
-            # Filtro para Back Home
-            lay_home_flt = lay_home[(lay_home['VAR1'] >= 3) & (lay_home["VAR2"] <= -30) & (lay_home["VAR3"] >= 30) & (lay_home['FT_Odd_H'] > 2)]
+    if tab_views[2].open:
+        st.markdown(f"#### Todays Games for Lay Home ####")
+        if data is not None:
+            try:
+                # Filtro para Lay Home
+                lay_home_flt = data[(data['VAR1'] >= 3) & (data["VAR2"] <= -30) & (data["VAR3"] >= 30) & (data['FT_Odd_H'] > 2)]
             
-            # Exibir dados filtrados
-            if not lay_home_flt.empty:
-                st.dataframe(lay_home_flt[['League', 'Time', 'Home', 'Away', 'Round', 'FT_Odd_H', 'FT_Odd_A', 'FT_Odd_D', 'Odd_Home_Justa', 'Odd_Away_Justa', 'Avg_Points_H','CV_Avg_Points_H', 'Avg_Points_A', 'CV_Avg_Points_A', 'CV_Match_Type', 'Elo_Home', 'Tilt_Home', 'Elo_Away', 'Tilt_Away', 'Elo_Difference', 'Avg_Power_Ranking_H', 'CV_Avg_Power_Ranking_H', 'Avg_Power_Ranking_A', 'CV_Avg_Power_Ranking_A']], use_container_width=True, hide_index=True)
-            else:
-                st.warning("No games found with the specified criteria.")
-        except Exception as e:
-            st.error(f"Erro ao carregar ou processar os dados para Back Home: {e}")
-    else:
-        st.error("No Data Available for the Chosen Date")
+                # Exibir dados filtrados
+                if not lay_home_flt.empty:
+                    st.dataframe(lay_home_flt[['League', 'Time', 'Home', 'Away', 'Round', 'FT_Odd_H', 'FT_Odd_A', 'FT_Odd_D', 'Odd_Home_Justa', 'Odd_Away_Justa', 'Avg_Points_H','CV_Avg_Points_H', 'Avg_Points_A', 'CV_Avg_Points_A', 'CV_Match_Type', 'Elo_Home', 'Tilt_Home', 'Elo_Away', 'Tilt_Away', 'Elo_Difference', 'Avg_Power_Ranking_H', 'CV_Avg_Power_Ranking_H', 'Avg_Power_Ranking_A', 'CV_Avg_Power_Ranking_A']], use_container_width=True, hide_index=True)
+                else:
+                    st.warning("No games found with the specified criteria.")
+            except Exception as e:
+                st.error(f"Erro ao carregar ou processar os dados para Back Home: {e}")
+        else:
+            st.error("No Data Available for the Chosen Date")
 
 with tab_views[3]:
-    st.markdown(f"#### Todays Games for Lay Away ####")
-    try:
-        lay_away['VAR1'] = np.sqrt((lay_away['FT_Odd_H'] - lay_away['FT_Odd_A'])**2)
-        lay_away['VAR2'] = np.degrees(np.arctan((lay_away['FT_Odd_A'] - lay_away['FT_Odd_H']) / 2))
-        lay_away['VAR3'] = np.degrees(np.arctan((lay_away['FT_Odd_D'] - lay_away['FT_Odd_A']) / 2))
-    except KeyError as e:
-        st.error(f"No Games Available for Lay Away: {e}")
-    
-    if lay_away is not None:
-        try:
-            # Carregar os dados de Elo e Tilt apenas uma vez
-            if 'Elo_Home' not in lay_away.columns or 'Elo_Away' not in lay_away.columns:
-                df_elo_tilt = elo_tilt_data
-                
-                # Merge para adicionar dados de Elo e Tilt
-                lay_away = lay_away.merge(df_elo_tilt[['Team', 'Elo', 'Tilt']], left_on='Home', right_on='Team', how='left')
-                lay_away = lay_away.rename(columns={'Elo': 'Elo_Home', 'Tilt': 'Tilt_Home'})
-                lay_away = lay_away.merge(df_elo_tilt[['Team', 'Elo', 'Tilt']], left_on='Away', right_on='Team', how='left')
-                lay_away = lay_away.rename(columns={'Elo': 'Elo_Away', 'Tilt': 'Tilt_Away'})
-                
-                # Calcular a diferença de Elo
-                lay_away['Elo_Difference'] = lay_away['Elo_Home'] - lay_away['Elo_Away']
-                
-            # Calcular as odds justas, caso ainda não estejam calculadas
-            HFA = 50 * 0.15
-            lay_away['dr'] = (lay_away['Elo_Home'] + HFA) - lay_away['Elo_Away']
-            lay_away['P_Home'] = 1 / (10 ** (-lay_away['dr'] / 400) + 1)
-            lay_away['P_Away'] = 1 - lay_away['P_Home']
-            lay_away['Odd_Home_Justa'] = (1 / lay_away['P_Home']).round(2)
-            lay_away['Odd_Away_Justa'] = (1 / lay_away['P_Away']).round(2)
-            
-            # Filtro para Lay Away
-            lay_away_flt = lay_away[(lay_away['VAR1'] >=4) & (lay_away["VAR2"] >= 60) & (lay_away["VAR3"] <= -60) & (lay_away['FT_Odd_A'] > 2)]
+    if tab_views[3].open:
+        st.markdown(f"#### Todays Games for Lay Away ####")
+        if data is not None:
+            try:
+                # Filtro para Lay Away
+                lay_away_flt = data[(data['VAR1'] >=4) & (data["VAR2"] >= 60) & (data["VAR3"] <= -60) & (data['FT_Odd_A'] > 2)]
             
-            # Exibir dados filtrados
-            if not lay_away_flt.empty:
-                st.dataframe(lay_away_flt[['League', 'Time', 'Round', 'Home', 'Away', 'FT_Odd_H', 'FT_Odd_A', 'FT_Odd_D', 'Odd_Home_Justa', 'Odd_Away_Justa', 'Avg_Points_H', 'CV_Avg_Points_H', 'Avg_Points_A','CV_Avg_Points_A', 'CV_Match_Type', 'Elo_Home', 'Tilt_Home', 'Elo_Away', 'Tilt_Away', 'Elo_Difference', 'Avg_Power_Ranking_H', 'CV_Avg_Power_Ranking_H', 'Avg_Power_Ranking_A', 'CV_Avg_Power_Ranking_A']], use_container_width=True, hide_index=True)
-            else:
-                st.warning("No games found with the specified criteria.")
-        except Exception as e:
-            st.error(f"No Data Available for the Chosen Date: {e}")
-    else:
-        st.error("No Data Available for the Chosen Date")
+                # Exibir dados filtrados
+                if not lay_away_flt.empty:
+                    st.dataframe(lay_away_flt[['League', 'Time', 'Round', 'Home', 'Away', 'FT_Odd_H', 'FT_Odd_A', 'FT_Odd_D', 'Odd_Home_Justa', 'Odd_Away_Justa', 'Avg_Points_H', 'CV_Avg_Points_H', 'Avg_Points_A','CV_Avg_Points_A', 'CV_Match_Type', 'Elo_Home', 'Tilt_Home', 'Elo_Away', 'Tilt_Away', 'Elo_Difference', 'Avg_Power_Ranking_H', 'CV_Avg_Power_Ranking_H', 'Avg_Power_Ranking_A', 'CV_Avg_Power_Ranking_A']], use_container_width=True, hide_index=True)
+                else:
+                    st.warning("No games found with the specified criteria.")
+            except Exception as e:
+                st.error(f"No Data Available for the Chosen Date: {e}")
+        else:
+            st.error("No Data Available for the Chosen Date")
         
 with tab_views[4]:
-    st.markdown(f'#### Over 0,5 HT - Method Automatic Pivot Table ####')
-
-    # List of columns to display
-    columns_to_display = [
-        'Time', 'League', 'Home', 'Away', 'Round', 'FT_Odd_H', 'FT_Odd_D', 'FT_Odd_A', 'CV_Match_Type', 'Favorite', 'Perc_Over05HT_Home', 'Perc_Over05HT_Away'
-    ]
+    if tab_views[4].open:
+        st.markdown(f'#### Over 0,5 HT - Method Automatic Pivot Table ####')
 
-    if data is not None:
-        # Create a list to hold all filtered dataframes
-        filtered_dataframes = []
-
-        # Apply filters for each league and method
-        back_over05_argentina01_ht_flt = data[
-            (data["League"] == 'WORLD - WORLD CHAMPIONSHIP') &
-            (data["BTTSN_BTTSY"] >= 3.00) &
-            (data["BTTSN_BTTSY"] <= 3.81) &
-            (data["H_BTTSY"] >= 3.30) &
-            (data["H_BTTSY"] <= 4.29) 
+        # List of columns to display
+        columns_to_display = [
+            'Time', 'League', 'Home', 'Away', 'Round', 'FT_Odd_H', 'FT_Odd_D', 'FT_Odd_A', 'CV_Match_Type', 'Favorite', 'Perc_Over05HT_Home', 'Perc_Over05HT_Away'
         ]
-        filtered_dataframes.append(back_over05_argentina01_ht_flt)
 
-        
-        
-        # Concatenate all filtered dataframes
-        df_ligas_over05_ht = pd.concat(filtered_dataframes, ignore_index=True)
+        if data is not None:
+            # Apply the rules of every league and method in a single pass
+            df_ligas_over05_ht = filter_by_rules(data, over05_ht_rules)
 
-        # Sort by 'Time' and select only the desired columns
-        df_ligas_over05_ht = df_ligas_over05_ht[columns_to_display].sort_values(by='Time', ascending=True)
+            # Sort by 'Time' and select only the desired columns
+            df_ligas_over05_ht = df_ligas_over05_ht[columns_to_display].sort_values(by='Time', ascending=True)
 
-        # Display the final dataframe
-        if not df_ligas_over05_ht.empty:
-            st.dataframe(df_ligas_over05_ht, use_container_width=True, hide_index=True)
+            # Display the final dataframe
+            if not df_ligas_over05_ht.empty:
+                st.dataframe(df_ligas_over05_ht, use_container_width=True, hide_index=True)
+            else:
+                st.warning("No games found with the specified criteria.")
         else:
-            st.warning("No games found with the specified criteria.")
-    else:
-        st.error("No Data Available for the Chosen Date")
+            st.error("No Data Available for the Chosen Date")
     
 with tab_views[5]:
-    st.markdown(f'#### Under 0,5 HT - Method Automatic Pivot Table ####')
-
-    # List of columns to display
-    columns_to_display = [
-        'Time', 'League', 'Home', 'Away', 'Round', 'FT_Odd_H', 'FT_Odd_D', 'FT_Odd_A', 'CV_Match_Type', 'Favorite', 'Perc_Under05HT_Home', 'Perc_Under05HT_Away'
-    ]
+    if tab_views[5].open:
+        st.markdown(f'#### Under 0,5 HT - Method Automatic Pivot Table ####')
 
-    if data is not None:
-        # Create a list to hold all filtered dataframes
-        filtered_dataframes = []
-
-        # Apply filters for each league and method
-        back_under05_argentina01_ht_flt = data[
-            (data["League"] == 'WORLD - WORLD CHAMPIONSHIP') &
-            (data["Angle_UnOv"] >= -3.21) &
-            (data["Angle_UnOv"] <= -1.16) &
-            (data["D_BTTSY"] >= 0.37) &
-            (data["D_BTTSY"] <= 0.47) 
+        # List of columns to display
+        columns_to_display = [
+            'Time', 'League', 'Home', 'Away', 'Round', 'FT_Odd_H', 'FT_Odd_D', 'FT_Odd_A', 'CV_Match_Type', 'Favorite', 'Perc_Under05HT_Home', 'Perc_Under05HT_Away'
         ]
-        filtered_dataframes.append(back_under05_argentina01_ht_flt)
 
-        
-        
-        # Concatenate all filtered dataframes
-        df_ligas_under05_ht = pd.concat(filtered_dataframes, ignore_index=True)
+        if data is not None:
+            # Apply the rules of every league and method in a single pass
+            df_ligas_under05_ht = filter_by_rules(data, under05_ht_rules)
 
-        # Sort by 'Time' and select only the desired columns
-        df_ligas_under05_ht = df_ligas_under05_ht[columns_to_display].sort_values(by='Time', ascending=True)
+            # Sort by 'Time' and select only the desired columns
+            df_ligas_under05_ht = df_ligas_under05_ht[columns_to_display].sort_values(by='Time', ascending=True)
 
-        # Display the final dataframe
-        if not df_ligas_under05_ht.empty:
-            st.dataframe(df_ligas_under05_ht, use_container_width=True, hide_index=True)
+            # Display the final dataframe
+            if not df_ligas_under05_ht.empty:
+                st.dataframe(df_ligas_under05_ht, use_container_width=True, hide_index=True)
+            else:
+                st.warning("No games found with the specified criteria.")
         else:
-            st.warning("No games found with the specified criteria.")
-    else:
-        st.error("No Data Available for the Chosen Date")
+            st.error("No Data Available for the Chosen Date")
 
 with tab_views[6]:
-    st.markdown(f'#### Todays Games for Over 1,5 FT ####')
-    st.markdown('If the Odd is less than 1.45, you must wait for it to reach minimum 1.45')
-    if data is not None:
-        # Aplicar os filtros
-        over_15_ft_flt = data[
-            ((data["Perc_Over15FT_Home"] + data["Perc_Over15FT_Away"]) / 2 > 65) &
-            ((data["Perc_BTTS_Yes_FT_Home"] + data["Perc_BTTS_Yes_FT_Away"]) / 2 > 65) &
-            (data["Avg_G_Scored_H_FT"] > 1) &
-            (data["CV_Avg_G_Scored_H_FT"] < 1) &
-            (data["Avg_G_Scored_A_FT"] > 1) &
-            (data["CV_Avg_G_Scored_A_FT"] < 1) &
-            (data["Avg_G_Conceded_H_FT"] > 1) &
-            (data["CV_Avg_G_Conceded_H_FT"] < 1) &
-            (data["Avg_G_Conceded_A_FT"] > 1) &
-            (data["CV_Avg_G_Conceded_A_FT"] < 1)
-        ]
-        over_15_ft_flt = over_15_ft_flt.sort_values(by='Time', ascending=True)
+    if tab_views[6].open:
+        st.markdown(f'#### Todays Games for Over 1,5 FT ####')
+        st.markdown('If the Odd is less than 1.45, you must wait for it to reach minimum 1.45')
+        if data is not None:
+            # Aplicar os filtros
+            over_15_ft_flt = data[
+                ((data["Perc_Over15FT_Home"] + data["Perc_Over15FT_Away"]) / 2 > 65) &
+                ((data["Perc_BTTS_Yes_FT_Home"] + data["Perc_BTTS_Yes_FT_Away"]) / 2 > 65) &
+                (data["Avg_G_Scored_H_FT"] > 1) &
+                (data["CV_Avg_G_Scored_H_FT"] < 1) &
+                (data["Avg_G_Scored_A_FT"] > 1) &
+                (data["CV_Avg_G_Scored_A_FT"] < 1) &
+                (data["Avg_G_Conceded_H_FT"] > 1) &
+                (data["CV_Avg_G_Conceded_H_FT"] < 1) &
+                (data["Avg_G_Conceded_A_FT"] > 1) &
+                (data["CV_Avg_G_Conceded_A_FT"] < 1)
+            ]
+            over_15_ft_flt = over_15_ft_flt.sort_values(by='Time', ascending=True)
 
-        # Selecionar apenas as colunas desejadas
-        selected_columns = ["League", "Time", "Home", "Away", "FT_Odd_H", "FT_Odd_D", "FT_Odd_A", "CV_Match_Type", "Perc_Over15FT_Home", "Perc_Over15FT_Away", "Perc_Over25FT_Home", "Perc_Over25FT_Away"]
-        selected_columns = [col for col in selected_columns if col in over_15_ft_flt.columns]
-        over_15_ft_flt = over_15_ft_flt[selected_columns]
+            # Selecionar apenas as colunas desejadas
+            selected_columns = ["League", "Time", "Home", "Away", "FT_Odd_H", "FT_Odd_D", "FT_Odd_A", "CV_Match_Type", "Perc_Over15FT_Home", "Perc_Over15FT_Away", "Perc_Over25FT_Home", "Perc_Over25FT_Away"]
+            selected_columns = [col for col in selected_columns if col in over_15_ft_flt.columns]
+            over_15_ft_flt = over_15_ft_flt[selected_columns]
 
-        # Exibir os dados filtrados
-        if not over_15_ft_flt.empty:
-            st.dataframe(over_15_ft_flt, use_container_width=True, hide_index=True)
+            # Exibir os dados filtrados
+            if not over_15_ft_flt.empty:
+                st.dataframe(over_15_ft_flt, use_container_width=True, hide_index=True)
+            else:
+                st.warning("No games found with the specified criteria.")
         else:
-            st.warning("No games found with the specified criteria.")
-    else:
-        st.error("No Data Available for the Chosen Date")
+            st.error("No Data Available for the Chosen Date")
 
 with tab_views[7]:
-    st.markdown(f'#### Todays Games for Under 1,5 FT ####')
-    st.markdown('Croatia Method 1')
-    if data is not None:
-        # Aplicar os filtros
-        under_15_croatia_01_ft_flt = data[
-            (data["League"] == 'CROATIA - HNL') &
-            (data["Points"] == 'Points_Home') &
-            (data["RPS_OVUnd"] == 'Bigger_Away') &
-            (data["Poisson_GS_H_2"] > 0.1660) &
-            (data["Poisson_GS_H_2"] < 0.2610) &
-            (data["Avg_CG_Scored_A_02"] > 0.5550) &
-            (data["Avg_CG_Scored_A_02"] < 0.8390)
-        ]
-        under_15_croatia_01_ft_flt = under_15_croatia_01_ft_flt.sort_values(by='Time', ascending=True)
-
-        # Exibir os dados filtrados
-        if not under_15_croatia_01_ft_flt.empty:
-            st.dataframe(under_15_croatia_01_ft_flt, use_container_width=True, hide_index=True)
-        else:
-            st.warning("No games found with the specified criteria.")
-    else:
-        st.error("Dados indisponíveis para a data selecionada.")
-    st.markdown('Croatia Method 2')
-    if data is not None:
-        # Aplicar os filtros
-        under_15_croatia_02_ft_flt = data[
-            (data["League"] == 'CROATIA - HNL') &
-            (data["Points"] == 'Points_Home') &
-            (data["RPS_OVUnd"] == 'Bigger_Away') &
-            (data["Poisson_GS_H_2"] > 0.1660) &
-            (data["Poisson_GS_H_2"] < 0.2610) &
-            (data["Avg_CG_Conceded_H_02"] > 0.7080) &
-            (data["Avg_CG_Conceded_H_02"] < 0.9270)
-        ]
-        under_15_croatia_02_ft_flt = under_15_croatia_02_ft_flt.sort_values(by='Time', ascending=True)
-
-        # Exibir os dados filtrados
-        if not under_15_croatia_02_ft_flt.empty:
-            st.dataframe(under_15_croatia_02_ft_flt, use_container_width=True, hide_index=True)
-        else:
-            st.warning("No games found with the specified criteria.")
-    else:
-        st.error("No Data Available for the Chosen Date")
-    st.markdown('Croatia Method 3')
-    if data is not None:
-        # Aplicar os filtros
-        under_15_croatia_03_ft_flt = data[
-            (data["League"] == 'CROATIA - HNL') &
-            (data["Points"] == 'Points_Home') &
-            (data["RPS_OVUnd"] == 'Bigger_Away') &
-            (data["prob_G_Scored_H"] > 0.9020) &
-            (data["prob_G_Scored_H"] < 1.5720) &
-            (data["prob_G_Conceded_H"] > 0.9370) &
-            (data["prob_G_Conceded_H"] < 1.3880)
-        ]
-        under_15_croatia_03_ft_flt = under_15_croatia_03_ft_flt.sort_values(by='Time', ascending=True)
-
-        # Exibir os dados filtrados
-        if not under_15_croatia_03_ft_flt.empty:
-            st.dataframe(under_15_croatia_03_ft_flt, use_container_width=True, hide_index=True)
-        else:
-            st.warning("No games found with the specified criteria.")
-    else:
-        st.error("No Data Available for the Chosen Date")
+    if tab_views[7].open:
+        st.markdown(f'#### Todays Games for Under 1,5 FT ####')
+        if data is not None:
+            # Apply the rules of every method in a single pass, keeping one column per method
+            under_15_ft_matches = rule_matches(data, under_15_ft_rules)
+
+        for method_name, rule_name in [('Croatia Method 1', 'under_15_croatia_01_ft'), ('Croatia Method 2', 'under_15_croatia_02_ft'), ('Croatia Method 3', 'under_15_croatia_03_ft')]:
+            st.markdown(method_name)
+            if data is not None:
+                under_15_ft_flt = data[under_15_ft_matches[rule_name]].sort_values(by='Time', ascending=True)
+
+                # Exibir os dados filtrados
+                if not under_15_ft_flt.empty:
+                    st.dataframe(under_15_ft_flt, use_container_width=True, hide_index=True)
+                else:
+                    st.warning("No games found with the specified criteria.")
+            else:
+                st.error("No Data Available for the Chosen Date")
         
 with tab_views[8]:
-    st.markdown(f'#### Over 2,5 FT ####')
-    st.markdown(f'#### Cost of Goal 2.0 ####')
+    if tab_views[8].open:
+        st.markdown(f'#### Over 2,5 FT ####')
+        st.markdown(f'#### Cost of Goal 2.0 ####')
     
-    if data_Ov25_FT is not None:
-        CG02_data_Ov25_FT = data_Ov25_FT[
-            (data_Ov25_FT['Perc_Over25FT_Home'] >= 60) & (data_Ov25_FT['Perc_Over25FT_Away'] > 60) &
-            (data_Ov25_FT['Perc_BTTS_Yes_FT_Home'] >= 60) & (data_Ov25_FT['Perc_BTTS_Yes_FT_Away'] >= 60) &
-            (data_Ov25_FT['Avg_CG_Scored_H_02'] >= 0.8) & (data_Ov25_FT['Avg_CG_Scored_A_02'] >= 0.8) &
-            (data_Ov25_FT['Avg_CG_Conceded_H_02'] >= 0.8) & (data_Ov25_FT['Avg_CG_Conceded_A_02'] > 0.8) &
-            (data_Ov25_FT['CV_Avg_CG_Scored_H_02'] <= 0.7) & (data_Ov25_FT['CV_Avg_CG_Scored_A_02'] < 0.7) &
-            (data_Ov25_FT['CV_Avg_CG_Conceded_H_02'] <= 0.7) & (data_Ov25_FT['CV_Avg_CG_Conceded_A_02'] <= 0.7)
-            ]
+        if data is not None:
+            CG02_data = data[
+                (data['Perc_Over25FT_Home'] >= 60) & (data['Perc_Over25FT_Away'] > 60) &
+                (data['Perc_BTTS_Yes_FT_Home'] >= 60) & (data['Perc_BTTS_Yes_FT_Away'] >= 60) &
+                (data['Avg_CG_Scored_H_02'] >= 0.8) & (data['Avg_CG_Scored_A_02'] >= 0.8) &
+                (data['Avg_CG_Conceded_H_02'] >= 0.8) & (data['Avg_CG_Conceded_A_02'] > 0.8) &
+                (data['CV_Avg_CG_Scored_H_02'] <= 0.7) & (data['CV_Avg_CG_Scored_A_02'] < 0.7) &
+                (data['CV_Avg_CG_Conceded_H_02'] <= 0.7) & (data['CV_Avg_CG_Conceded_A_02'] <= 0.7)
+                ]
     
-    # Display the final DataFrame
-        if not CG02_data_Ov25_FT.empty:
-            # Define columns to display
-            columns_to_display = [
-                'League', 'Time', 'Round', 'Home', 'Away', 'CV_Match_Type', 'Perc_Over25FT_Home', 'Perc_Over25FT_Away', 
-                'Perc_BTTS_Yes_FT_Home', 'Perc_BTTS_Yes_FT_Away' ]
-            st.dataframe(CG02_data_Ov25_FT[columns_to_display], use_container_width=True, hide_index=True)
-        else:
-            st.warning("No games found with the specified criteria.")
+        # Display the final DataFrame
+            if not CG02_data.empty:
+                # Define columns to display
+                columns_to_display = [
+                    'League', 'Time', 'Round', 'Home', 'Away', 'CV_Match_Type', 'Perc_Over25FT_Home', 'Perc_Over25FT_Away', 
+                    'Perc_BTTS_Yes_FT_Home', 'Perc_BTTS_Yes_FT_Away' ]
+                st.dataframe(CG02_data[columns_to_display], use_container_width=True, hide_index=True)
+            else:
+                st.warning("No games found with the specified criteria.")
         
-    st.markdown(f'#### Normal Average ####')
+        st.markdown(f'#### Normal Average ####')
     
-    if data_Ov25_FT is not None:
-        avg_data_Ov25_FT = data_Ov25_FT[
-            (data_Ov25_FT['Perc_Over25FT_Home'] > 55) & (data_Ov25_FT['Perc_Over25FT_Away'] > 55) &
-            (data_Ov25_FT['Perc_BTTS_Yes_FT_Home'] > 55) & (data_Ov25_FT['Perc_BTTS_Yes_FT_Away'] > 55) &
-            (data_Ov25_FT['Avg_G_Scored_H_FT_Value'] > 1) & (data_Ov25_FT['Avg_G_Scored_A_FT_Value'] > 1) &
-            (data_Ov25_FT['Avg_G_Conceded_H_FT_Value'] > 1) & (data_Ov25_FT['Avg_G_Conceded_A_FT_Value'] > 1) &
-            (data_Ov25_FT['CV_Avg_G_Scored_H_FT_Value'] < 1) & (data_Ov25_FT['CV_Avg_G_Scored_A_FT_Value'] < 1) &
-            (data_Ov25_FT['CV_Avg_G_Conceded_H_FT_Value'] < 1) & (data_Ov25_FT['CV_Avg_G_Conceded_A_FT_Value'] < 1)
-            ]
+        if data is not None:
+            avg_data = data[
+                (data['Perc_Over25FT_Home'] > 55) & (data['Perc_Over25FT_Away'] > 55) &
+                (data['Perc_BTTS_Yes_FT_Home'] > 55) & (data['Perc_BTTS_Yes_FT_Away'] > 55) &
+                (data['Avg_G_Scored_H_FT_Value'] > 1) & (data['Avg_G_Scored_A_FT_Value'] > 1) &
+                (data['Avg_G_Conceded_H_FT_Value'] > 1) & (data['Avg_G_Conceded_A_FT_Value'] > 1) &
+                (data['CV_Avg_G_Scored_H_FT_Value'] < 1) & (data['CV_Avg_G_Scored_A_FT_Value'] < 1) &
+                (data['CV_Avg_G_Conceded_H_FT_Value'] < 1) & (data['CV_Avg_G_Conceded_A_FT_Value'] < 1)
+                ]
     
-    # Display the final DataFrame
-        if not avg_data_Ov25_FT.empty:
-            # Define columns to display
-            columns_to_display = [
-                'League', 'Time', 'Round', 'Home', 'Away', 'CV_Match_Type', 'Perc_Over25FT_Home', 'Perc_Over25FT_Away', 
-                'Perc_BTTS_Yes_FT_Home', 'Perc_BTTS_Yes_FT_Away' ]
-            st.dataframe(avg_data_Ov25_FT[columns_to_display], use_container_width=True, hide_index=True)
+        # Display the final DataFrame
+            if not avg_data.empty:
+                # Define columns to display
+                columns_to_display = [
+                    'League', 'Time', 'Round', 'Home', 'Away', 'CV_Match_Type', 'Perc_Over25FT_Home', 'Perc_Over25FT_Away', 
+                    'Perc_BTTS_Yes_FT_Home', 'Perc_BTTS_Yes_FT_Away' ]
+                st.dataframe(avg_data[columns_to_display], use_container_width=True, hide_index=True)
+            else:
+                st.warning("No games found with the specified criteria.")
         else:
-            st.warning("No games found with the specified criteria.")
-    else:
-        st.error("Data is empty.")
+            st.error("Data is empty.")
         
 with tab_views[9]:
-    st.markdown(f'#### Games with High Probability for BTTS Yes ####')
+    if tab_views[9].open:
+        st.markdown(f'#### Games with High Probability for BTTS Yes ####')
     
-    if data_btts is not None:
-        base_btts = data_btts[
-            (((data_btts['Avg_G_Scored_H_FT'] + data_btts['Avg_G_Conceded_H_FT']) + (data_btts['Avg_G_Scored_A_FT'] + data_btts['Avg_G_Conceded_A_FT'])) / 2 >= 2.70) &
-            ((data_btts['Avg_G_Scored_H_FT'] + data_btts['Avg_G_Conceded_A_FT']) /2 > 1.42) & 
-            ((data_btts['Avg_G_Scored_A_FT'] + data_btts['Avg_G_Conceded_H_FT']) /2 > 1.42) &
-            (data_btts['Perc_BTTS_Yes_FT_Home'] > 50) & (data_btts['Perc_BTTS_Yes_FT_Away'] > 50) & 
-            (data_btts['Perc_Over25FT_Home'] > 50) & (data_btts['Perc_Over25FT_Away'] > 50)
-            ]
+        if data is not None:
+            base_btts = data[
+                (((data['Avg_G_Scored_H_FT'] + data['Avg_G_Conceded_H_FT']) + (data['Avg_G_Scored_A_FT'] + data['Avg_G_Conceded_A_FT'])) / 2 >= 2.70) &
+                ((data['Avg_G_Scored_H_FT'] + data['Avg_G_Conceded_A_FT']) /2 > 1.42) & 
+                ((data['Avg_G_Scored_A_FT'] + data['Avg_G_Conceded_H_FT']) /2 > 1.42) &
+                (data['Perc_BTTS_Yes_FT_Home'] > 50) & (data['Perc_BTTS_Yes_FT_Away'] > 50) & 
+                (data['Perc_Over25FT_Home'] > 50) & (data['Perc_Over25FT_Away'] > 50)
+                ]
         
-    # Display the final DataFrame
-        if not base_btts.empty:
-            # Define columns to display
-            columns_to_display = [
-                'League', 'Time', 'Round', 'Home', 'Away', 'CV_Match_Type', 'Perc_Over25FT_Home', 'Perc_Over25FT_Away', 
-                'Perc_BTTS_Yes_FT_Home', 'Perc_BTTS_Yes_FT_Away' ]
-            st.dataframe(base_btts[columns_to_display], use_container_width=True, hide_index=True)
+        # Display the final DataFrame
+            if not base_btts.empty:
+                # Define columns to display
+                columns_to_display = [
+                    'League', 'Time', 'Round', 'Home', 'Away', 'CV_Match_Type', 'Perc_Over25FT_Home', 'Perc_Over25FT_Away', 
+                    'Perc_BTTS_Yes_FT_Home', 'Perc_BTTS_Yes_FT_Away' ]
+                st.dataframe(base_btts[columns_to_display], use_container_width=True, hide_index=True)
+            else:
+                st.warning("No games found with the specified criteria.")
         else:
-            st.warning("No games found with the specified criteria.")
-    else:
-        st.error("Data is empty.")
+            st.error("Data is empty.")
         
 with tab_views[10]:
-    st.markdown('#### Best Teams for Louro José ####')
+    if tab_views[10].open:
+        st.markdown('#### Best Teams for Louro José ####')
     
-    if data is not None:
-        # Apply the extra filter conditions
-        conditions = [
-            (data['Avg_G_Scored_H_SH'] > 1) & (data['Avg_G_Conceded_A_SH'] > 1),
-            (data['Avg_G_Scored_A_SH'] > 1) & (data['Avg_G_Conceded_H_SH'] > 1),
-            (data['Avg_G_Scored_H_SH'] > 1) & (data['Avg_G_Scored_A_SH'] > 1),
-            (data['Avg_G_Conceded_H_SH'] > 1) & (data['Avg_G_Conceded_A_SH'] > 1)
-        ]
+        if data is not None:
+            # Apply the extra filter conditions
+            conditions = [
+                (data['Avg_G_Scored_H_SH'] > 1) & (data['Avg_G_Conceded_A_SH'] > 1),
+                (data['Avg_G_Scored_A_SH'] > 1) & (data['Avg_G_Conceded_H_SH'] > 1),
+                (data['Avg_G_Scored_H_SH'] > 1) & (data['Avg_G_Scored_A_SH'] > 1),
+                (data['Avg_G_Conceded_H_SH'] > 1) & (data['Avg_G_Conceded_A_SH'] > 1)
+            ]
         
-        # Combine conditions using logical OR
-        combined_condition = conditions[0]
-        for condition in conditions[1:]:
-            combined_condition |= condition
+            # Combine conditions using logical OR
+            combined_condition = conditions[0]
+            for condition in conditions[1:]:
+                combined_condition |= condition
         
-        # Filter data
-        df_louro_jose = data[combined_condition].drop_duplicates(subset=['Home'])
+            # Filter data
+            df_louro_jose = data[combined_condition].drop_duplicates(subset=['Home'])
         
-        # Sort by 'Time' (ensure 'Time' is in a sortable format)
-        df_louro_jose = df_louro_jose.sort_values(by='Time', ascending=True)
+            # Sort by 'Time' (ensure 'Time' is in a sortable format)
+            df_louro_jose = df_louro_jose.sort_values(by='Time', ascending=True)
         
-        # Define columns to display
-        columns_to_display = [
-            'League', 'Time', 'Round', 'Home', 'Away', 'FT_Odd_Over25', 'FT_Odd_BTTS_Yes', 'CV_Match_Type',
-            'CV_Avg_G_Scored_H_ST', 'CV_Avg_G_Scored_A_ST', 'Perc_Over15ST_Home', 'Perc_Over15ST_Away', 
-            'Perc_Over15FT_Home', 'Perc_Over15FT_Away', 'Perc_Over25FT_Home', 'Perc_Over25FT_Away'
-        ]
+            # Define columns to display
+            columns_to_display = [
+                'League', 'Time', 'Round', 'Home', 'Away', 'FT_Odd_Over25', 'FT_Odd_BTTS_Yes', 'CV_Match_Type',
+                'CV_Avg_G_Scored_H_ST', 'CV_Avg_G_Scored_A_ST', 'Perc_Over15ST_Home', 'Perc_Over15ST_Away', 
+                'Perc_Over15FT_Home', 'Perc_Over15FT_Away', 'Perc_Over25FT_Home', 'Perc_Over25FT_Away'
+            ]
         
-        # Check if columns exist in the DataFrame
-        columns_to_display = [col for col in columns_to_display if col in df_louro_jose.columns]
+            # Check if columns exist in the DataFrame
+            columns_to_display = [col for col in columns_to_display if col in df_louro_jose.columns]
         
-        # Display the final DataFrame
-        st.dataframe(df_louro_jose[columns_to_display], use_container_width=True, hide_index=True)
-    else:
-        st.warning("No games found with the specified criteria.")
+            # Display the final DataFrame
+            st.dataframe(df_louro_jose[columns_to_display], use_container_width=True, hide_index=True)
+        else:
+            st.warning("No games found with the specified criteria.")
 
 with tab_views[11]:
-    st.markdown(f'#### Best Teams with > 60% Probability - Last 11 Games ####')
-    if data is not None:
-        # Apply the extra filter conditions
-        flt_home_SFW = data[data['Perc_Scored_First_and_Won_H'] > 60]
-        flt_home_SFD = data[data['Perc_Scored_First_and_Draw_H'] > 60]
-        flt_home_SFL = data[data['Perc_Scored_First_and_Lost_H'] > 60]
-        flt_home_CFW = data[data['Perc_Conceded_First_and_Won_H'] > 60]
-        flt_home_CFD = data[data['Perc_Conceded_First_and_Draw_H'] > 60]
-        flt_home_CFL = data[data['Perc_Conceded_First_and_Lost_H'] > 60]
-        flt_home_DilV = data[data['Perc_Dilatou_Vantagem_1_Golo_H'] > 50]
-        flt_away_SFW = data[data['Perc_Scored_First_and_Won_A'] > 60]
-        flt_away_SFD = data[data['Perc_Scored_First_and_Draw_A'] > 60]
-        flt_away_SFL = data[data['Perc_Scored_First_and_Lost_A'] > 60]
-        flt_away_CFW = data[data['Perc_Conceded_First_and_Won_A'] > 60]
-        flt_away_CFD = data[data['Perc_Conceded_First_and_Draw_A'] > 60]
-        flt_away_CFL = data[data['Perc_Conceded_First_and_Lost_A'] > 60]
-        flt_away_DilV = data[data['Perc_Dilatou_Vantagem_1_Golo_A'] > 50]
+    if tab_views[11].open:
+        st.markdown(f'#### Best Teams with > 60% Probability - Last 11 Games ####')
+        if data is not None:
+            # Apply the extra filter conditions
+            flt_home_SFW = data[data['Perc_Scored_First_and_Won_H'] > 60]
+            flt_home_SFD = data[data['Perc_Scored_First_and_Draw_H'] > 60]
+            flt_home_SFL = data[data['Perc_Scored_First_and_Lost_H'] > 60]
+            flt_home_CFW = data[data['Perc_Conceded_First_and_Won_H'] > 60]
+            flt_home_CFD = data[data['Perc_Conceded_First_and_Draw_H'] > 60]
+            flt_home_CFL = data[data['Perc_Conceded_First_and_Lost_H'] > 60]
+            flt_home_DilV = data[data['Perc_Dilatou_Vantagem_1_Golo_H'] > 50]
+            flt_away_SFW = data[data['Perc_Scored_First_and_Won_A'] > 60]
+            flt_away_SFD = data[data['Perc_Scored_First_and_Draw_A'] > 60]
+            flt_away_SFL = data[data['Perc_Scored_First_and_Lost_A'] > 60]
+            flt_away_CFW = data[data['Perc_Conceded_First_and_Won_A'] > 60]
+            flt_away_CFD = data[data['Perc_Conceded_First_and_Draw_A'] > 60]
+            flt_away_CFL = data[data['Perc_Conceded_First_and_Lost_A'] > 60]
+            flt_away_DilV = data[data['Perc_Dilatou_Vantagem_1_Golo_A'] > 50]
         
-        # Define columns to display
-        columns_to_display = [
-            'League', 'Time', 'Round', 'Home', 'Away', 'CV_Match_Type', 'Perc_Home_Win_FT', 'Perc_Draw_Win_H_FT', 
-            'Perc_Draw_Win_A_FT', 'Perc_Away_Win_FT' ]
+            # Define columns to display
+            columns_to_display = [
+                'League', 'Time', 'Round', 'Home', 'Away', 'CV_Match_Type', 'Perc_Home_Win_FT', 'Perc_Draw_Win_H_FT', 
+                'Perc_Draw_Win_A_FT', 'Perc_Away_Win_FT' ]
         
-        # Check if columns exist in the DataFrame
-        columns_to_display = [col for col in columns_to_display if col in data.columns]
+            # Check if columns exist in the DataFrame
+            columns_to_display = [col for col in columns_to_display if col in data.columns]
         
-        # Display the final DataFrame
-        st.markdown('#### Home Scored First and Won ####')
-        if not flt_home_SFW.empty:
-            st.dataframe(flt_home_SFW[columns_to_display], use_container_width=True, hide_index=True)
-        else:
-            st.warning("No games found with the specified criteria.")
+            # Display the final DataFrame
+            st.markdown('#### Home Scored First and Won ####')
+            if not flt_home_SFW.empty:
+                st.dataframe(flt_home_SFW[columns_to_display], use_container_width=True, hide_index=True)
+            else:
+                st.warning("No games found with the specified criteria.")
         
-        st.markdown('#### Home Scored First and Draw ####')
-        if not flt_home_SFD.empty:
-            st.dataframe(flt_home_SFD[columns_to_display], use_container_width=True, hide_index=True)
-        else:
-            st.warning("No games found with the specified criteria.")
+            st.markdown('#### Home Scored First and Draw ####')
+            if not flt_home_SFD.empty:
+                st.dataframe(flt_home_SFD[columns_to_display], use_container_width=True, hide_index=True)
+            else:
+                st.warning("No games found with the specified criteria.")
         
-        st.markdown('#### Home Scored First and Lost ####')
-        if not flt_home_SFL.empty:
-            st.dataframe(flt_home_SFL[columns_to_display], use_container_width=True, hide_index=True)
-        else:
-            st.warning("No games found with the specified criteria.")
+            st.markdown('#### Home Scored First and Lost ####')
+            if not flt_home_SFL.empty:
+                st.dataframe(flt_home_SFL[columns_to_display], use_container_width=True, hide_index=True)
+            else:
+                st.warning("No games found with the specified criteria.")
         
-        st.markdown('#### Home Conceded First and Won ####')
-        if not flt_home_CFW.empty:
-            st.dataframe(flt_home_CFW[columns_to_display], use_container_width=True, hide_index=True)
-        else:
-            st.warning("No games found with the specified criteria.")
+            st.markdown('#### Home Conceded First and Won ####')
+            if not flt_home_CFW.empty:
+                st.dataframe(flt_home_CFW[columns_to_display], use_container_width=True, hide_index=True)
+            else:
+                st.warning("No games found with the specified criteria.")
         
-        st.markdown('#### Home Conceded First and Draw ####')
-        if not flt_home_CFD.empty:
-            st.dataframe(flt_home_CFD[columns_to_display], use_container_width=True, hide_index=True)
-        else:
-            st.warning("No games found with the specified criteria.")
+            st.markdown('#### Home Conceded First and Draw ####')
+            if not flt_home_CFD.empty:
+                st.dataframe(flt_home_CFD[columns_to_display], use_container_width=True, hide_index=True)
+            else:
+                st.warning("No games found with the specified criteria.")
         
-        st.markdown('#### Home Conceded First and Lost ####')
-        if not flt_home_CFL.empty:
-            st.dataframe(flt_home_CFL[columns_to_display], use_container_width=True, hide_index=True)
-        else:
-            st.warning("No games found with the specified criteria.")
+            st.markdown('#### Home Conceded First and Lost ####')
+            if not flt_home_CFL.empty:
+                st.dataframe(flt_home_CFL[columns_to_display], use_container_width=True, hide_index=True)
+            else:
+                st.warning("No games found with the specified criteria.")
         
-        st.markdown('#### Home After winning by one scored the second ####')
-        if not flt_home_DilV.empty:
-            st.dataframe(flt_home_DilV[columns_to_display], use_container_width=True, hide_index=True)
-        else:
-            st.warning("No games found with the specified criteria.")
+            st.markdown('#### Home After winning by one scored the second ####')
+            if not flt_home_DilV.empty:
+                st.dataframe(flt_home_DilV[columns_to_display], use_container_width=True, hide_index=True)
+            else:
+                st.warning("No games found with the specified criteria.")
         
-        st.markdown('#### Away Scored First and Won ####')
-        if not flt_away_SFW.empty:
-            st.dataframe(flt_away_SFW[columns_to_display], use_container_width=True, hide_index=True)
-        else:
-            st.warning("No games found with the specified criteria.")
+            st.markdown('#### Away Scored First and Won ####')
+            if not flt_away_SFW.empty:
+                st.dataframe(flt_away_SFW[columns_to_display], use_container_width=True, hide_index=True)
+            else:
+                st.warning("No games found with the specified criteria.")
         
-        st.markdown('#### Away Scored First and Draw ####')
-        if not flt_away_SFD.empty:
-            st.dataframe(flt_away_SFD[columns_to_display], use_container_width=True, hide_index=True)
-        else:
-            st.warning("No games found with the specified criteria.")
+            st.markdown('#### Away Scored First and Draw ####')
+            if not flt_away_SFD.empty:
+                st.dataframe(flt_away_SFD[columns_to_display], use_container_width=True, hide_index=True)
+            else:
+                st.warning("No games found with the specified criteria.")
         
-        st.markdown('#### Away Scored First and Lost ####')
-        if not flt_away_SFL.empty:
-            st.dataframe(flt_away_SFL[columns_to_display], use_container_width=True, hide_index=True)
-        else:
-            st.warning("No games found with the specified criteria.")
+            st.markdown('#### Away Scored First and Lost ####')
+            if not flt_away_SFL.empty:
+                st.dataframe(flt_away_SFL[columns_to_display], use_container_width=True, hide_index=True)
+            else:
+                st.warning("No games found with the specified criteria.")
         
-        st.markdown('#### Away Conceded First and Won ####')
-        if not flt_away_CFW.empty:
-            st.dataframe(flt_away_CFW[columns_to_display], use_container_width=True, hide_index=True)
-        else:
-            st.warning("No games found with the specified criteria.")
+            st.markdown('#### Away Conceded First and Won ####')
+            if not flt_away_CFW.empty:
+                st.dataframe(flt_away_CFW[columns_to_display], use_container_width=True, hide_index=True)
+            else:
+                st.warning("No games found with the specified criteria.")
         
-        st.markdown('#### Away Conceded First and Draw ####')
-        if not flt_away_CFD.empty:
-            st.dataframe(flt_away_CFD[columns_to_display], use_container_width=True, hide_index=True)
-        else:
-            st.warning("No games found with the specified criteria.")
+            st.markdown('#### Away Conceded First and Draw ####')
+            if not flt_away_CFD.empty:
+                st.dataframe(flt_away_CFD[columns_to_display], use_container_width=True, hide_index=True)
+            else:
+                st.warning("No games found with the specified criteria.")
         
-        st.markdown('#### Away Conceded First and Lost ####')
-        if not flt_away_CFL.empty:
-            st.dataframe(flt_away_CFL[columns_to_display], use_container_width=True, hide_index=True)
-        else:
-            st.warning("No games found with the specified criteria.")
+            st.markdown('#### Away Conceded First and Lost ####')
+            if not flt_away_CFL.empty:
+                st.dataframe(flt_away_CFL[columns_to_display], use_container_width=True, hide_index=True)
+            else:
+                st.warning("No games found with the specified criteria.")
         
-        st.markdown('#### Away After winning by one scored the second ####')
-        if not flt_away_DilV.empty:
-            st.dataframe(flt_away_DilV[columns_to_display], use_container_width=True, hide_index=True)
+            st.markdown('#### Away After winning by one scored the second ####')
+            if not flt_away_DilV.empty:
+                st.dataframe(flt_away_DilV[columns_to_display], use_container_width=True, hide_index=True)
+            else:
+                st.warning("No games found with the specified criteria.")
         else:
-            st.warning("No games found with the specified criteria.")
-    else:
-        st.error("Data is empty.")
+            st.error("Data is empty.")
         
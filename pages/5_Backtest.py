@@ -1,13 +1,14 @@
-import pandas as pd
 import numpy as np
 import streamlit as st
-from PIL import Image
-import os
-import requests
 from datetime import datetime
 from auth import logout
 from sidebar_menu import show_role_features
-import matplotlib.pyplot as plt
+from static_assets import show_static_image
+from data_store import historical_store_version, load_historical_data
+from backtest_engine import MARKETS, RESULT_COLUMNS, STAKE_RULES, compile_strategies, profit_curve, required_columns, run_backtest
+from strategy_sweep import build_grid, sweep_strategy
+from elo_tilt import RATING_COLUMNS, with_point_in_time_ratings
+from enrichment import GEOMETRY_COLUMNS, ODDS_COLUMNS, odds_geometry
 
 # Streamlit App Title and Headers
 st.set_page_config(page_title="BackTest - Fluffy Chips Web Analyser", page_icon="📈", layout="wide")
@@ -20,81 +21,171 @@ st.subheader('The place where you can do Backtest of your Strategies!!!')
 st.write(f"Welcome, **{st.session_state['username']}**!")
 st.write(f"Your role: **{st.session_state['role']}**")
 st.divider()
-st.subheader('_Sector Under Contrution_')
 
 # Display Image
-image_path = os.path.join(os.getcwd(), 'static', 'backtest.png')
-if os.path.exists(image_path):
-    st.image(image_path, use_container_width=True)
-else:
-    st.warning("Image not found. Please check the file path.")
+show_static_image('backtest.png')
 
 st.divider()
 
-def drop_reset_index(df):
-    df = df.dropna()
-    df = df.reset_index(drop=True)
-    df.index += 1
-    return df
-
-def plot_profit_acu(dataframe, title_text):
-    dataframe['Profit_acu'] = dataframe.Profit.cumsum()
-    n_apostas = dataframe.shape[0]
-    profit = round(dataframe.Profit_acu.tail(1).item(), 2)
-    ROI = round((dataframe.Profit_acu.tail(1) / n_apostas * 100).item(), 2)
-    drawdown = dataframe['Profit_acu'] - dataframe['Profit_acu'].cummax()
-    drawdown_maximo = round(drawdown.min(), 2)
-    winrate_medio = round((dataframe['Profit'] > 0).mean() * 100, 2)
-    desvio_padrao = round(dataframe['Profit'].std(), 2)
-    dataframe.Profit_acu.plot(title=title_text, xlabel='Entradas', ylabel='Stakes')
-    print("Metodo:",title_text)
-    print("Profit:", profit, "stakes em", n_apostas, "jogos")
-    print("ROI:", ROI, "%")
-    print("Drawdown Maximo Acumulado:", drawdown_maximo)
-    print("Winrate Medio:", winrate_medio, "%")
-    print("Desvio Padrao:", desvio_padrao)
-    print("")
-
-# URLs for CSV Files
-historical_data_url = "https://raw.githubusercontent.com/RedLegacy227/main_data_base/main/df_base_original.csv"
-    
+# Strategies evaluated by the backtest engine (rules over columns of the historical base).
+# Correct score, Over/Under 1.5 and "any other win" markets have no price in the base, so they are
+# settled at a reference odd that can be changed below.
+# "source" says where the rules come from:
+#   METHODS  - the same filter as the Methods page (Lay Home / Lay Away: VAR1/2/3 from the 1X2 odds)
+#   ODDS     - only the odds part of the Methods page filter; its H2H / percentage / ranking checks
+#              use columns of the daily file that the base does not have
+#   ILLUSTRATIVE - example rules, not taken from any Methods page filter
+METHODS, ODDS, ILLUSTRATIVE = "Methods page", "Methods page (odds filters only)", "Illustrative"
+STRATEGIES = {
+    'Lay 0 x 1': {
+        "market": "Lay 0x1", "odds": 12.0, "stake": "liability", "source": ILLUSTRATIVE,
+        "rules": [{"ranges": [("FT_Odd_H", 1.30, 1.80, "both")]}],
+    },
+    'Goleada Home': {
+        "market": "Lay Any Other Home Win", "odds": 25.0, "stake": "liability", "source": ODDS,
+        "rules": [{"ranges": [("FT_Odd_H", 2.00, None, "both"), ("FT_Odd_Over25", 1.60, None, "both"),
+                              ("Odd_BTTS_Yes", None, 2.50, "both")]}],
+    },
+    'Over 1,5 FT': {
+        "market": "Over 1.5 FT", "odds": 1.30, "source": ILLUSTRATIVE,
+        "rules": [{"ranges": [("FT_Odd_Over25", None, 1.70, "both")]}],
+    },
+    'Lay Home': {
+        "market": "Lay Home", "source": METHODS,
+        "rules": [{"ranges": [("VAR1", 3, None, "both"), ("VAR2", None, -30, "both"), ("VAR3", 30, None, "both"),
+                              ("FT_Odd_H", 2, None, "neither")]}],
+    },
+    'Lay Away': {
+        "market": "Lay Away", "source": METHODS,
+        "rules": [{"ranges": [("VAR1", 4, None, "both"), ("VAR2", 60, None, "both"), ("VAR3", None, -60, "both"),
+                              ("FT_Odd_A", 2, None, "neither")]}],
+    },
+    'Under 1,5 FT': {
+        "market": "Under 1.5 FT", "odds": 3.50, "source": ILLUSTRATIVE,
+        "rules": [{"ranges": [("FT_Odd_Over25", 2.20, None, "both")]}],
+    },
+    'Back Home': {
+        "market": "Back Home", "source": ILLUSTRATIVE,
+        "rules": [{"ranges": [("FT_Odd_H", 1.50, 2.00, "both"), ("FT_Odd_A", 4.00, None, "both")]}],
+    },
+    'Lay 1x1': {
+        "market": "Lay 1x1", "odds": 7.0, "stake": "liability", "source": ODDS,
+        "rules": [{"ranges": [("FT_Odd_H", None, 1.80, "left"), ("FT_Odd_Over25", None, 1.70, "left")]}],
+    },
+    'Lay any Other Win Home': {
+        "market": "Lay Any Other Home Win", "odds": 25.0, "stake": "liability", "source": ODDS,
+        "rules": [{"ranges": [("FT_Odd_H", 1.80, None, "neither")]}],
+    },
+    'Lay any Other Win Away': {
+        "market": "Lay Any Other Away Win", "odds": 25.0, "stake": "liability", "source": ODDS,
+        "rules": [{"ranges": [("FT_Odd_A", 1.80, None, "neither")]}],
+    },
+}
+
 # Select Date
 selected_date = st.date_input("Select a date:", value=datetime.today())
 formatted_date = selected_date.strftime("%Y-%m-%d")
 
-@st.cache_data(ttl=0)
-def load_data(url):
-    try:
-        response = requests.get(url)
-        if response.status_code == 200:
-            return pd.read_csv(url)
-        else:
-            st.error(f"File not found: {url}")
-            return None
-    except Exception as e:
-        st.error(f"Error loading data: {e}")
+# Reference odds for the markets without a price in the historical base
+with st.expander("Reference odds"):
+    reference_odds = {
+        name: st.number_input(f"{name} ({strategy['market']})", min_value=1.01, value=strategy["odds"], step=0.05)
+        for name, strategy in STRATEGIES.items() if "odds" in strategy
+    }
+strategies = {
+    name: {**strategy, "odds": reference_odds.get(name, strategy.get("odds"))} if "odds" in strategy else strategy
+    for name, strategy in STRATEGIES.items()
+}
+
+@st.cache_data(show_spinner=False, max_entries=16)
+def backtest(version, date, strategies):
+    """Runs every strategy over the games before `date`, once per data version and set of strategies."""
+    columns = required_columns(compile_strategies(strategies))
+    # VAR1/2/3 are not in the base, they are computed from the 1X2 odds like on the Methods page
+    geometry_columns = [col for col in columns if col in GEOMETRY_COLUMNS]
+    # Elo / Tilt columns are not in the base, they come from the in-house engine as of each game's date
+    rating_columns = [col for col in columns if col in RATING_COLUMNS]
+    base_columns = ([col for col in columns if col not in GEOMETRY_COLUMNS + RATING_COLUMNS]
+                    + (ODDS_COLUMNS if geometry_columns else []) + (['Home', 'Away'] if rating_columns else []))
+    # The games before `date` are a prefix of the date-sorted base, cut without a full-column mask
+    df_base0 = load_historical_data(columns=list(dict.fromkeys(base_columns)), before=date)
+    if df_base0 is None:
         return None
+    df_base = df_base0.reset_index(drop=True)
+    if geometry_columns:
+        df_base = df_base.join(odds_geometry(df_base)[geometry_columns])
+    if rating_columns:
+        df_base = with_point_in_time_ratings(df_base, rating_columns)
+        if df_base is None:
+            return None
+    summary, bets, profits = run_backtest(df_base, strategies)
+    return df_base, summary, bets, profits
 
-df_base0 = load_data(historical_data_url)
+# Odds columns of the historical base that can be swept
+SWEEP_COLUMNS = ['FT_Odd_H', 'FT_Odd_D', 'FT_Odd_A', 'FT_Odd_Over25', 'Odd_BTTS_Yes']
 
-df_base = df_base0[df_base0['Date'] < str(selected_date)]
+@st.cache_data(show_spinner=False, max_entries=8)
+def sweep(version, date, market, grid, leagues, odds, stake, min_bets):
+    """Parameter sweep over the games before `date`, across all CPU cores."""
+    odds_column = [MARKETS[market]["odds"]] if odds is None else []
+    df_base = load_historical_data(columns=list(dict.fromkeys(RESULT_COLUMNS + odds_column + list(grid))), before=date)
+    if df_base is None:
+        return None
+    return sweep_strategy(df_base, market, grid, leagues=leagues, odds=odds, stake=stake, min_bets=min_bets)
 
-if df_base is not None:
+result = backtest(historical_store_version(), formatted_date, strategies)
+
+if result is not None:
+    df_base, summary, bets, profits = result
     st.success("Historical Data loaded successfully!")
 
-st.write(df_base.tail(20))
-    
-# List of strategies
-strategies = [
-    'Lay 0 x 1', 'Goleada Home', 'Over 1,5 FT', 'Lay Home', 'Lay Away', 'Under 1,5 FT', 'Back Home', 'Lay 1x1', 'Lay any Other Win Home', 'Lay any Other Win Home','Louro José'
-]
+    st.subheader('Results of all Strategies')
+    summary = summary.assign(Rules=[strategies[name]["source"] for name in strategies])
+    st.dataframe(summary, use_container_width=True, hide_index=True)
+    st.caption(f"Rules: **{METHODS}** = same filter as the Methods page; **{ODDS}** = the Methods page odds filters, "
+               f"without the checks that need the daily file; **{ILLUSTRATIVE}** = example rules, not a Methods page strategy.")
+
+    # Select strategy
+    selected_strategy = st.selectbox("Choose a strategy:", list(strategies))
+    position = list(strategies).index(selected_strategy)
+    curve = profit_curve(df_base, bets, profits, position)
+
+    if curve.empty:
+        st.warning("No games found with the specified criteria.")
+    else:
+        st.write(f"#### {selected_strategy} ####")
+        st.line_chart(curve['Profit_acu'], x_label='Entradas', y_label='Stakes')
+        st.dataframe(curve.tail(20), use_container_width=True)
 
-# Select strategy
-selected_strategy = st.selectbox("Choose a strategy:", strategies)
+    # Parameter sweep: every threshold combination of the chosen odds columns, per league
+    st.divider()
+    st.subheader('Parameter Sweep')
+    sweep_market = st.selectbox("Market:", list(MARKETS))
+    sweep_leagues = st.multiselect("Leagues (empty for all):", sorted(df_base['League'].unique()))
+    sweep_columns = st.multiselect("Columns to sweep:", SWEEP_COLUMNS, default=['FT_Odd_H'])
 
-if selected_strategy == 'Lay 0 x 1':
-    st.write("You have selected the 'Lay 0 x 1' strategy.")
-    backtest_lay_0x1 = df_base.copy()
+    grid = {}
+    for col in sweep_columns:
+        col1, col2 = st.columns([3, 1])
+        low, high = col1.slider(f"{col} range", 1.01, 15.0, (1.30, 3.00), step=0.01)
+        step = col2.number_input(f"{col} step", min_value=0.01, value=0.10, step=0.01)
+        values = np.round(np.arange(low, high + step / 2, step), 2).tolist()
+        grid[col] = {"low": [None] + values, "high": values + [None]}
 
-    backtest_lay_0x1['Lay_0x1'] = np.where((backtest_lay_0x1['FT_Goals_H'] == 0) & (backtest_lay_0x1['FT_Goals_A'] == 1), 0, 1)
-    
\ No newline at end of file
+    sweep_odds = None
+    if MARKETS[sweep_market]["odds"] is None:
+        sweep_odds = st.number_input("Reference odd:", min_value=1.01, value=2.00, step=0.05)
+    sweep_stake = st.selectbox("Stake:", STAKE_RULES)
+    min_bets = st.number_input("Minimum number of bets:", min_value=1, value=30, step=1)
+    st.write(f"{len(build_grid(grid)[1])} threshold combinations per league")
+
+    if grid and st.button("Run sweep"):
+        with st.spinner("Running sweep..."):
+            ranking = sweep(
+                historical_store_version(), formatted_date, sweep_market, grid,
+                tuple(sweep_leagues) or None, sweep_odds, sweep_stake, min_bets
+            )
+        if ranking is None or ranking.empty:
+            st.warning("No games found with the specified criteria.")
+        else:
+            st.dataframe(ranking.head(100), use_container_width=True, hide_index=True)
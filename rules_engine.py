@@ -0,0 +1,112 @@
+import numpy as np
+import pandas as pd
+
+# Each rule is a dict like:
+#     "back_home_Port_01_01_ft": {
+#         "league": 'PORTUGAL - LIGA PORTUGAL',
+#         "equals": [("Home_Score_Take", "No")],
+#         "ranges": [("Avg_G_Diff_A_FT_Value", -0.0900, 0.0250, "neither")],
+#     }
+# A game matches a rule when it is from the rule's league and passes every condition.
+# A rule without "league" (or with league None) applies to games of every league.
+# `ranges` are (column, low, high, inclusive) with `inclusive` as in pandas' Series.between.
+
+
+def _effective_bounds(low, high, inclusive, dtype=np.float64):
+    """
+    Turns strict bounds into inclusive ones so every range is tested as low <= x <= high.
+    Bounds are rounded to `dtype` first, so float32 columns are compared as pandas would compare them.
+    """
+    low = dtype(low) if low is not None else dtype(-np.inf)
+    high = dtype(high) if high is not None else dtype(np.inf)
+    if inclusive in ("neither", "right"):
+        low = np.nextafter(low, dtype(np.inf))
+    if inclusive in ("neither", "left"):
+        high = np.nextafter(high, dtype(-np.inf))
+    return float(low), float(high)
+
+
+def compile_rules(rules):
+    """
+    Groups the rules by league and flattens their conditions into NumPy arrays,
+    so each league is evaluated with a single broadcast comparison.
+    """
+    compiled = {}
+    for name, rule in rules.items():
+        league = compiled.setdefault(rule.get("league"), {
+            "rules": [], "starts": [], "range_cols": [], "lows": [], "highs": [], "lows32": [], "highs32": [],
+            "equals": [], "order": []
+        })
+        league["rules"].append(name)
+        league["starts"].append(len(league["order"]))
+
+        for col, low, high, inclusive in rule.get("ranges", []):
+            low64, high64 = _effective_bounds(low, high, inclusive)
+            low32, high32 = _effective_bounds(low, high, inclusive, np.float32)
+            league["order"].append(("range", len(league["range_cols"])))
+            league["range_cols"].append(col)
+            league["lows"].append(low64)
+            league["highs"].append(high64)
+            league["lows32"].append(low32)
+            league["highs32"].append(high32)
+
+        for col, value in rule.get("equals", []):
+            league["order"].append(("equals", len(league["equals"])))
+            league["equals"].append((col, value))
+
+        if len(league["order"]) == league["starts"][-1]:
+            raise ValueError(f"Rule {name} has no conditions")
+
+    for league in compiled.values():
+        n_ranges = len(league["range_cols"])
+        # Each column is read once per league even if several rules test it
+        league["columns"] = list(dict.fromkeys(league["range_cols"]))
+        league["column_index"] = np.array([league["columns"].index(col) for col in league["range_cols"]], dtype=np.intp)
+        for key in ("lows", "highs", "lows32", "highs32"):
+            league[key] = np.array(league[key], dtype=float)
+        league["starts"] = np.array(league["starts"], dtype=np.intp)
+        # Position of each condition in the [ranges | equals] matrix, in rule order
+        league["order"] = np.array(
+            [i if kind == "range" else n_ranges + i for kind, i in league["order"]], dtype=np.intp
+        )
+    return compiled
+
+
+def rule_matches(data, compiled):
+    """Returns a boolean DataFrame (one column per rule) telling which games match each rule."""
+    names = [name for league in compiled.values() for name in league["rules"]]
+    matches = np.zeros((len(data), len(names)), dtype=bool)
+    if data.empty:
+        return pd.DataFrame(matches, index=data.index, columns=names)
+
+    league_rows = {}
+    if any(league_name is not None for league_name in compiled):
+        league_rows = data.groupby("League", sort=False, observed=True).indices
+    offset = 0
+    for league_name, league in compiled.items():
+        n_rules = len(league["rules"])
+        rows = np.arange(len(data)) if league_name is None else league_rows.get(league_name)
+        if rows is not None:
+            parts = []
+            if league["range_cols"]:
+                values = np.column_stack([
+                    data[col].to_numpy(dtype=float)[rows] for col in league["columns"]
+                ])[:, league["column_index"]]
+                is_float32 = np.array([data[col].dtype == np.float32 for col in league["columns"]])[league["column_index"]]
+                lows = np.where(is_float32, league["lows32"], league["lows"])
+                highs = np.where(is_float32, league["highs32"], league["highs"])
+                parts.append((values >= lows) & (values <= highs))
+            if league["equals"]:
+                parts.append(np.column_stack([
+                    data[col].to_numpy()[rows] == value for col, value in league["equals"]
+                ]))
+            conditions = np.hstack(parts)[:, league["order"]]
+            matches[rows, offset:offset + n_rules] = np.logical_and.reduceat(conditions, league["starts"], axis=1)
+        offset += n_rules
+
+    return pd.DataFrame(matches, index=data.index, columns=names)
+
+
+def filter_by_rules(data, compiled):
+    """Returns the games that match at least one rule."""
+    return data[rule_matches(data, compiled).to_numpy().any(axis=1)]
@@ -0,0 +1,88 @@
+import re
+import numpy as np
+import pandas as pd
+
+# Bump when the dtypes below change, so stores written with the old types are rebuilt
+SCHEMA_VERSION = 1
+
+# Types of every source, matched by file name.
+#   categories: text columns with few distinct values (team / league names), stored once per value
+#   dates:      columns parsed as datetime64
+#   counts:     small integer columns (goals), int8 or float32 when they have missing values
+#   float32:    float columns downcast to float32 (regexes, ".*" for all of them)
+SCHEMAS = {
+    "historical": {
+        "match": "df_base_original",
+        "categories": ["League", "Season", "Home", "Away"],
+        "dates": ["Date"],
+        "counts": ["HT_Goals_H", "HT_Goals_A", "FT_Goals_H", "FT_Goals_A"],
+        "float32": [".*"],
+    },
+    "daily": {
+        "match": "df_jogos_do_dia",
+        "categories": ["League", "Home", "Away", "Round", "CV_Match_Type", "Favorite"],
+        "dates": [],
+        "counts": [],
+        "float32": [".*"],
+    },
+    "leagues": {
+        "match": "df_ligas",
+        "categories": ["League"],
+        "dates": [],
+        "counts": [],
+        "float32": [".*"],
+    },
+    "elo_tilt": {
+        "match": "df_elo_tilt",
+        "categories": ["Team", "League"],
+        "dates": [],
+        "counts": [],
+        "float32": [".*"],
+    },
+}
+
+
+def schema_for(name):
+    """Schema of the source whose file name appears in `name` (a URL or path), or None."""
+    for schema in SCHEMAS.values():
+        if schema["match"] in name:
+            return schema
+    return None
+
+
+def as_category(values):
+    """Categorical with lexically sorted categories, so sorting by it matches sorting the strings."""
+    if not isinstance(values.dtype, pd.CategoricalDtype):
+        values = values.astype(str).astype("category")
+    values = values.cat.remove_unused_categories()
+    return values.cat.reorder_categories(sorted(values.cat.categories))
+
+
+def apply_schema(df, schema):
+    """Casts `df` to the dtypes of `schema`; columns the schema doesn't mention are left as they are."""
+    if schema is None:
+        return df
+    df = df.drop(columns=[col for col in df.columns if col.startswith("Unnamed:")])
+    float32 = re.compile("|".join(f"(?:{pattern})" for pattern in schema["float32"])) if schema["float32"] else None
+
+    for col in df.columns:
+        if col in schema["dates"]:
+            df[col] = pd.to_datetime(df[col])
+        elif col in schema["categories"]:
+            df[col] = as_category(df[col])
+        elif col in schema["counts"]:
+            values = pd.to_numeric(df[col], errors="coerce")
+            df[col] = values.astype(np.float32) if values.isna().any() else values.astype(np.int8)
+        elif float32 is not None and df[col].dtype == np.float64 and float32.fullmatch(col):
+            df[col] = df[col].astype(np.float32)
+    return df
+
+
+def read_csv(path, schema=None, usecols=None):
+    """Reads a CSV with the dtypes of `schema`, parsing only `usecols` if given."""
+    if schema is None:
+        return pd.read_csv(path, usecols=usecols)
+    # Names are parsed straight into categoricals, the other columns are downcast after parsing
+    header = pd.read_csv(path, nrows=0).columns
+    dtype = {col: "category" for col in schema["categories"] if col in header}
+    return apply_schema(pd.read_csv(path, usecols=usecols, dtype=dtype), schema)
@@ -0,0 +1,153 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+from scipy.stats import poisson
+from data_store import historical_store_version, load_historical_data
+
+# Goals per team kept in the scoreline matrices (the rest of the mass is spread by renormalising)
+MAX_GOALS = 10
+# Expected goals are capped like the xG of Games-Analyse
+XG_CAP = 4
+# Correct scores priced one by one, the others fall in the "Any Other" markets (as on the exchanges)
+CS_GOALS = 3
+
+LEAGUE_AVERAGE_COLUMNS = [
+    "League", "Avg_G_Scored_Home_Teams", "Avg_G_Conceded_Home_Teams",
+    "Avg_G_Scored_Away_Teams", "Avg_G_Conceded_Away_Teams",
+]
+FIXTURE_COLUMNS = ["League", "Home", "Away"]
+HISTORICAL_COLUMNS = ["League", "Home", "Away", "FT_Goals_H", "FT_Goals_A"]
+
+
+def market_masks(max_goals=MAX_GOALS):
+    """
+    Every market as a boolean (home goals x away goals) mask of the scorelines where it wins,
+    so the probabilities of all markets of all games are a single matrix product.
+    """
+    home, away = np.meshgrid(np.arange(max_goals + 1), np.arange(max_goals + 1), indexing="ij")
+    total = home + away
+    masks = {"H": home > away, "D": home == away, "A": home < away}
+    for line in range(5):
+        masks[f"Over{line}5"] = total > line
+        masks[f"Under{line}5"] = total <= line
+    masks["BTTS_Yes"] = (home > 0) & (away > 0)
+    masks["BTTS_No"] = ~masks["BTTS_Yes"]
+    for h in range(CS_GOALS + 1):
+        for a in range(CS_GOALS + 1):
+            masks[f"CS_{h}x{a}"] = (home == h) & (away == a)
+    outside = (home > CS_GOALS) | (away > CS_GOALS)
+    masks["CS_Other_Home"] = outside & (home > away)
+    masks["CS_Other_Draw"] = outside & (home == away)
+    masks["CS_Other_Away"] = outside & (home < away)
+    return masks
+
+
+def score_matrices(xg_home, xg_away, max_goals=MAX_GOALS, rho=None):
+    """
+    Scoreline probability matrices of every game (games x home goals x away goals),
+    the outer product of the two Poisson PMFs, renormalised over 0..max_goals.
+    With `rho` (one per game) the 0x0, 0x1, 1x0 and 1x1 cells get the Dixon-Coles correction.
+    Games with a missing xG get a matrix of NaN.
+    """
+    xg_home = np.asarray(xg_home, dtype=float)
+    xg_away = np.asarray(xg_away, dtype=float)
+    goals = np.arange(max_goals + 1)
+    pmf_home = poisson.pmf(goals[None, :], xg_home[:, None])
+    pmf_away = poisson.pmf(goals[None, :], xg_away[:, None])
+    matrices = pmf_home[:, :, None] * pmf_away[:, None, :]
+    if rho is not None:
+        rho = np.nan_to_num(np.asarray(rho, dtype=float))
+        matrices[:, 0, 0] *= 1 - xg_home * xg_away * rho
+        matrices[:, 0, 1] *= 1 + xg_home * rho
+        matrices[:, 1, 0] *= 1 + xg_away * rho
+        matrices[:, 1, 1] *= 1 - rho
+    return matrices / matrices.sum(axis=(1, 2), keepdims=True)
+
+
+def market_probabilities(matrices):
+    """Probability of every market of market_masks() for each game, as a games x markets DataFrame."""
+    masks = market_masks(matrices.shape[1] - 1)
+    stacked = np.stack([mask.ravel() for mask in masks.values()], axis=1).astype(float)
+    return pd.DataFrame(matrices.reshape(len(matrices), -1) @ stacked, columns=list(masks))
+
+
+def fair_odds(probabilities):
+    """Fair (no margin) odds of each probability, inf for impossible outcomes."""
+    with np.errstate(divide="ignore"):
+        return (1 / probabilities).round(2)
+
+
+def _venue_averages(historical_data, venue, keys):
+    """Average FT goals (home side, away side) of each (league, team) of `keys` playing at `venue`."""
+    averages = historical_data.groupby(["League", venue], observed=True)[["FT_Goals_H", "FT_Goals_A"]].mean()
+    # Grouped on the categorical codes, the labels are turned into strings only once per distinct team
+    averages.index = pd.MultiIndex.from_arrays(
+        [averages.index.get_level_values(i).astype(str) for i in range(2)]
+    )
+    return averages.reindex(keys).to_numpy(dtype=float).T
+
+
+def expected_goals(fixtures, historical_data, leagues_data):
+    """
+    xG of every fixture, the same way as Games-Analyse: each team's average goals at its venue in the league
+    (whole historical base) against the league averages, capped at XG_CAP. Returns (xg_home, xg_away).
+    """
+    league = fixtures["League"].astype(str).to_numpy()
+    home_keys = pd.MultiIndex.from_arrays([league, fixtures["Home"].astype(str).to_numpy()])
+    away_keys = pd.MultiIndex.from_arrays([league, fixtures["Away"].astype(str).to_numpy()])
+
+    home_scored, home_conceded = _venue_averages(historical_data, "Home", home_keys)
+    away_conceded, away_scored = _venue_averages(historical_data, "Away", away_keys)
+
+    averages = leagues_data[LEAGUE_AVERAGE_COLUMNS].assign(League=leagues_data["League"].astype(str))
+    averages = averages.drop_duplicates("League").set_index("League").reindex(league).to_numpy(dtype=float).T
+    league_gm_home, league_gs_away, league_gm_away, league_gs_home = averages
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        attack_home = home_scored / league_gm_home
+        defense_home = home_conceded / league_gs_home
+        attack_away = away_scored / league_gm_away
+        defense_away = away_conceded / league_gs_away
+        xg_home = home_scored * attack_home / defense_away
+        xg_away = away_scored * attack_away / defense_home
+
+    xg_home = np.minimum(np.where(np.isinf(xg_home), 0, xg_home), XG_CAP)
+    xg_away = np.minimum(np.where(np.isinf(xg_away), 0, xg_away), XG_CAP)
+    return xg_home, xg_away
+
+
+def fixture_fair_odds(fixtures, historical_data, leagues_data, max_goals=MAX_GOALS):
+    """
+    Poisson fair odds of every market (1X2, O/U 0.5-4.5, BTTS, correct scores) for all `fixtures` at once.
+    Returns a DataFrame aligned with `fixtures` with XG_Home, XG_Away and one Poisson_Odd_<market> column per market.
+    """
+    xg_home, xg_away = expected_goals(fixtures, historical_data, leagues_data)
+    return fair_odds_table(xg_home, xg_away, index=fixtures.index, max_goals=max_goals)
+
+
+def fair_odds_table(xg_home, xg_away, rho=None, prefix="Poisson_Odd_", index=None, max_goals=MAX_GOALS):
+    """XG_Home, XG_Away and the fair odds of every market (one <prefix><market> column each) of the given games."""
+    xg_home = np.asarray(xg_home, dtype=float)
+    xg_away = np.asarray(xg_away, dtype=float)
+    odds = fair_odds(market_probabilities(score_matrices(xg_home, xg_away, max_goals, rho)))
+    odds.columns = [f"{prefix}{market}" for market in odds.columns]
+    odds.insert(0, "XG_Home", xg_home.round(2))
+    odds.insert(1, "XG_Away", xg_away.round(2))
+    if index is not None:
+        odds.index = index
+    return odds
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _cached_fair_odds(fixtures, leagues_data, version):
+    historical_data = load_historical_data(columns=HISTORICAL_COLUMNS)
+    if historical_data is None:
+        return None
+    return fixture_fair_odds(fixtures, historical_data, leagues_data)
+
+
+def day_fair_odds(fixtures, leagues_data):
+    """Poisson fair odds of the day's fixtures, computed once per (fixtures, league averages, data version)."""
+    return _cached_fair_odds(
+        fixtures[FIXTURE_COLUMNS], leagues_data[LEAGUE_AVERAGE_COLUMNS], historical_store_version()
+    )
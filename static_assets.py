@@ -0,0 +1,103 @@
+import hashlib
+import os
+from html import escape
+
+import streamlit as st
+from PIL import Image, features
+
+# Images of static/ are converted once into smaller variants, served by Streamlit's static file serving
+# (enableStaticServing in .streamlit/config.toml) from /app/static/, which answers with ETag / Last-Modified
+STATIC_DIR = os.path.join(os.getcwd(), "static")
+VARIANTS_DIR = os.path.join(STATIC_DIR, "variants")
+STATIC_URL = "app/static"
+
+# Widths generated for every image (never larger than the original) and encoder settings of each format
+WIDTHS = (480, 960, 1600)
+# Width the images are shown at when they go through st.image (static serving off)
+FALLBACK_WIDTH = 960
+FORMATS = {
+    "avif": {"quality": 50},
+    "webp": {"quality": 80, "method": 6},
+}
+
+
+def _formats():
+    """Formats the installed Pillow can encode, best compression first."""
+    return [fmt for fmt in FORMATS if features.check(fmt)]
+
+
+def build_variants(name):
+    """
+    Writes the resized / recompressed variants of static/`name` (skipping the ones already on disk)
+    and returns {format: [(width, file name), ...]} with the widths in increasing order.
+    File names carry a hash of the original, so an updated image gets new URLs.
+    """
+    path = os.path.join(STATIC_DIR, name)
+    with open(path, "rb") as file:
+        digest = hashlib.sha1(file.read()).hexdigest()[:10]
+    stem = os.path.splitext(name)[0]
+    os.makedirs(VARIANTS_DIR, exist_ok=True)
+
+    variants = {}
+    with Image.open(path) as original:
+        image = original if original.mode in ("RGB", "RGBA") else original.convert("RGBA")
+        widths = sorted({min(width, image.width) for width in WIDTHS})
+        for fmt in _formats():
+            variants[fmt] = []
+            for width in widths:
+                file_name = f"{stem}-{width}-{digest}.{fmt}"
+                target = os.path.join(VARIANTS_DIR, file_name)
+                if not os.path.exists(target):
+                    height = round(image.height * width / image.width)
+                    resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+                    # Written under a temporary name, so another session never serves a half-written file
+                    temp = f"{target}.{os.getpid()}.tmp"
+                    resized.save(temp, format=fmt.upper(), **FORMATS[fmt])
+                    os.replace(temp, target)
+                variants[fmt].append((width, file_name))
+    return variants
+
+
+@st.cache_resource(show_spinner=False)
+def asset_variants(name):
+    """Variants of static/`name`, built once per server process."""
+    return build_variants(name)
+
+
+def _fitting_variant(files, width):
+    """File name of the smallest variant at least `width` wide (the largest one if none is)."""
+    return next((file_name for variant_width, file_name in files if variant_width >= width), files[-1][1])
+
+
+def show_static_image(name, alt="", width=FALLBACK_WIDTH):
+    """
+    Shows static/`name` at the container width with a <picture> element: the browser picks the
+    smallest AVIF / WebP variant that fits, and downloads it from the static server, not the websocket.
+    Without static serving, the smallest variant at least `width` wide is sent through st.image.
+    """
+    try:
+        variants = asset_variants(name)
+    except OSError:
+        st.warning("Image not found. Please check the file path.")
+        return
+
+    if not st.get_option("server.enableStaticServing") or not variants:
+        # Without static serving the smallest fitting variant still goes through st.image, never the original
+        fmt = next(iter(variants), None)
+        path = os.path.join(VARIANTS_DIR, _fitting_variant(variants[fmt], width)) if fmt else os.path.join(STATIC_DIR, name)
+        st.image(path, width="stretch")
+        return
+
+    sources = "".join(
+        f'<source type="image/{fmt}" sizes="100vw" srcset="'
+        + ", ".join(f"{STATIC_URL}/variants/{file_name} {width}w" for width, file_name in files)
+        + '">'
+        for fmt, files in variants.items()
+    )
+    fallback = f"{STATIC_URL}/{name}"
+    st.markdown(
+        f'<div style="text-align: center;"><picture>{sources}'
+        f'<img src="{fallback}" alt="{escape(alt)}" loading="lazy" style="width: 100%; height: auto;">'
+        f'</picture></div>',
+        unsafe_allow_html=True,
+    )
@@ -0,0 +1,129 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+from backtest_engine import GOAL_COLUMNS, MARKETS, compile_strategies, run_backtest
+
+# Threshold combinations evaluated by each task
+SWEEP_CHUNK = 256
+
+# Historical arrays of the sweep, attached once per worker process
+_shared = {}
+
+
+def threshold_pairs(lows=None, highs=None):
+    """Every (low, high) pair of the candidate thresholds with low < high (None leaves a side open)."""
+    lows = [None] if lows is None else [None if low is None else float(low) for low in lows]
+    highs = [None] if highs is None else [None if high is None else float(high) for high in highs]
+    return [(low, high) for low in lows for high in highs if low is None or high is None or low < high]
+
+
+def build_grid(grid):
+    """
+    Expands a grid like {"FT_Odd_H": {"low": [1.3, 1.4], "high": [1.8, 2.0]}, ...}
+    into (columns, combinations), each combination holding one (low, high) pair per column.
+    """
+    columns = list(grid)
+    pairs = [threshold_pairs(spec.get("low"), spec.get("high")) for spec in grid.values()]
+    return columns, list(product(*pairs))
+
+
+def _column_layout(data, columns):
+    """
+    (column, dtype, offset) of every column in the shared block. float32 columns stay float32,
+    so rules_engine compares them with float32 bounds exactly as it does on the original frame.
+    """
+    layout = []
+    offset = 0
+    for col in columns:
+        dtype = np.dtype(np.float32 if data[col].dtype == np.float32 else np.float64)
+        layout.append((col, dtype.str, offset))
+        # Every column starts on an 8-byte boundary, so float64 columns stay aligned
+        offset += -(-dtype.itemsize * len(data) // 8) * 8
+    return layout, offset
+
+
+def _column_arrays(buffer, layout, n_rows):
+    return {col: np.ndarray((n_rows,), dtype=dtype, buffer=buffer, offset=offset) for col, dtype, offset in layout}
+
+
+def _attach(name, layout, n_rows):
+    """Worker initializer: maps the shared historical arrays without copying them."""
+    shm = shared_memory.SharedMemory(name=name)
+    _shared.update(shm=shm, arrays=_column_arrays(shm.buf, layout, n_rows))
+
+
+def _run_chunk(start, stop, template, columns, combos):
+    """Backtests one chunk of threshold combinations over the rows start:stop (one league)."""
+    data = pd.DataFrame({col: array[start:stop] for col, array in _shared["arrays"].items()}, copy=False)
+    strategies = {}
+    for i, combo in enumerate(combos):
+        ranges = [(col, low, high, "both") for col, (low, high) in zip(columns, combo) if (low, high) != (None, None)]
+        strategies[str(i)] = {**template, "rules": [{"ranges": ranges}] if ranges else []}
+    summary, _, _ = run_backtest(data, strategies)
+    return summary.drop(columns=["Strategy", "Market"])
+
+
+def sweep_strategy(data, market, grid, leagues=None, odds=None, stake="fixed", stake_size=1.0, commission=0.0,
+                   min_bets=30, max_workers=None, chunk_size=SWEEP_CHUNK):
+    """
+    Backtests every threshold combination of `grid` for `market` in each league, across a process pool.
+    The historical arrays are shared with the workers through shared memory, only thresholds are pickled.
+    Returns the combinations with at least `min_bets` bets, ranked by ROI and then by max drawdown.
+    """
+    template = {"market": market, "stake": stake, "stake_size": stake_size, "commission": commission}
+    if odds is not None:
+        template["odds"] = odds
+    compile_strategies({"sweep": template})  # Fails early on an invalid market / stake / odds
+
+    columns, combos = build_grid(grid)
+    odds_column = template.get("odds", MARKETS[market]["odds"])
+    used = list(dict.fromkeys(GOAL_COLUMNS + ([odds_column] if isinstance(odds_column, str) else []) + columns))
+
+    if leagues is not None:
+        data = data[data["League"].isin(leagues)]
+    # Each league becomes a contiguous, date-sorted slice of the shared arrays
+    data = data.sort_values(["League", "Date"], kind="stable")
+    names, starts = np.unique(data["League"].to_numpy(dtype=str), return_index=True)
+    bounds = dict(zip(names, zip(starts, list(starts[1:]) + [len(data)])))
+
+    layout, size = _column_layout(data, used)
+    shm = shared_memory.SharedMemory(create=True, size=max(1, size))
+    try:
+        arrays = _column_arrays(shm.buf, layout, len(data))
+        for col, array in arrays.items():
+            array[:] = data[col].to_numpy(dtype=array.dtype)
+
+        results = []
+        with ProcessPoolExecutor(
+            max_workers=max_workers or os.cpu_count(),
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_attach,
+            initargs=(shm.name, layout, len(data)),
+        ) as pool:
+            tasks = [
+                (league, chunk, pool.submit(_run_chunk, start, stop, template, columns, chunk))
+                for league, (start, stop) in bounds.items()
+                for chunk in (combos[i:i + chunk_size] for i in range(0, len(combos), chunk_size))
+            ]
+            for league, chunk, future in tasks:
+                summary = future.result()
+                thresholds = pd.DataFrame(
+                    [[value for pair in combo for value in pair] for combo in chunk],
+                    columns=[f"{col} {side}" for col in columns for side in ("min", "max")],
+                )
+                results.append(pd.concat([pd.Series(league, index=thresholds.index, name="League"), thresholds, summary], axis=1))
+    finally:
+        array = arrays = None  # Release the views before closing the segment
+        shm.close()
+        shm.unlink()
+
+    if not results:
+        return pd.DataFrame()
+    ranking = pd.concat(results, ignore_index=True)
+    ranking = ranking[ranking["Bets"] >= min_bets]
+    return ranking.sort_values(["ROI (%)", "Max Drawdown"], ascending=False).reset_index(drop=True)
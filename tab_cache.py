@@ -0,0 +1,27 @@
+import streamlit as st
+from data_store import historical_store_version
+from fetch_cache import source_version
+
+# Results of the tabs of the Methods pages, one per (page, tab, date, data versions), shared by every session
+MAX_TAB_RESULTS = 256
+
+
+@st.cache_data(max_entries=MAX_TAB_RESULTS, show_spinner=False)
+def _cached_result(page, tab, key, _build):
+    return _build()
+
+
+def data_key(date, urls):
+    """
+    Key of the tab results of `date`: the date plus the version of every source the tabs read,
+    (url, ttl) pairs of `urls` and the historical store, so a result is recomputed only when one of them changes.
+    """
+    return (date, tuple(source_version(url, ttl) for url, ttl in urls), historical_store_version())
+
+
+def tab_result(page, tab, key, build):
+    """
+    Result of `build()` for one tab, computed the first time the tab is opened for `key` (see data_key())
+    and then served from the cache. `build` must only compute (no st.* calls), the tab displays the result.
+    """
+    return _cached_result(page, tab, key, build)
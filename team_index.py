@@ -0,0 +1,198 @@
+import numpy as np
+import pandas as pd
+import streamlit as st
+from data_store import historical_store_version, load_historical_data
+from goal_minutes import GOAL_MINUTES_COLUMNS, GoalMinutes
+
+# Columns kept by the index so "last N games" can be shown without going back to the full base
+TEAM_INDEX_COLUMNS = [
+    'Date', 'League', 'Season', 'Home', 'Away', 'HT_Goals_H', 'HT_Goals_A', 'FT_Goals_H', 'FT_Goals_A',
+    'FT_Odd_H', 'FT_Odd_D', 'FT_Odd_A', 'FT_Odd_Over25', 'Odd_BTTS_Yes', 'Goals_Minutes_Home', 'Goals_Minutes_Away'
+]
+
+# Windows (number of games) with precomputed rolling aggregates
+WINDOWS = (7, 15, 21, 38)
+METRICS = ["Goals_For", "Goals_Against", "Over25", "BTTS", "Win_Margin"]
+VENUES = ("All", "Home", "Away")
+
+_DAY_OFFSET = 1 << 31
+
+
+class TeamIndex:
+    """
+    League-partitioned, per-team, per-venue, date-sorted index over the historical base.
+    Each league's games sit in a contiguous slice of `data`, and each team's games in a contiguous
+    slice of row positions, so "games of league L" or "last N games of team X before date D"
+    are a binary search plus a slice, and rolling aggregates are read at that position.
+    """
+
+    def __init__(self, historical_data, by_league=False, windows=WINDOWS):
+        # Rows grouped by league and date-sorted inside each league, so every league is a contiguous slice
+        self.data = historical_data.sort_values(["League", "Date"], kind="stable").reset_index(drop=True)
+        self.by_league = by_league
+        self.windows = tuple(windows)
+        self.days = self.data["Date"].to_numpy().astype("datetime64[D]").astype(np.int64)
+        names, starts = np.unique(self.data["League"].to_numpy(dtype=str), return_index=True)
+        self.league_bounds = dict(zip(names, zip(starts, list(starts[1:]) + [len(self.data)])))
+        self.venues = {venue: self._build_venue(venue) for venue in VENUES}
+        # Goal minutes parsed once into ragged arrays, aligned with the rows of self.data
+        self.goal_minutes = {
+            col: GoalMinutes.from_series(self.data[col]) for col in GOAL_MINUTES_COLUMNS if col in self.data.columns
+        }
+
+    def _team_keys(self, teams, leagues=None):
+        teams = pd.Series(teams, dtype=object).astype(str)
+        if self.by_league:
+            teams = pd.Series(leagues, dtype=object).astype(str).to_numpy() + "|" + teams.to_numpy()
+        return np.asarray(teams, dtype=object)
+
+    def _build_venue(self, venue):
+        data = self.data
+        goals_h = data["FT_Goals_H"].to_numpy(dtype=float)
+        goals_a = data["FT_Goals_A"].to_numpy(dtype=float)
+        days = self.days
+        leagues = data["League"].to_numpy() if self.by_league else None
+        rows = np.arange(len(data))
+
+        # Each match is seen from the home side, the away side or both
+        sides = []
+        if venue in ("All", "Home"):
+            sides.append((self._team_keys(data["Home"], leagues), goals_h, goals_a))
+        if venue in ("All", "Away"):
+            sides.append((self._team_keys(data["Away"], leagues), goals_a, goals_h))
+
+        teams = np.concatenate([side[0] for side in sides])
+        goals_for = np.concatenate([side[1] for side in sides])
+        goals_against = np.concatenate([side[2] for side in sides])
+        all_days = np.tile(days, len(sides))
+        all_rows = np.tile(rows, len(sides))
+
+        codes, names = pd.factorize(teams)
+        keys = codes.astype(np.int64) * (1 << 32) + (all_days + _DAY_OFFSET)
+        order = np.lexsort((all_rows, keys))
+        keys = keys[order]
+        codes = codes[order]
+        goals_for = goals_for[order]
+        goals_against = goals_against[order]
+
+        metrics = {
+            "Goals_For": goals_for,
+            "Goals_Against": goals_against,
+            "Over25": (goals_for + goals_against > 2).astype(float),
+            "BTTS": ((goals_for > 0) & (goals_against > 0)).astype(float),
+            "Win_Margin": goals_for - goals_against,
+        }
+
+        # First position of each team's slice, for every position
+        group_start = np.searchsorted(codes, codes, side="left")
+        rolling = {window: self._rolling_means(metrics, group_start, window) for window in self.windows}
+
+        return {
+            "keys": keys,
+            "rows": all_rows[order],
+            "team_codes": pd.Index(names),
+            "rolling": rolling,
+        }
+
+    @staticmethod
+    def _rolling_means(metrics, group_start, window):
+        """Mean of each metric over the last `window` games of the same team, up to each position."""
+        positions = np.arange(len(group_start))
+        start = np.maximum(positions - window + 1, group_start)
+        counts = positions + 1 - start
+        result = {"Games": counts}
+        for name, values in metrics.items():
+            cumsum = np.concatenate([[0.0], np.cumsum(np.nan_to_num(values))])
+            result[name] = (cumsum[positions + 1] - cumsum[start]) / counts
+        return result
+
+    def _positions(self, venue, teams, dates, leagues=None, inclusive=False):
+        """Returns (slice start, slice end) of each team's games before (or up to) each date."""
+        index = self.venues[venue]
+        codes = index["team_codes"].get_indexer(self._team_keys(teams, leagues)).astype(np.int64)
+        days = pd.to_datetime(pd.Series(dates)).to_numpy().astype("datetime64[D]").astype(np.int64)
+        days = days + 1 if inclusive else days
+        group_keys = codes * (1 << 32)
+        end = np.searchsorted(index["keys"], group_keys + days + _DAY_OFFSET, side="left")
+        start = np.searchsorted(index["keys"], group_keys, side="left")
+        # Unknown teams get an empty slice
+        end = np.where(codes < 0, 0, end)
+        start = np.where(codes < 0, 0, start)
+        return start, end
+
+    def league_games(self, league, before=None, inclusive=False):
+        """Games of `league` (date-sorted) before `before`, or up to it if `inclusive`, as a slice of the index."""
+        start, stop = self.league_bounds.get(str(league), (0, 0))
+        if before is not None:
+            day = pd.Timestamp(before).to_datetime64().astype("datetime64[D]").astype(np.int64)
+            stop = start + np.searchsorted(self.days[start:stop], day + 1 if inclusive else day, side="left")
+        return self.data.iloc[start:stop]
+
+    def last_games(self, team, n, before=None, venue="All", league=None, inclusive=False, newest_first=True):
+        """Last `n` games (all of them if `n` is None) of `team` (at `venue`) before `before` (or up to it if `inclusive`)."""
+        before = pd.Timestamp.max.normalize() - pd.Timedelta(days=1) if before is None else before
+        start, end = self._positions(venue, [team], [before], [league], inclusive=inclusive)
+        first = start[0] if n is None else max(start[0], end[0] - n)
+        rows = self.venues[venue]["rows"][first:end[0]]
+        games = self.data.iloc[rows]
+        return games.iloc[::-1] if newest_first else games
+
+    def team_rows(self, teams, n=None, before=None, venue="All", leagues=None, inclusive=False):
+        """
+        Last `n` games (all of them if `n` is None) of every team of `teams` at once, oldest first.
+        Returns (rows, owner): positions in `data` and, for each of them, the position in `teams` of its team.
+        """
+        before = pd.Timestamp.max.normalize() - pd.Timedelta(days=1) if before is None else before
+        start, end = self._positions(venue, teams, [before] * len(teams), leagues, inclusive=inclusive)
+        if n is not None:
+            start = np.maximum(start, end - n)
+        counts = end - start
+        owner = np.repeat(np.arange(len(teams)), counts)
+        # Position of each row inside its team's slice, so all slices are gathered with one take
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        return self.venues[venue]["rows"][np.repeat(start, counts) + offsets], owner
+
+    def rolling_features(self, teams, dates, window, venue="All", leagues=None, inclusive=False):
+        """
+        Rolling aggregates over the last `window` games of each team before each date.
+        Returns one row per (team, date) pair with the number of games used and the metric means.
+        """
+        if window not in self.windows:
+            raise ValueError(f"Window {window} is not materialised, choose one of {self.windows}")
+        start, end = self._positions(venue, teams, dates, leagues, inclusive=inclusive)
+        has_games = end > start
+        last = np.where(has_games, end - 1, 0)
+        rolling = self.venues[venue]["rolling"][window]
+        features = pd.DataFrame({
+            name: np.where(has_games, values[last] if len(values) else 0, np.nan)
+            for name, values in rolling.items()
+        })
+        features["Games"] = features["Games"].fillna(0).astype(int)
+        return features
+
+
+@st.cache_resource(max_entries=4, show_spinner=False)
+def _cached_team_index(version, by_league):
+    historical_data = load_historical_data(columns=TEAM_INDEX_COLUMNS)
+    if historical_data is None:
+        return None
+    return TeamIndex(historical_data, by_league=by_league)
+
+
+@st.cache_resource(max_entries=64, show_spinner=False)
+def _cached_league_index(version, leagues):
+    # Only the files of these leagues are read from the store
+    historical_data = load_historical_data(columns=TEAM_INDEX_COLUMNS, leagues=leagues)
+    if historical_data is None:
+        return None
+    return TeamIndex(historical_data, by_league=True)
+
+
+def get_team_index(by_league=False, leagues=None):
+    """
+    Returns the team index of the current historical data version, built once per data refresh.
+    With `leagues`, the index only covers those leagues (keyed by league) and is built from their slice of the store.
+    """
+    if leagues is not None:
+        return _cached_league_index(historical_store_version(), tuple(sorted(map(str, leagues))))
+    return _cached_team_index(historical_store_version(), by_league)
@@ -0,0 +1,77 @@
+import pandas as pd
+import pytest
+
+import data_store
+
+
+@pytest.fixture(autouse=True)
+def store_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(data_store, "STORE_DIR", str(tmp_path / "historical"))
+
+
+def games(dates):
+    return pd.DataFrame({
+        "Date": pd.to_datetime(dates),
+        "League": "LEAGUE",
+        "Season": "2024",
+        "Home": [f"Home {i}" for i in range(len(dates))],
+        "Away": [f"Away {i}" for i in range(len(dates))],
+        "FT_Goals_H": 1.0,
+        "FT_Goals_A": 0.0,
+        "FT_Odd_H": 1.80,
+    })
+
+
+def sync(df):
+    version = data_store.sync_historical_store(source=df)
+    stored = data_store.read_historical_store(columns=["Date", "Home", "FT_Goals_H"])
+    return version, stored
+
+
+def test_empty_first_sync():
+    assert data_store.sync_historical_store(source=games([])) is None
+    assert data_store._read_state()["last_date"] is None
+
+    # Nothing new again, and then the first games are written in full
+    assert data_store.sync_historical_store(source=games([])) is None
+    version, stored = sync(games(["2024-01-01", "2024-01-02"]))
+    assert version.startswith("2024-01-02@")
+    assert len(stored) == 2
+
+
+def test_sync_appends_only_new_dates():
+    version, _ = sync(games(["2024-01-01", "2024-01-02"]))
+    # Same games: nothing is written and the version is kept
+    assert sync(games(["2024-01-01", "2024-01-02"]))[0] == version
+    version, stored = sync(games(["2024-01-01", "2024-01-02", "2024-01-03"]))
+    assert version.startswith("2024-01-03@")
+    assert stored["Date"].dt.strftime("%Y-%m-%d").tolist() == ["2024-01-01", "2024-01-02", "2024-01-03"]
+
+
+def test_sync_rewrites_the_last_stored_day():
+    version, _ = sync(games(["2024-01-01", "2024-01-02"]))
+    # A late game and a corrected score on the last stored day
+    late = games(["2024-01-01", "2024-01-02", "2024-01-02"])
+    late.loc[1, "FT_Goals_H"] = 3.0
+    new_version, stored = sync(late)
+
+    assert new_version != version and new_version.startswith("2024-01-02@")
+    assert len(stored) == 3
+    assert sorted(stored.loc[stored["Date"] == "2024-01-02", "FT_Goals_H"]) == [1.0, 3.0]
+
+
+def test_sync_rebuilds_on_older_changes():
+    sync(games(["2024-01-01", "2024-01-02", "2024-01-03"]))
+    corrected = games(["2024-01-01", "2024-01-02", "2024-01-03", "2024-01-04"])
+    corrected.loc[0, "FT_Goals_H"] = 5.0
+    version, stored = sync(corrected)
+
+    assert version.startswith("2024-01-04@")
+    assert len(stored) == 4
+    assert stored.loc[stored["Home"] == "Home 0", "FT_Goals_H"].tolist() == [5.0]
+
+
+def test_version_includes_the_source_version():
+    df = data_store._normalise(games(["2024-01-01"]))
+    assert data_store._store_version(data_store._apply_changes(df, "etag-1")) == "2024-01-01@etag-1"
+    assert data_store._store_version(data_store._apply_changes(df, "etag-2")) == "2024-01-01@etag-2"
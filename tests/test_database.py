@@ -0,0 +1,86 @@
+import atexit
+import importlib
+import sys
+import threading
+import time
+
+import pytest
+import streamlit as st
+
+
+class FakeClient:
+    """Stand-in for pymongo's MongoClient: records every instance and answers ping unless the server is down."""
+
+    instances = []
+    down = False
+
+    def __init__(self, uri, **options):
+        # Slow constructor, so concurrent first calls overlap
+        time.sleep(0.05)
+        self.uri, self.options, self.closed = uri, options, False
+        self.admin = self
+        FakeClient.instances.append(self)
+
+    def command(self, name):
+        if FakeClient.down or self.closed:
+            raise ConnectionError("server selection timeout")
+        return {"ok": 1.0}
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def database(monkeypatch):
+    """The database module imported with a MONGO_URI secret and the fake client."""
+    monkeypatch.setattr(st, "secrets", {"connections": {"MONGO_URI": "mongodb://fluffy.test"}})
+    monkeypatch.setattr(FakeClient, "instances", [])
+    monkeypatch.setattr(FakeClient, "down", False)
+    sys.modules.pop("database", None)
+    module = importlib.import_module("database")
+    monkeypatch.setattr(module, "MongoClient", FakeClient)
+    yield module
+    module.close_client()
+    atexit.unregister(module.close_client)
+    sys.modules.pop("database", None)
+
+
+def test_get_client_is_shared_across_threads(database):
+    barrier = threading.Barrier(8)
+    clients = []
+
+    def worker():
+        barrier.wait()
+        clients.append(database.get_client())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(FakeClient.instances) == 1
+    assert all(client is FakeClient.instances[0] for client in clients)
+    assert database.get_client() is clients[0]
+    assert clients[0].uri == "mongodb://fluffy.test"
+    assert clients[0].options["maxPoolSize"] == database.MONGO_MAX_POOL_SIZE
+
+
+def test_ping_and_reconnect(database):
+    client = database.get_client()
+    assert database.ping()
+
+    FakeClient.down = True
+    assert not database.ping()
+    # A failed ping keeps the pooled client, pymongo reconnects it when the server is back
+    assert database.get_client() is client
+
+    FakeClient.down = False
+    assert database.ping()
+
+    # After close_client() the next call opens a new client
+    database.close_client()
+    assert client.closed
+    assert database.get_client() is not client
+    assert database.ping()
+    assert len(FakeClient.instances) == 2
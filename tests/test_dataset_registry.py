@@ -0,0 +1,43 @@
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import dataset_registry
+from dataset_registry import get_shared_frame
+
+
+@pytest.fixture(autouse=True)
+def registry(monkeypatch):
+    monkeypatch.setattr(dataset_registry, "_registry", dataset_registry.OrderedDict())
+
+
+def test_sessions_share_one_copy():
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return pd.DataFrame({"FT_Odd_H": np.linspace(1.1, 9.9, 1000), "FT_Goals_H": np.arange(1000) % 5})
+
+    views = [None] * 50
+
+    def session(i):
+        views[i] = get_shared_frame(("historical", None, None), "v1", loader).view(["FT_Odd_H"])
+
+    threads = [threading.Thread(target=session, args=(i,)) for i in range(50)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Loaded once, and every session's view wraps the same buffer
+    assert len(loads) == 1
+    base = views[0]["FT_Odd_H"].to_numpy()
+    assert all(np.shares_memory(view["FT_Odd_H"].to_numpy(), base) for view in views)
+
+    # Adding a column stays in the session, writing into the shared one fails
+    views[1]["Extra"] = 1.0
+    assert "Extra" not in views[2].columns
+    with pytest.raises(ValueError):
+        views[1]["FT_Odd_H"].to_numpy()[0] = 0.0
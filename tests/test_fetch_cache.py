@@ -0,0 +1,125 @@
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import dataset_registry
+import fetch_cache
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Serves the server's `files` ({path: (body, delay in seconds)}), 404 for anything else."""
+
+    def do_GET(self):
+        if self.path not in self.server.files:
+            self.send_error(404)
+            return
+        body, delay = self.server.files[self.path]
+        time.sleep(delay)
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub():
+    """Local HTTP server serving fixture files; tests fill `stub.files`."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    server.files = {}
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(fetch_cache, "CACHE_DIR", str(tmp_path / "http"))
+    monkeypatch.setattr(dataset_registry, "_registry", dataset_registry.OrderedDict())
+
+
+CSV = b"Home,Away,FT_Odd_H\nA,B,1.80\nC,D,2.10\n"
+
+
+def test_fresh_hit_does_not_rewrite_the_meta(stub, monkeypatch):
+    stub.files["/games.csv"] = (CSV, 0)
+    fetch_cache.fetch(stub.url + "/games.csv", ttl=60)
+
+    writes = []
+    monkeypatch.setattr(fetch_cache, "_write_meta", lambda *args: writes.append(args))
+    for _ in range(5):
+        assert fetch_cache.fetch(stub.url + "/games.csv", ttl=60) is not None
+    assert writes == []
+
+
+def test_evict_keeps_the_file_just_fetched(stub, monkeypatch):
+    stub.files["/old.csv"] = (CSV, 0)
+    stub.files["/big.csv"] = (CSV * 100, 0)
+    old = fetch_cache.fetch(stub.url + "/old.csv")
+    monkeypatch.setattr(fetch_cache, "MAX_CACHE_BYTES", 10)
+
+    # The new file alone exceeds the limit: the older one goes, the new one stays
+    big = fetch_cache.fetch(stub.url + "/big.csv")
+    assert os.path.exists(big["path"])
+    assert not os.path.exists(old["path"])
+
+
+def test_load_csv_refetches_an_evicted_body(stub, monkeypatch):
+    stub.files["/games.csv"] = (CSV, 0)
+    fetch = fetch_cache.fetch
+    calls = []
+
+    def fetch_then_evict(url, ttl):
+        entry = fetch(url, ttl=ttl)
+        calls.append(ttl)
+        # Another thread evicts the body before this one parses it
+        if len(calls) == 1:
+            os.remove(entry["path"])
+        return entry
+
+    monkeypatch.setattr(fetch_cache, "fetch", fetch_then_evict)
+    df = fetch_cache.load_csv(stub.url + "/games.csv")
+    assert df["Home"].tolist() == ["A", "C"]
+    assert calls == [fetch_cache.DAILY_TTL, 0]
+
+
+def test_load_concurrently_waits_for_the_slowest_source(stub):
+    delays = {"daily": 0.2, "leagues": 0.4, "elo": 0.6, "base": 0.8}
+    for name, delay in delays.items():
+        stub.files[f"/{name}.csv"] = (CSV, delay)
+    loaders = {name: (lambda name=name: fetch_cache.load_csv(f"{stub.url}/{name}.csv")) for name in delays}
+
+    started = time.monotonic()
+    results = fetch_cache.load_concurrently(loaders)
+    elapsed = time.monotonic() - started
+
+    assert all(results[name]["Home"].tolist() == ["A", "C"] for name in delays)
+    # About the slowest source, well below the sum of the four
+    assert max(delays.values()) <= elapsed < sum(delays.values())
+
+
+def test_load_concurrently_timeouts_and_missing_files(stub):
+    stub.files["/daily.csv"] = (CSV, 0)
+    stub.files["/slow.csv"] = (CSV, 1.5)
+    loaders = {
+        "daily": lambda: fetch_cache.load_csv(stub.url + "/daily.csv"),
+        "slow": lambda: fetch_cache.load_csv(stub.url + "/slow.csv"),
+        "missing": lambda: fetch_cache.load_csv(stub.url + "/missing.csv"),
+    }
+
+    started = time.monotonic()
+    results = fetch_cache.load_concurrently(loaders, timeouts={"slow": 0.3})
+    assert time.monotonic() - started < 1.5
+
+    assert results["daily"]["Home"].tolist() == ["A", "C"]
+    assert isinstance(results["slow"], TimeoutError)
+    assert results["missing"] is None
@@ -0,0 +1,33 @@
+import numpy as np
+import pandas as pd
+from backtest_engine import run_backtest
+from strategy_sweep import sweep_strategy
+
+
+def boundary_games(n=200):
+    """Games whose home odds sit exactly on the sweep thresholds, stored as float32 like the historical base."""
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "Date": pd.date_range("2024-01-01", periods=n, freq="D"),
+        "League": "LEAGUE",
+        "HT_Goals_H": rng.integers(0, 3, n).astype(float),
+        "HT_Goals_A": rng.integers(0, 3, n).astype(float),
+        "FT_Goals_H": rng.integers(0, 4, n).astype(float),
+        "FT_Goals_A": rng.integers(0, 4, n).astype(float),
+        "FT_Odd_H": np.where(np.arange(n) % 2 == 0, 1.30, 2.00).astype(np.float32),
+    })
+
+
+def test_sweep_matches_run_backtest_at_boundary_odds():
+    data = boundary_games()
+    grid = {"FT_Odd_H": {"low": [1.30], "high": [2.00]}}
+    ranking = sweep_strategy(data, "Back Home", grid, min_bets=1, max_workers=1)
+
+    strategy = {"market": "Back Home", "rules": [{"ranges": [("FT_Odd_H", 1.30, 2.00, "both")]}]}
+    summary, _, _ = run_backtest(data, {"single": strategy})
+
+    assert summary.loc[0, "Bets"] == len(data)
+    row = ranking[(ranking["FT_Odd_H min"] == 1.30) & (ranking["FT_Odd_H max"] == 2.00)]
+    assert len(row) == 1
+    assert row["Bets"].iloc[0] == summary.loc[0, "Bets"]
+    assert row["Profit"].iloc[0] == summary.loc[0, "Profit"]